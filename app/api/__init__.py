@@ -1,22 +1,40 @@
 """
 API routes aggregation.
+
+``api_router`` is built on first access, so importing a single API module
+(e.g. the health routes) does not import every route module and service.
 """
 
 from fastapi import APIRouter
 
-from app.api.routes import health, quality, aircraft, airline, registration, review, history
 
+def build_api_router() -> APIRouter:
+    """Build the /api/v1 router from all route modules."""
+    from app.api.routes import health, quality, aircraft, airline, registration, review, history, jobs, debug, admin
+
+    api_router = APIRouter(prefix="/api/v1")
+
+    # Include all route modules
+    api_router.include_router(health.router)
+    api_router.include_router(quality.router)
+    api_router.include_router(aircraft.router)
+    api_router.include_router(airline.router)
+    api_router.include_router(registration.router)
+    api_router.include_router(review.router)
+    api_router.include_router(history.router, prefix="/history", tags=["history"])
+    api_router.include_router(jobs.router)
+    api_router.include_router(debug.router)
+    api_router.include_router(admin.router)
+    return api_router
 
-api_router = APIRouter(prefix="/api/v1")
 
-# Include all route modules
-api_router.include_router(health.router)
-api_router.include_router(quality.router)
-api_router.include_router(aircraft.router)
-api_router.include_router(airline.router)
-api_router.include_router(registration.router)
-api_router.include_router(review.router)
-api_router.include_router(history.router, prefix="/history", tags=["history"])
+def __getattr__(name: str) -> APIRouter:
+    """Build api_router on first access."""
+    if name == "api_router":
+        api_router = build_api_router()
+        globals()["api_router"] = api_router
+        return api_router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["api_router"]
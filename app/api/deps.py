@@ -2,14 +2,23 @@
 Dependency injection for API routes.
 """
 
-from typing import AsyncGenerator
+import hmac
+from typing import Annotated, Any, AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError as PydanticValidationError
 
 from app.core.config import get_settings
 from app.core.logging import logger
 from app.core.redis_client import get_request_stats as get_redis_stats
 from app.core.redis_client import increment_request_count as redis_increment
+from app.core.result_cache import get_result_cache
+from app.inference.registry import get_model_registry, process_memory
+from app.schemas.common import BatchImageInput, ImageInput
+from app.services.base import ImageSource
+
+BINARY_CONTENT_TYPES = ("application/octet-stream", "image/")
 
 
 async def get_request_stats() -> dict:
@@ -18,18 +27,158 @@ async def get_request_stats() -> dict:
 
     Uses Redis for shared statistics across multiple workers.
     Falls back to local stats if Redis is unavailable.
+    Result cache counters, loaded models and process memory are reported
+    for the current worker.
     """
-    return await get_redis_stats()
+    stats = await get_redis_stats()
+    stats["result_cache"] = get_result_cache().stats()
+    stats["models"] = get_model_registry().memory_report()
+    stats["process"] = process_memory()
+    return stats
+
+
+def require_admin_token(x_admin_token: Annotated[str | None, Header()] = None) -> None:
+    """
+    Reject requests without the configured admin token.
+
+    Guards the admin and debug endpoints; all requests are rejected with
+    404 while no ADMIN_TOKEN is configured.
+    """
+    admin_token = get_settings().admin_token
+    if not admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Admin endpoints are disabled"
+        )
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin token"
+        )
 
 
 def increment_request_count(success: bool = True) -> None:
     """
     Increment request counters.
 
-    Uses Redis for shared statistics across multiple workers.
-    Falls back to local stats if Redis is unavailable.
+    Only updates in-process counters, which are flushed to Redis in bulk.
 
     Args:
         success: Whether the request was successful
     """
     redis_increment(success=success)
+
+
+async def get_image_input(request: Request) -> ImageSource:
+    """
+    Extract a single image from the request body.
+
+    Accepts a JSON ``ImageInput`` body, a ``multipart/form-data`` body with an
+    ``image`` file (or base64/URL text) field, or a raw
+    ``application/octet-stream`` / ``image/*`` body. Uploaded bytes are
+    passed through without re-encoding.
+
+    Raises:
+        RequestValidationError: If a JSON body is invalid
+        HTTPException: If a multipart body has no image field
+    """
+    content_type = request.headers.get("content-type", "").lower()
+
+    if content_type.startswith(BINARY_CONTENT_TYPES):
+        return await _read_raw_body(request)
+
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        field = form.get("image")
+        if field is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Multipart body must contain an 'image' field"
+            )
+        return await _read_form_field(field)
+
+    return _parse_json(ImageInput, await request.body()).image
+
+
+async def get_batch_image_input(request: Request) -> list[ImageSource]:
+    """
+    Extract a list of images from the request body.
+
+    Accepts a JSON ``BatchImageInput`` body, a ``multipart/form-data`` body
+    with one or more ``images`` fields (files or base64/URL text), or a raw
+    ``application/octet-stream`` / ``image/*`` body holding a single image.
+
+    Raises:
+        RequestValidationError: If a JSON body is invalid
+        HTTPException: If a multipart body has no images or too many
+    """
+    content_type = request.headers.get("content-type", "").lower()
+
+    if content_type.startswith(BINARY_CONTENT_TYPES):
+        return [await _read_raw_body(request)]
+
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        fields = form.getlist("images")
+        max_images = get_settings().max_batch_size
+        if not fields or len(fields) > max_images:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Multipart body must contain between 1 and {max_images} 'images' fields"
+            )
+        return [await _read_form_field(field) for field in fields]
+
+    return _parse_json(BatchImageInput, await request.body()).images
+
+
+async def _read_raw_body(request: Request) -> bytes:
+    """Read a raw binary image body."""
+    body = await request.body()
+    if not body:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Request body is empty"
+        )
+    return body
+
+
+async def _read_form_field(field: Any) -> ImageSource:
+    """Read a multipart field: uploaded files as bytes, text fields as-is."""
+    if isinstance(field, str):
+        return field
+    return await field.read()
+
+
+def _parse_json(model: type, body: bytes) -> Any:
+    """Validate a JSON body, reporting errors like FastAPI's body validation."""
+    try:
+        return model.model_validate_json(body)
+    except PydanticValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False), body=body)
+
+
+def _image_upload_openapi(json_model: type, field_name: str, multiple: bool) -> dict:
+    """Build the OpenAPI request body for routes using the image input dependencies."""
+    file_schema = {"type": "string", "format": "binary"}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": json_model.model_json_schema()},
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            field_name: {"type": "array", "items": file_schema} if multiple else file_schema
+                        },
+                        "required": [field_name],
+                    }
+                },
+                "application/octet-stream": {"schema": file_schema},
+            },
+        }
+    }
+
+
+IMAGE_UPLOAD_OPENAPI = _image_upload_openapi(ImageInput, "image", multiple=False)
+BATCH_IMAGE_UPLOAD_OPENAPI = _image_upload_openapi(BatchImageInput, "images", multiple=True)
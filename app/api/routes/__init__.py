@@ -1,7 +1,18 @@
 """
 API route modules.
+
+Route modules are imported on first access, so importing one of them
+(e.g. health) does not import the others and their services.
 """
 
-from app.api.routes import health, quality, aircraft, airline, registration, review, history
+import importlib
+from types import ModuleType
+
+__all__ = ["health", "quality", "aircraft", "airline", "registration", "review", "history", "jobs", "debug", "admin"]
+
 
-__all__ = ["health", "quality", "aircraft", "airline", "registration", "review", "history"]
+def __getattr__(name: str) -> ModuleType:
+    """Import a route module on first access."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
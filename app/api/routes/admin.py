@@ -0,0 +1,70 @@
+"""
+Administrative endpoints.
+
+Disabled unless ADMIN_TOKEN is set; requests must send the token in the
+X-Admin-Token header.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.deps import require_admin_token
+from app.inference.factory import InferenceFactory, InferenceFactoryError
+from app.inference.swap_sync import get_swap_sync
+from app.schemas.admin import ModelSwapInput, ModelSwapResponse
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin_token)])
+
+
+def _resolve_weights_path(weights_path: str) -> Path:
+    """Resolve a weights path, relative to the model directory, refusing paths outside it."""
+    model_dir = InferenceFactory.get_model_dir().resolve()
+    path = (model_dir / weights_path).resolve()
+    if not path.is_relative_to(model_dir):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Weights must be inside the model directory"
+        )
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Weights not found: {weights_path}"
+        )
+    return path
+
+
+@router.post("/models/{name}/swap", response_model=ModelSwapResponse)
+async def swap_model(
+    name: Literal["aircraft", "airline"],
+    body: ModelSwapInput | None = None
+) -> ModelSwapResponse:
+    """
+    Swap a classifier for new weights without restarting.
+
+    The new model is loaded and warmed up in the background while the
+    current one keeps serving, then replaces it atomically; requests
+    already running finish on the old model. Without weights_path the
+    configured best.pt is reloaded, which picks up a file replaced on disk.
+
+    Once this worker has swapped, the swap is broadcast through Redis to
+    every other worker; the response reports each worker's outcome, with
+    workers that did not report in time listed as pending.
+    """
+    weights_path = None
+    if body is not None and body.weights_path:
+        weights_path = _resolve_weights_path(body.weights_path)
+
+    try:
+        swap = await asyncio.to_thread(InferenceFactory.swap_classifier, name, weights_path)
+    except InferenceFactoryError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Swap failed, the current model keeps serving: {e}"
+        )
+
+    workers, complete = await get_swap_sync().broadcast(name, weights_path, swap)
+    return ModelSwapResponse(**swap, workers=workers, complete=complete)
@@ -5,25 +5,38 @@ Aircraft type classification API endpoints.
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
-from app.api.deps import increment_request_count
-from app.core.exceptions import ImageLoadError, InferenceError
-from app.schemas.common import ImageInput, BatchImageInput, Meta
+from app.api.deps import (
+    BATCH_IMAGE_UPLOAD_OPENAPI,
+    IMAGE_UPLOAD_OPENAPI,
+    get_batch_image_input,
+    get_image_input,
+    increment_request_count,
+)
+from app.api.streaming import STREAMING_BATCH_RESPONSES, get_stream_format, stream_batch
+from app.core.exceptions import ImageLoadError, InferenceError, RateLimitError
+from app.schemas.common import Meta
 from app.schemas.aircraft import (
     AircraftResponse,
     BatchAircraftResponse,
     BatchAircraftItem,
 )
 from app.services import AircraftService
+from app.services.base import ImageSource
 
 router = APIRouter(prefix="/aircraft", tags=["Aircraft"])
 _service = AircraftService()
 
 
-@router.post("", response_model=AircraftResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "",
+    response_model=AircraftResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=IMAGE_UPLOAD_OPENAPI
+)
 async def classify_aircraft(
-    request: ImageInput,
+    image: Annotated[ImageSource, Depends(get_image_input)],
     top_k: Annotated[int | None, Query(gt=0, le=20, description="Number of top predictions")] = 5
 ) -> AircraftResponse:
     """
@@ -33,13 +46,16 @@ async def classify_aircraft(
     Optionally returns top-k predictions.
     """
     try:
-        result, timing_ms = _service.classify(request.image, top_k=top_k)
+        result, timing_ms = await _service.classify_async(image, top_k=top_k)
         increment_request_count(success=True)
 
         return AircraftResponse(
             **result.model_dump(by_alias=True),
             meta=Meta(processing_time_ms=timing_ms)
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except ImageLoadError as e:
         increment_request_count(success=False)
         raise HTTPException(
@@ -54,18 +70,37 @@ async def classify_aircraft(
         )
 
 
-@router.post("/batch", response_model=BatchAircraftResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "/batch",
+    response_model=BatchAircraftResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=BATCH_IMAGE_UPLOAD_OPENAPI,
+    responses=STREAMING_BATCH_RESPONSES
+)
 async def classify_aircraft_batch(
-    request: BatchImageInput,
+    request: Request,
+    images: Annotated[list[ImageSource], Depends(get_batch_image_input)],
     top_k: Annotated[int | None, Query(gt=0, le=20, description="Number of top predictions")] = None
 ) -> BatchAircraftResponse:
     """
     Batch classify aircraft types.
 
     Classifies up to 50 images in a single request.
+
+    Send Accept: application/x-ndjson or text/event-stream to receive each
+    item as soon as it completes, followed by a summary record.
     """
+    stream_format = get_stream_format(request)
+    if stream_format is not None:
+        return stream_batch(
+            _service.classify_batch_stream(images, top_k=top_k),
+            BatchAircraftItem,
+            len(images),
+            stream_format
+        )
+
     try:
-        service_results = await _service.classify_batch(request.images, top_k=top_k)
+        service_results = await _service.classify_batch(images, top_k=top_k)
 
         results = [BatchAircraftItem(**r) for r in service_results]
 
@@ -80,6 +115,9 @@ async def classify_aircraft_batch(
             failed=failed,
             results=results
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except Exception as e:
         increment_request_count(success=False)
         raise HTTPException(
@@ -0,0 +1,54 @@
+"""
+Debug endpoints for inspecting request traces.
+
+Traces contain request details, so like the admin endpoints these are
+disabled unless ADMIN_TOKEN is set and require the X-Admin-Token header.
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.deps import require_admin_token
+from app.core.tracing import RingBufferExporter, build_span_tree, get_exporter
+
+router = APIRouter(prefix="/debug", tags=["Debug"], dependencies=[Depends(require_admin_token)])
+
+
+def _get_buffer() -> RingBufferExporter:
+    """Get the in-memory trace buffer, or 404 if traces are not kept in memory."""
+    exporter = get_exporter()
+    if not isinstance(exporter, RingBufferExporter):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="In-memory tracing is not enabled"
+        )
+    return exporter
+
+
+@router.get("/traces")
+async def list_traces(
+    limit: int = Query(50, ge=1, le=1000)
+) -> list[dict[str, Any]]:
+    """
+    List the most recent traced requests.
+
+    Returns request IDs with their total duration, newest first.
+    """
+    return _get_buffer().recent_requests(limit)
+
+
+@router.get("/traces/{request_id}")
+async def get_trace(request_id: str) -> dict[str, Any]:
+    """
+    Get the span tree of a request.
+
+    Spans are nested under their parents with durations in milliseconds.
+    """
+    spans = _get_buffer().get_trace(request_id)
+    if not spans:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No trace for request {request_id}"
+        )
+    return {"request_id": request_id, "spans": build_span_tree(spans)}
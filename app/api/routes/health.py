@@ -2,21 +2,44 @@
 Health check and statistics endpoints.
 """
 
+import os
+import sys
 import time
-import torch
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status
 
 from app.api.deps import get_request_stats
 from app.core.config import get_settings
+from app.core.metrics import CONTENT_TYPE, get_metrics_registry
 from app.inference import InferenceFactory
-from app.schemas.common import HealthResponse, StatsResponse
+from app.inference.warmup import get_warmup_seconds
+from app.schemas.common import HealthResponse, ReadinessResponse, StatsResponse
 
 router = APIRouter(tags=["Health"])
 
 _start_time = time.time()
 
 
+@lru_cache(maxsize=1)
+def gpu_available() -> bool:
+    """
+    Probe GPU availability once per process.
+
+    Uses torch when the models have already imported it; otherwise checks
+    for NVIDIA driver devices, so a liveness probe never imports torch.
+    """
+    if get_settings().device == "cpu":
+        return False
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        return bool(torch.cuda.is_available())
+    try:
+        return bool(os.listdir("/proc/driver/nvidia/gpus"))
+    except OSError:
+        return False
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """
@@ -26,9 +49,6 @@ async def health_check() -> HealthResponse:
     """
     settings = get_settings()
 
-    # Check GPU availability
-    gpu_available = torch.cuda.is_available()
-
     # Check if inference models are loaded
     models_loaded = InferenceFactory.is_available()
 
@@ -36,11 +56,46 @@ async def health_check() -> HealthResponse:
         status="healthy",
         version=settings.version,
         models_loaded=models_loaded,
-        gpu_available=gpu_available,
+        gpu_available=gpu_available(),
         uptime_seconds=time.time() - _start_time
     )
 
 
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}}
+)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """
+    Readiness check endpoint.
+
+    Unlike /health, which only reports that the process is up, this
+    returns 503 until the required models (ready_required_models) are
+    loaded and warmed up, so load balancers only route traffic to warm
+    workers. Other models do not affect readiness. Models that failed to
+    load are listed in failed; a failed required model keeps the worker
+    unready until a later use loads it, which also warms it up. Without
+    model preloading, models load on first use and the worker is always
+    ready.
+    """
+    settings = get_settings()
+    models = InferenceFactory.get_model_states()
+    required = [name for name in settings.ready_required_models if name in models]
+    ready = not settings.preload_models or all(models[name] == "ready" for name in required)
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return ReadinessResponse(
+        ready=ready,
+        models=models,
+        required=required,
+        failed=[name for name, state in models.items() if state == "failed"],
+        load_seconds=InferenceFactory.get_load_seconds(),
+        warmup_seconds=get_warmup_seconds()
+    )
+
+
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(
     stats: dict = Depends(get_request_stats)
@@ -51,3 +106,14 @@ async def get_stats(
     Returns total requests, success/failure counts, and throughput metrics.
     """
     return StatsResponse(**stats)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """
+    Get latency histograms in the Prometheus text format.
+
+    Covers request latency per route and internal stage latency labelled
+    by stage, model and batch size, for this worker process.
+    """
+    return Response(content=get_metrics_registry().render(), media_type=CONTENT_TYPE)
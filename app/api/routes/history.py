@@ -38,13 +38,14 @@ async def push_historical_records(records: List[dict]) -> dict:
             - total: Total number of records
             - added: Number of successfully added records
             - failed: Number of failed records
+            - results: Per-record id, success and error
 
     Raises:
         HTTPException: If vector database is not available or push fails.
     """
     try:
         history_service = get_history_service()
-        result = history_service.push_records(records)
+        result = await history_service.push_records_async(records)
         return result
 
     except Exception as e:
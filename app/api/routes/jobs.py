@@ -0,0 +1,118 @@
+"""
+Asynchronous batch job API endpoints.
+"""
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.core.config import get_settings
+from app.core.job_queue import get_job_queue
+from app.schemas.job import JobReviewInput, JobReviewResultsPage, JobStatus
+from app.services.job_service import submit_review_job
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _job_status(job: dict[str, Any]) -> JobStatus:
+    """Build the status response of a job record."""
+    return JobStatus(
+        job_id=job["job_id"],
+        kind=job["kind"],
+        status=job["status"],
+        error=job.get("error") or None,
+        total=job["total"],
+        processed=job["processed"],
+        successful=job["successful"],
+        failed=job["failed"],
+        progress=job["processed"] / job["total"] if job["total"] else 1.0,
+        created_at=job["created_at"],
+        updated_at=job["updated_at"]
+    )
+
+
+async def _get_job_or_404(job_id: str) -> dict[str, Any]:
+    """Get a job record, or 404 if unknown or expired."""
+    job = await get_job_queue().get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    return job
+
+
+@router.post(
+    "/review",
+    response_model=JobStatus,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_review(
+    body: JobReviewInput,
+    include_quality: Annotated[bool, Query(description="Include quality assessment")] = True,
+    include_aircraft: Annotated[bool, Query(description="Include aircraft classification")] = True,
+    include_airline: Annotated[bool, Query(description="Include airline classification")] = True,
+    include_registration: Annotated[bool, Query(description="Include registration OCR")] = True
+) -> JobStatus:
+    """
+    Submit a batch review job.
+
+    Accepts up to job_max_images images, which are reviewed in chunks by
+    background workers. Poll the returned job ID for progress and page
+    through results as they finish.
+    """
+    settings = get_settings()
+    if not settings.jobs_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Batch jobs are disabled"
+        )
+    if len(body.images) > settings.job_max_images:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"A job accepts at most {settings.job_max_images} images"
+        )
+
+    job = await submit_review_job(
+        body.images,
+        {
+            "include_quality": include_quality,
+            "include_aircraft": include_aircraft,
+            "include_airline": include_airline,
+            "include_registration": include_registration,
+        }
+    )
+    return _job_status(job)
+
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str) -> JobStatus:
+    """
+    Get the progress of a job.
+    """
+    return _job_status(await _get_job_or_404(job_id))
+
+
+@router.get("/{job_id}/results", response_model=JobReviewResultsPage)
+async def get_job_results(
+    job_id: str,
+    offset: Annotated[int, Query(ge=0, description="Index of the first image")] = 0,
+    limit: Annotated[int, Query(ge=1, le=500, description="Number of images per page")] = 50
+) -> JobReviewResultsPage:
+    """
+    Page through a job's results by image index.
+
+    Results of images still being processed are omitted from the page.
+    """
+    job = await _get_job_or_404(job_id)
+    results = await get_job_queue().get_results(job_id, offset, limit)
+
+    return JobReviewResultsPage(
+        job_id=job_id,
+        status=job["status"],
+        offset=offset,
+        limit=limit,
+        total=job["total"],
+        next_offset=offset + limit if offset + limit < job["total"] else None,
+        results=results
+    )
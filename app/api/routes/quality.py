@@ -2,25 +2,47 @@
 Quality assessment API endpoints.
 """
 
-from datetime import datetime
+import time
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.deps import increment_request_count
-from app.schemas.common import ImageInput, BatchImageInput, Meta
+from app.api.deps import (
+    BATCH_IMAGE_UPLOAD_OPENAPI,
+    IMAGE_UPLOAD_OPENAPI,
+    get_batch_image_input,
+    get_image_input,
+    increment_request_count,
+)
+from app.api.streaming import STREAMING_BATCH_RESPONSES, get_stream_format, stream_batch
+from app.core.exceptions import RateLimitError
+from app.schemas.common import Meta
 from app.schemas.quality import (
     QualityResponse,
     BatchQualityResponse,
     BatchQualityItem,
 )
 from app.services import QualityService
+from app.services.base import ImageSource
 
 router = APIRouter(prefix="/quality", tags=["Quality"])
 _service = QualityService()
 
 
-@router.post("", response_model=QualityResponse, status_code=status.HTTP_200_OK)
-async def assess_quality(request: ImageInput) -> QualityResponse:
+def _throughput(count: int, elapsed: float) -> dict[str, float]:
+    """Batch throughput summary field."""
+    return {"images_per_second": count / elapsed if elapsed > 0 else 0.0}
+
+
+@router.post(
+    "",
+    response_model=QualityResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=IMAGE_UPLOAD_OPENAPI
+)
+async def assess_quality(
+    image: Annotated[ImageSource, Depends(get_image_input)]
+) -> QualityResponse:
     """
     Assess image quality.
 
@@ -28,13 +50,16 @@ async def assess_quality(request: ImageInput) -> QualityResponse:
     Returns an overall score and detailed metrics.
     """
     try:
-        result, timing_ms = _service.assess(request.image)
+        result, timing_ms = await _service.assess_async(image)
         increment_request_count(success=True)
 
         return QualityResponse(
             **result.model_dump(by_alias=True),
             meta=Meta(processing_time_ms=timing_ms)
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except Exception as e:
         increment_request_count(success=False)
         raise HTTPException(
@@ -43,16 +68,39 @@ async def assess_quality(request: ImageInput) -> QualityResponse:
         )
 
 
-@router.post("/batch", response_model=BatchQualityResponse, status_code=status.HTTP_200_OK)
-async def assess_quality_batch(request: BatchImageInput) -> BatchQualityResponse:
+@router.post(
+    "/batch",
+    response_model=BatchQualityResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=BATCH_IMAGE_UPLOAD_OPENAPI,
+    responses=STREAMING_BATCH_RESPONSES
+)
+async def assess_quality_batch(
+    request: Request,
+    images: Annotated[list[ImageSource], Depends(get_batch_image_input)]
+) -> BatchQualityResponse:
     """
     Batch assess image quality.
 
     Evaluates quality for up to 50 images in a single request.
+
+    Send Accept: application/x-ndjson or text/event-stream to receive each
+    item as soon as it completes, followed by a summary record.
     """
+    stream_format = get_stream_format(request)
+    if stream_format is not None:
+        return stream_batch(
+            _service.assess_batch_stream(images),
+            BatchQualityItem,
+            len(images),
+            stream_format,
+            summary_extra=_throughput
+        )
+
     try:
-        start_time = datetime.utcnow()
-        service_results = await _service.assess_batch(request.images)
+        start_time = time.perf_counter()
+        service_results = await _service.assess_batch(images)
+        elapsed = time.perf_counter() - start_time
 
         results = [
             BatchQualityItem(**r)
@@ -68,8 +116,12 @@ async def assess_quality_batch(request: BatchImageInput) -> BatchQualityResponse
             total=len(service_results),
             successful=successful,
             failed=failed,
+            images_per_second=len(service_results) / elapsed if elapsed > 0 else 0.0,
             results=results
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except Exception as e:
         increment_request_count(success=False)
         raise HTTPException(
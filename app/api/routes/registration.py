@@ -2,23 +2,41 @@
 Registration number OCR API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
 
-from app.api.deps import increment_request_count
-from app.schemas.common import ImageInput, BatchImageInput, Meta
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.api.deps import (
+    BATCH_IMAGE_UPLOAD_OPENAPI,
+    IMAGE_UPLOAD_OPENAPI,
+    get_batch_image_input,
+    get_image_input,
+    increment_request_count,
+)
+from app.api.streaming import STREAMING_BATCH_RESPONSES, get_stream_format, stream_batch
+from app.core.exceptions import RateLimitError
+from app.schemas.common import Meta
 from app.schemas.registration import (
     RegistrationResponse,
     BatchRegistrationResponse,
     BatchRegistrationItem,
 )
 from app.services import RegistrationService
+from app.services.base import ImageSource
 
 router = APIRouter(prefix="/registration", tags=["Registration"])
 _service = RegistrationService()
 
 
-@router.post("", response_model=RegistrationResponse, status_code=status.HTTP_200_OK)
-async def recognize_registration(request: ImageInput) -> RegistrationResponse:
+@router.post(
+    "",
+    response_model=RegistrationResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=IMAGE_UPLOAD_OPENAPI
+)
+async def recognize_registration(
+    image: Annotated[ImageSource, Depends(get_image_input)]
+) -> RegistrationResponse:
     """
     Recognize aircraft registration number.
 
@@ -26,13 +44,16 @@ async def recognize_registration(request: ImageInput) -> RegistrationResponse:
     Returns the recognized registration number with confidence and bounding boxes.
     """
     try:
-        result, timing_ms = _service.recognize(request.image)
+        result, timing_ms = await _service.recognize_async(image)
         increment_request_count(success=True)
 
         return RegistrationResponse(
             **result.model_dump(by_alias=True),
             meta=Meta(processing_time_ms=timing_ms)
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except Exception as e:
         increment_request_count(success=False)
         raise HTTPException(
@@ -41,15 +62,36 @@ async def recognize_registration(request: ImageInput) -> RegistrationResponse:
         )
 
 
-@router.post("/batch", response_model=BatchRegistrationResponse, status_code=status.HTTP_200_OK)
-async def recognize_registration_batch(request: BatchImageInput) -> BatchRegistrationResponse:
+@router.post(
+    "/batch",
+    response_model=BatchRegistrationResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=BATCH_IMAGE_UPLOAD_OPENAPI,
+    responses=STREAMING_BATCH_RESPONSES
+)
+async def recognize_registration_batch(
+    request: Request,
+    images: Annotated[list[ImageSource], Depends(get_batch_image_input)]
+) -> BatchRegistrationResponse:
     """
     Batch recognize registration numbers.
 
     Recognizes registration numbers from up to 50 images in a single request.
+
+    Send Accept: application/x-ndjson or text/event-stream to receive each
+    item as soon as it completes, followed by a summary record.
     """
+    stream_format = get_stream_format(request)
+    if stream_format is not None:
+        return stream_batch(
+            _service.recognize_batch_stream(images),
+            BatchRegistrationItem,
+            len(images),
+            stream_format
+        )
+
     try:
-        service_results = await _service.recognize_batch(request.images)
+        service_results = await _service.recognize_batch(images)
 
         results = [BatchRegistrationItem(**r) for r in service_results]
 
@@ -64,6 +106,9 @@ async def recognize_registration_batch(request: BatchImageInput) -> BatchRegistr
             failed=failed,
             results=results
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except Exception as e:
         increment_request_count(success=False)
         raise HTTPException(
@@ -4,24 +4,38 @@ Aggregated review API endpoints.
 
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
-from app.api.deps import increment_request_count
-from app.schemas.common import ImageInput, BatchImageInput, Meta
+from app.api.deps import (
+    BATCH_IMAGE_UPLOAD_OPENAPI,
+    IMAGE_UPLOAD_OPENAPI,
+    get_batch_image_input,
+    get_image_input,
+    increment_request_count,
+)
+from app.api.streaming import STREAMING_BATCH_RESPONSES, get_stream_format, stream_batch
+from app.core.exceptions import RateLimitError
 from app.schemas.review import (
+    ReviewMeta,
     ReviewResponse,
     BatchReviewResponse,
     BatchReviewItem,
 )
 from app.services import ReviewService
+from app.services.base import ImageSource
 
 router = APIRouter(prefix="/review", tags=["Review"])
 _service = ReviewService()
 
 
-@router.post("", response_model=ReviewResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "",
+    response_model=ReviewResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=IMAGE_UPLOAD_OPENAPI
+)
 async def review_image(
-    request: ImageInput,
+    image: Annotated[ImageSource, Depends(get_image_input)],
     include_quality: Annotated[bool, Query(description="Include quality assessment")] = True,
     include_aircraft: Annotated[bool, Query(description="Include aircraft classification")] = True,
     include_airline: Annotated[bool, Query(description="Include airline classification")] = True,
@@ -34,8 +48,8 @@ async def review_image(
     Each component can be toggled via query parameters.
     """
     try:
-        result, timing_ms = _service.review(
-            request.image,
+        result, timing_ms, component_timings = await _service.review_async(
+            image,
             include_quality=include_quality,
             include_aircraft=include_aircraft,
             include_airline=include_airline,
@@ -45,8 +59,14 @@ async def review_image(
 
         return ReviewResponse(
             **result.model_dump(by_alias=True),
-            meta=Meta(processing_time_ms=timing_ms)
+            meta=ReviewMeta(
+                processing_time_ms=timing_ms,
+                component_times_ms=component_timings
+            )
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except Exception as e:
         increment_request_count(success=False)
         raise HTTPException(
@@ -55,9 +75,16 @@ async def review_image(
         )
 
 
-@router.post("/batch", response_model=BatchReviewResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "/batch",
+    response_model=BatchReviewResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=BATCH_IMAGE_UPLOAD_OPENAPI,
+    responses=STREAMING_BATCH_RESPONSES
+)
 async def review_batch(
-    request: BatchImageInput,
+    request: Request,
+    images: Annotated[list[ImageSource], Depends(get_batch_image_input)],
     include_quality: Annotated[bool, Query(description="Include quality assessment")] = True,
     include_aircraft: Annotated[bool, Query(description="Include aircraft classification")] = True,
     include_airline: Annotated[bool, Query(description="Include airline classification")] = True,
@@ -68,10 +95,28 @@ async def review_batch(
 
     Performs complete review on up to 50 images in a single request.
     Each component can be toggled via query parameters.
+
+    Send Accept: application/x-ndjson or text/event-stream to receive each
+    item as soon as it completes, followed by a summary record.
     """
+    stream_format = get_stream_format(request)
+    if stream_format is not None:
+        return stream_batch(
+            _service.review_batch_stream(
+                images,
+                include_quality=include_quality,
+                include_aircraft=include_aircraft,
+                include_airline=include_airline,
+                include_registration=include_registration
+            ),
+            BatchReviewItem,
+            len(images),
+            stream_format
+        )
+
     try:
         service_results = await _service.review_batch(
-            request.images,
+            images,
             include_quality=include_quality,
             include_aircraft=include_aircraft,
             include_airline=include_airline,
@@ -91,6 +136,9 @@ async def review_batch(
             failed=failed,
             results=results
         )
+    except RateLimitError:
+        increment_request_count(success=False)
+        raise
     except Exception as e:
         increment_request_count(success=False)
         raise HTTPException(
@@ -0,0 +1,113 @@
+"""
+Streaming responses for batch endpoints.
+
+Batch routes stream their items when the client asks for
+``application/x-ndjson`` or ``text/event-stream`` in the Accept header:
+each item is written as soon as its image is done (in completion order,
+identified by ``index``), followed by a summary record.
+
+NDJSON: one item object per line, then ``{"summary": {...}}``.
+SSE: ``event: item`` messages, then one ``event: summary`` message.
+A failure mid-stream ends the stream with an error record instead of the
+summary.
+"""
+
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.api.deps import increment_request_count
+from app.core.logging import logger
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# OpenAPI description of the streamed media types, for batch routes
+STREAMING_BATCH_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "content": {
+            NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}},
+            SSE_MEDIA_TYPE: {"schema": {"type": "string"}},
+        },
+        "description": (
+            "Send Accept: application/x-ndjson or text/event-stream to receive "
+            "each item as it completes, followed by a summary record"
+        ),
+    }
+}
+
+
+def get_stream_format(request: Request) -> Optional[str]:
+    """
+    Get the streaming media type requested in the Accept header.
+
+    Returns:
+        NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE, or None for a regular JSON response
+    """
+    accept = request.headers.get("accept", "").lower()
+    for media_type in (NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE):
+        if media_type in accept:
+            return media_type
+    return None
+
+
+def _encode(media_type: str, event: str, payload: str) -> bytes:
+    """Encode one record in the streaming format."""
+    if media_type == SSE_MEDIA_TYPE:
+        return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+    if event == "summary":
+        payload = f'{{"summary": {payload}}}'
+    return (payload + "\n").encode("utf-8")
+
+
+def stream_batch(
+    items: AsyncIterator[dict[str, Any]],
+    item_model: type[BaseModel],
+    total: int,
+    media_type: str,
+    summary_extra: Optional[Callable[[int, float], dict[str, Any]]] = None
+) -> StreamingResponse:
+    """
+    Stream batch items followed by a summary record.
+
+    Args:
+        items: Service results with index, success status, and data/error
+        item_model: Batch*Item model each result is validated against
+        total: Number of images in the batch
+        media_type: NDJSON_MEDIA_TYPE or SSE_MEDIA_TYPE
+        summary_extra: Builds extra summary fields from (item count,
+            elapsed seconds)
+
+    Returns:
+        Streaming response
+    """
+    async def generate() -> AsyncIterator[bytes]:
+        start_time = time.perf_counter()
+        count = successful = 0
+        try:
+            async for item in items:
+                count += 1
+                successful += item["success"]
+                payload = item_model(**item).model_dump_json(by_alias=True)
+                yield _encode(media_type, "item", payload)
+        except Exception as e:
+            logger.error(f"Batch stream failed after {count} of {total} items: {e}")
+            increment_request_count(success=False)
+            yield _encode(media_type, "error", json.dumps({"error": str(e)}))
+            return
+
+        summary = {"total": total, "successful": successful, "failed": count - successful}
+        if summary_extra is not None:
+            summary.update(summary_extra(count, time.perf_counter() - start_time))
+        increment_request_count(success=True)
+        yield _encode(media_type, "summary", json.dumps(summary))
+
+    return StreamingResponse(
+        generate(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -29,6 +29,8 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     workers: int = 1
+    # Load models once in a master process and fork the workers from it (python -m app.launcher)
+    prefork: bool = False
     reload: bool = False  # Set to True only for development
 
     # CORS
@@ -40,6 +42,73 @@ class Settings(BaseSettings):
     model_dir: str = "models"
     device: str = "cuda"
     preload_models: bool = True
+    # Run each preloaded model on synthetic inputs before /ready reports it ready
+    warmup_enabled: bool = True
+    warmup_batch_sizes: list[int] | None = None  # Classifier batch sizes; defaults to 1 and micro_batch_max_size
+    # Models /ready waits for; the others load in the background and may fail without taking the worker out
+    ready_required_models: list[Literal["aircraft", "airline", "registration", "quality"]] = [
+        "aircraft", "airline", "quality"
+    ]
+    # Token for the /admin endpoints (X-Admin-Token header); admin endpoints are disabled when unset
+    admin_token: str | None = None
+    # Model swaps are broadcast to all workers through Redis: workers poll for them
+    # every model_swap_poll_seconds, the swap request waits up to model_swap_timeout_seconds
+    model_swap_poll_seconds: float = 2.0
+    model_swap_timeout_seconds: float = 120.0
+
+    # Classifier backend: "onnx" exports the .pt weights once and runs them on ONNX Runtime
+    inference_backend: Literal["torch", "onnx"] = "torch"
+    onnx_cache_dir: str | None = None  # Exported models; defaults to <model_dir>/onnx
+    onnx_intra_op_threads: int = 0  # 0: ONNX Runtime default (one per physical core)
+    onnx_inter_op_threads: int = 1
+
+    # INT8 classifiers (ONNX backend only), built with `python -m app.inference.quantization`
+    classifier_quantization: Literal["none", "dynamic", "static"] = "none"
+    # Quantized artifacts whose agreement with the float model is below these floors are not loaded
+    quantization_min_top1_agreement: float = 0.98
+    quantization_min_top5_agreement: float = 0.99
+
+    # Shared preprocessing (classifier input geometry)
+    classifier_image_size: int = 640
+    classifier_letterbox: bool = False  # False: scale shorter side, as classify transforms do
+
+    # Micro-batching (single-image classification requests)
+    micro_batch_enabled: bool = True
+    micro_batch_max_size: int = 16
+    micro_batch_max_wait_ms: float = 5.0
+
+    # Adaptive chunking of batch classification: chunks stay within the memory budget
+    # (shared by the chunks running at once) and aim at the target inference time
+    batch_chunk_memory_mb: int = 1024
+    batch_chunk_image_overhead_mb: float = 32.0  # Estimated per-image input tensor and activations
+    batch_chunk_target_ms: float = 1000.0
+    batch_chunk_max_size: int = 64
+
+    # Inference executors (per-model concurrency and queue bounds)
+    executor_workers: dict[str, int] = {
+        "quality": 2,
+        "aircraft": 1,
+        "airline": 1,
+        "registration": 4,
+    }
+    executor_queue_sizes: dict[str, int] = {
+        "quality": 32,
+        "aircraft": 64,
+        "airline": 64,
+        "registration": 16,
+    }
+
+    # Batch fan-out pools (per-image parallelism inside a batch call)
+    batch_pool_workers: dict[str, int] = {
+        "quality": 4,
+        "registration": 2,  # Local OCR (detection + recognition)
+        "registration_remote": 8,  # In-flight remote VLM OCR calls
+    }
+    quality_batch_mode: Literal["serial", "threads"] = "threads"
+    ocr_batch_parallel: bool = True
+
+    # Review
+    review_concurrent: bool = True  # Run review components in parallel
 
     # OCR
     ocr_mode: str = "auto"
@@ -59,14 +128,56 @@ class Settings(BaseSettings):
     # New class detection
     new_class_similarity_threshold: float = 0.7
 
+    # History ingestion (/history/push)
+    history_batch_size: int = 32  # Images per embedding batch and bulk write
+
     # Limits
     max_image_size_mb: int = 20
+    max_image_pixels: int = 100_000_000  # Checked from the header, before full decode
     max_batch_size: int = 50
     request_timeout_seconds: int = 300
 
+    # Image decoding (JPEG DCT-scaled decode down to the largest model input)
+    decode_reduced_enabled: bool = True
+    decode_min_size: int = 1280  # Both sides of the decoded image stay at least this large
+
+    # Image fetching (URL inputs)
+    image_fetch_timeout_seconds: float = 30.0
+    image_fetch_max_connections: int = 100
+    image_fetch_max_keepalive: int = 20
+    image_fetch_per_host_limit: int = 8
+    image_fetch_batch_concurrency: int = 16
+    image_fetch_http2: bool = True
+
     # Redis (for shared statistics across workers)
     redis_url: str = "redis://localhost:6379/0"
     redis_enabled: bool = True
+    stats_flush_interval_seconds: float = 1.0  # Request counters are flushed in bulk
+
+    # Result cache (content-addressed, keyed by image digest + model + params)
+    result_cache_enabled: bool = True
+    result_cache_max_mb: int = 64
+    result_cache_redis_enabled: bool = False
+    result_cache_ttl_seconds: int = 3600
+
+    # Batch jobs (/jobs): large batches processed in chunks by background workers
+    jobs_enabled: bool = True
+    job_queue_backend: Literal["redis", "memory"] = "redis"  # memory is single-process only
+    job_chunk_size: int = 50
+    job_max_images: int = 10000
+    job_workers: int = 1  # Chunks processed concurrently per worker process
+    job_ttl_seconds: int = 86400
+    job_visibility_timeout_seconds: float = 600.0  # A taken chunk whose worker stops extending its lease is requeued
+    job_max_attempts: int = 3  # Times a chunk is taken before its job is marked failed
+
+    # Metrics (Prometheus text format on /metrics)
+    metrics_enabled: bool = True
+
+    # Tracing (per-request stage spans)
+    tracing_enabled: bool = True
+    tracing_exporter: Literal["memory", "file", "none"] = "memory"
+    tracing_buffer_size: int = 10000  # Spans kept by the in-memory exporter
+    tracing_file_path: str = "logs/traces.jsonl"  # OTLP/JSON lines for the file exporter
 
     # Logging
     log_level: str = "INFO"
@@ -0,0 +1,160 @@
+"""
+Shared async HTTP client for fetching images from URLs.
+
+A single process-wide httpx.AsyncClient keeps connections alive across
+requests (HTTP/2 when the ``h2`` package is installed). Concurrency is
+capped per host, and downloads are streamed so that oversized bodies are
+aborted as soon as they exceed the configured size limit.
+"""
+
+import asyncio
+import importlib.util
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.exceptions import ImageLoadError
+from app.core.metrics import time_stage
+from app.core.logging import logger
+
+
+class ImageFetcher:
+    """Pooled, size-limited image downloader."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        per_host_limit: int = 8,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            max_bytes: Maximum accepted response body size in bytes
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of pooled connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            per_host_limit: Maximum concurrent downloads from a single host
+            http2: Whether to negotiate HTTP/2 (requires the ``h2`` package)
+            transport: Optional custom transport (mainly for testing)
+        """
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested for image fetching but 'h2' is not installed")
+            http2 = False
+
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self._transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled client, creating it for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            # Pooled connections cannot be shared across event loops
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self._limits,
+                http2=self.http2,
+                follow_redirects=True,
+                transport=self._transport
+            )
+            self._loop = loop
+            self._host_semaphores.clear()
+        return self._client
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the concurrency cap for the URL's host."""
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def fetch(self, url: str) -> bytes:
+        """
+        Download a URL into memory.
+
+        Args:
+            url: HTTP(S) URL of the image
+
+        Returns:
+            Response body bytes
+
+        Raises:
+            ImageLoadError: If the download fails or exceeds the size limit
+        """
+        client = self._get_client()
+        async with self._get_host_semaphore(url):
+            with time_stage("image_fetch"):
+                try:
+                    async with client.stream("GET", url) as response:
+                        response.raise_for_status()
+
+                        content_length = response.headers.get("content-length")
+                        if content_length is not None and int(content_length) > self.max_bytes:
+                            raise ImageLoadError(
+                                f"Image at URL exceeds size limit of {self.max_bytes} bytes"
+                            )
+
+                        buffer = bytearray()
+                        async for chunk in response.aiter_bytes():
+                            buffer.extend(chunk)
+                            if len(buffer) > self.max_bytes:
+                                raise ImageLoadError(
+                                    f"Image at URL exceeds size limit of {self.max_bytes} bytes"
+                                )
+                        return bytes(buffer)
+                except httpx.HTTPError as e:
+                    raise ImageLoadError(f"Failed to load image from URL: {e}")
+
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+_image_fetcher: Optional[ImageFetcher] = None
+
+
+def get_image_fetcher() -> ImageFetcher:
+    """Get or create the process-wide image fetcher."""
+    global _image_fetcher
+    if _image_fetcher is None:
+        settings = get_settings()
+        _image_fetcher = ImageFetcher(
+            max_bytes=settings.max_image_size_mb * 1024 * 1024,
+            timeout=settings.image_fetch_timeout_seconds,
+            max_connections=settings.image_fetch_max_connections,
+            max_keepalive_connections=settings.image_fetch_max_keepalive,
+            per_host_limit=settings.image_fetch_per_host_limit,
+            http2=settings.image_fetch_http2
+        )
+    return _image_fetcher
+
+
+async def close_image_fetcher() -> None:
+    """Close and forget the process-wide image fetcher."""
+    global _image_fetcher
+    if _image_fetcher is not None:
+        await _image_fetcher.aclose()
+        _image_fetcher = None
@@ -0,0 +1,127 @@
+"""
+Import-time budget check.
+
+Imports a module in a fresh interpreter with ``-X importtime`` and reports
+the slowest modules, failing when the total exceeds a budget or when a
+forbidden module (e.g. torch) is pulled in:
+
+    python -m app.core.importtime app.main --budget-ms 1500 --forbid torch aerovision_inference
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Sequence
+
+_LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportTiming:
+    """Time spent importing one module."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """Import timings of one top-level import."""
+
+    module: str
+    timings: list[ImportTiming]
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative time of the measured module, in milliseconds."""
+        for timing in reversed(self.timings):
+            if timing.module == self.module:
+                return timing.cumulative_us / 1000
+        return sum(t.self_us for t in self.timings) / 1000
+
+    def imported(self, module: str) -> bool:
+        """Whether a module (or one of its submodules) was imported."""
+        return any(t.module == module or t.module.startswith(f"{module}.") for t in self.timings)
+
+    def slowest(self, top: int = 15, cumulative: bool = False) -> list[ImportTiming]:
+        """Get the slowest modules by self time (or cumulative time)."""
+        key = (lambda t: t.cumulative_us) if cumulative else (lambda t: t.self_us)
+        return sorted(self.timings, key=key, reverse=True)[:top]
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """
+    Parse ``-X importtime`` output.
+
+    Args:
+        output: stderr of an interpreter run with ``-X importtime``
+
+    Returns:
+        Timings in import completion order
+    """
+    timings = []
+    for line in output.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return timings
+
+
+def measure_imports(module: str) -> ImportReport:
+    """
+    Import a module in a fresh interpreter and collect its import timings.
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return ImportReport(module, parse_importtime(result.stderr))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Check import time against a budget from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.core.importtime",
+        description="Report the slowest imports of a module and check an import-time budget"
+    )
+    parser.add_argument("module", nargs="?", default="app.main", help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail above this total import time")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list")
+    parser.add_argument("--forbid", nargs="*", default=[], help="Modules that must not be imported")
+    args = parser.parse_args(argv)
+
+    report = measure_imports(args.module)
+    print(f"{args.module}: {report.total_ms:.0f} ms total")
+    print(f"{'self ms':>9} {'cumul. ms':>10}  module")
+    for timing in report.slowest(args.top):
+        print(f"{timing.self_us / 1000:9.1f} {timing.cumulative_us / 1000:10.1f}  {timing.module}")
+
+    failed = False
+    for module in args.forbid:
+        if report.imported(module):
+            print(f"FAIL: {module} is imported by {args.module}")
+            failed = True
+    if args.budget_ms is not None and report.total_ms > args.budget_ms:
+        print(f"FAIL: {report.total_ms:.0f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,638 @@
+"""
+Queue and store for asynchronous batch jobs.
+
+A job's images are split into chunks that are queued individually, so any
+worker process can pick up the next chunk. Progress counters and per-chunk
+results are stored with the job and results are paged by image index.
+
+A taken chunk stays leased to its worker until the worker completes it;
+the worker extends the lease while it is still processing the chunk.
+Chunks whose worker died or stalled are requeued once their visibility
+timeout expires; a chunk taken max_attempts times without completing is
+recorded as failed for each of its images and its job is marked failed.
+
+Two backends share one interface: Redis (shared by all workers) and an
+in-memory stand-in that only works within a single process (tests and
+single-worker deployments without Redis).
+"""
+
+import abc
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from redis.exceptions import WatchError
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.core.redis_client import get_stats_manager
+
+REDIS_KEY_PREFIX = "jobs:"
+
+# Integer fields of a job record
+_COUNTER_FIELDS = (
+    "total", "processed", "successful", "failed", "chunk_size", "chunks", "chunks_done", "chunks_abandoned"
+)
+
+# Attempts at an optimistic Redis transaction before giving up
+_WATCH_RETRIES = 10
+
+
+@dataclass
+class JobChunk:
+    """A slice of a job's images, processed as one unit."""
+
+    job_id: str
+    index: int
+    start: int
+    images: list[str]
+    params: dict[str, Any]
+    attempt: int = 1
+
+
+class JobQueue(abc.ABC):
+    """Interface of the job queue backends."""
+
+    def __init__(
+        self,
+        chunk_size: int,
+        ttl_seconds: int,
+        visibility_timeout: float = 600.0,
+        max_attempts: int = 3
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            chunk_size: Images per chunk
+            ttl_seconds: How long jobs and results are kept
+            visibility_timeout: Seconds a taken chunk may go without completing
+                before it is requeued
+            max_attempts: Times a chunk is taken before its job is marked failed
+        """
+        self.chunk_size = chunk_size
+        self.ttl_seconds = ttl_seconds
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max(1, max_attempts)
+        self._next_requeue = 0.0
+
+    def _new_job(self, kind: str, total: int, params: dict[str, Any]) -> dict[str, Any]:
+        """Build the record of a new job."""
+        now = time.time()
+        return {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "status": "queued",
+            "error": "",
+            "total": total,
+            "processed": 0,
+            "successful": 0,
+            "failed": 0,
+            "chunk_size": self.chunk_size,
+            "chunks": max(1, -(-total // self.chunk_size)),
+            "chunks_done": 0,
+            "chunks_abandoned": 0,
+            "params": params,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def _chunk_range(self, job: dict[str, Any], offset: int, limit: int) -> range:
+        """Indices of the chunks covering results [offset, offset + limit)."""
+        first = offset // job["chunk_size"]
+        last = min(job["chunks"] - 1, (offset + limit - 1) // job["chunk_size"])
+        return range(first, last + 1)
+
+    @staticmethod
+    def _slice_results(
+        chunk_results: list[Optional[list[dict[str, Any]]]],
+        offset: int,
+        limit: int
+    ) -> list[dict[str, Any]]:
+        """Flatten finished chunks and keep results in [offset, offset + limit)."""
+        results = [r for chunk in chunk_results if chunk for r in chunk]
+        return [r for r in results if offset <= r["index"] < offset + limit]
+
+    def _abandoned_results(self, start: int, count: int) -> list[dict[str, Any]]:
+        """Results recorded for the images of a chunk that ran out of attempts."""
+        error = f"Chunk not completed after {self.max_attempts} attempts"
+        return [
+            {"index": start + i, "success": False, "data": None, "error": error}
+            for i in range(count)
+        ]
+
+    def _requeue_due(self) -> bool:
+        """Whether it is time to look for stale chunks again."""
+        now = time.monotonic()
+        if now < self._next_requeue:
+            return False
+        self._next_requeue = now + max(1.0, self.visibility_timeout / 4)
+        return True
+
+    @abc.abstractmethod
+    async def create_job(self, kind: str, images: list[str], params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Create a job and queue its chunks.
+
+        Args:
+            kind: Job kind (e.g. "review")
+            images: Base64 encoded images or URLs
+            params: Processing parameters passed to the worker
+
+        Returns:
+            The job record
+        """
+
+    @abc.abstractmethod
+    async def next_chunk(self, timeout: float = 1.0) -> Optional[JobChunk]:
+        """
+        Take the next queued chunk, marking its job as running.
+
+        The chunk is leased to the caller until complete_chunk() is called;
+        it is requeued if that does not happen within the visibility timeout.
+
+        Args:
+            timeout: Seconds to wait for a chunk
+
+        Returns:
+            The chunk, or None if none arrived in time
+        """
+
+    @abc.abstractmethod
+    async def complete_chunk(self, chunk: JobChunk, results: list[dict[str, Any]]) -> bool:
+        """
+        Store a chunk's results, update job progress and release the chunk.
+
+        Args:
+            chunk: The processed chunk
+            results: Per-image results with job-wide "index" and "success"
+
+        Returns:
+            False if the chunk's lease had expired and it was requeued, in
+            which case the results are dropped
+        """
+
+    @abc.abstractmethod
+    async def extend_lease(self, chunk: JobChunk) -> bool:
+        """
+        Restart the visibility timeout of a chunk still being processed.
+
+        Args:
+            chunk: A chunk taken by this worker
+
+        Returns:
+            False if the chunk is no longer leased to this worker (it was
+            requeued or completed)
+        """
+
+    @abc.abstractmethod
+    async def requeue_stale(self) -> int:
+        """
+        Requeue taken chunks whose visibility timeout expired.
+
+        Chunks out of attempts are recorded as failed and their job is
+        marked failed instead.
+
+        Returns:
+            Number of chunks requeued or abandoned
+        """
+
+    @abc.abstractmethod
+    async def get_job(self, job_id: str) -> Optional[dict[str, Any]]:
+        """Get a job record, or None if unknown or expired."""
+
+    @abc.abstractmethod
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 50) -> list[dict[str, Any]]:
+        """
+        Get finished results of a job, ordered by image index.
+
+        Results of chunks still in progress are not included.
+
+        Args:
+            job_id: Job ID
+            offset: Index of the first image
+            limit: Maximum number of images covered
+        """
+
+
+class MemoryJobQueue(JobQueue):
+    """In-process job queue (single worker process only)."""
+
+    def __init__(
+        self,
+        chunk_size: int = 50,
+        ttl_seconds: int = 86400,
+        visibility_timeout: float = 600.0,
+        max_attempts: int = 3
+    ):
+        super().__init__(chunk_size, ttl_seconds, visibility_timeout, max_attempts)
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._chunk_images: dict[tuple[str, int], list[str]] = {}
+        self._results: dict[tuple[str, int], list[dict[str, Any]]] = {}
+        self._queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+        self._leases: dict[tuple[str, int], float] = {}
+        self._attempts: dict[tuple[str, int], int] = {}
+
+    async def create_job(self, kind: str, images: list[str], params: dict[str, Any]) -> dict[str, Any]:
+        self._expire()
+        job = self._new_job(kind, len(images), params)
+        self._jobs[job["job_id"]] = job
+        for index in range(job["chunks"]):
+            start = index * self.chunk_size
+            self._chunk_images[(job["job_id"], index)] = images[start:start + self.chunk_size]
+            self._queue.put_nowait((job["job_id"], index))
+        return dict(job)
+
+    async def next_chunk(self, timeout: float = 1.0) -> Optional[JobChunk]:
+        if self._requeue_due():
+            await self.requeue_stale()
+        try:
+            key = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        job = self._jobs.get(key[0])
+        images = self._chunk_images.get(key)
+        if job is None or images is None:
+            return None
+        self._leases[key] = time.time()
+        self._attempts[key] = self._attempts.get(key, 0) + 1
+        if job["status"] == "queued":
+            job["status"] = "running"
+            job["updated_at"] = time.time()
+        return JobChunk(key[0], key[1], key[1] * job["chunk_size"], images, job["params"], self._attempts[key])
+
+    async def complete_chunk(self, chunk: JobChunk, results: list[dict[str, Any]]) -> bool:
+        key = (chunk.job_id, chunk.index)
+        if self._leases.pop(key, None) is None:
+            logger.warning(f"Dropping results of job {chunk.job_id} chunk {chunk.index}: lease expired")
+            return False
+        self._finish_chunk(key, results)
+        return True
+
+    async def extend_lease(self, chunk: JobChunk) -> bool:
+        key = (chunk.job_id, chunk.index)
+        if key not in self._leases or self._attempts.get(key) != chunk.attempt:
+            return False
+        self._leases[key] = time.time()
+        return True
+
+    async def requeue_stale(self) -> int:
+        cutoff = time.time() - self.visibility_timeout
+        stale = [key for key, taken_at in self._leases.items() if taken_at < cutoff]
+        for key in stale:
+            del self._leases[key]
+            job = self._jobs.get(key[0])
+            images = self._chunk_images.get(key)
+            if job is None or images is None:
+                continue
+            if self._attempts.get(key, 0) >= self.max_attempts:
+                logger.error(f"Job {key[0]} chunk {key[1]} abandoned after {self.max_attempts} attempts")
+                self._finish_chunk(key, self._abandoned_results(key[1] * job["chunk_size"], len(images)), True)
+            else:
+                logger.warning(f"Requeuing job {key[0]} chunk {key[1]}: visibility timeout expired")
+                self._queue.put_nowait(key)
+        return len(stale)
+
+    def _finish_chunk(self, key: tuple[str, int], results: list[dict[str, Any]], abandoned: bool = False) -> None:
+        """Store a chunk's results and update its job's progress."""
+        self._chunk_images.pop(key, None)
+        self._attempts.pop(key, None)
+        job = self._jobs.get(key[0])
+        if job is None:
+            return
+        self._results[key] = results
+        successful = sum(1 for r in results if r["success"])
+        job["processed"] += len(results)
+        job["successful"] += successful
+        job["failed"] += len(results) - successful
+        job["chunks_done"] += 1
+        if abandoned:
+            job["chunks_abandoned"] += 1
+            job["status"] = "failed"
+            job["error"] = f"Chunk {key[1]} not completed after {self.max_attempts} attempts"
+        elif job["chunks_done"] >= job["chunks"] and not job["chunks_abandoned"]:
+            job["status"] = "completed"
+        job["updated_at"] = time.time()
+
+    async def get_job(self, job_id: str) -> Optional[dict[str, Any]]:
+        self._expire()
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 50) -> list[dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return []
+        chunk_results = [self._results.get((job_id, i)) for i in self._chunk_range(job, offset, limit)]
+        return self._slice_results(chunk_results, offset, limit)
+
+    def _expire(self) -> None:
+        """Drop jobs older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        for job_id in [j for j, job in self._jobs.items() if job["created_at"] < cutoff]:
+            job = self._jobs.pop(job_id)
+            for index in range(job["chunks"]):
+                self._chunk_images.pop((job_id, index), None)
+                self._results.pop((job_id, index), None)
+                self._leases.pop((job_id, index), None)
+                self._attempts.pop((job_id, index), None)
+
+
+class RedisJobQueue(JobQueue):
+    """
+    Job queue in Redis, shared by all worker processes.
+
+    Chunks are moved atomically (BLMOVE) from the queue to the taking
+    worker's processing list, so a chunk is always in one of the two lists
+    until it is completed, even if the worker dies.
+
+    Keys (job keys expire after the TTL):
+        jobs:queue                  list of "<job_id>:<chunk>" to process
+        jobs:processing:<worker>    list of chunks a worker has taken
+        jobs:processing             set of the processing list keys
+        jobs:leases                 sorted set of taken chunks by time taken
+        jobs:<job_id>               hash with the job record
+        jobs:<job_id>:attempts      hash of times each chunk was taken
+        jobs:<job_id>:chunk:<n>     JSON list of a chunk's images, until completed
+        jobs:<job_id>:results:<n>   JSON list of a finished chunk's results
+    """
+
+    QUEUE_KEY = REDIS_KEY_PREFIX + "queue"
+    PROCESSING_KEY = REDIS_KEY_PREFIX + "processing"
+    LEASES_KEY = REDIS_KEY_PREFIX + "leases"
+
+    def __init__(
+        self,
+        chunk_size: int = 50,
+        ttl_seconds: int = 86400,
+        visibility_timeout: float = 600.0,
+        max_attempts: int = 3
+    ):
+        super().__init__(chunk_size, ttl_seconds, visibility_timeout, max_attempts)
+        worker = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.processing_key = f"{self.PROCESSING_KEY}:{worker}"
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{REDIS_KEY_PREFIX}{job_id}"
+
+    async def create_job(self, kind: str, images: list[str], params: dict[str, Any]) -> dict[str, Any]:
+        r = await get_stats_manager().get_async_redis()
+        job = self._new_job(kind, len(images), params)
+        job_key = self._job_key(job["job_id"])
+
+        pipe = r.pipeline()
+        pipe.hset(job_key, mapping=_encode_job(job))
+        pipe.expire(job_key, self.ttl_seconds)
+        for index in range(job["chunks"]):
+            start = index * self.chunk_size
+            pipe.set(
+                f"{job_key}:chunk:{index}",
+                json.dumps(images[start:start + self.chunk_size]),
+                ex=self.ttl_seconds
+            )
+        pipe.rpush(self.QUEUE_KEY, *[f"{job['job_id']}:{i}" for i in range(job["chunks"])])
+        await pipe.execute()
+        return job
+
+    async def next_chunk(self, timeout: float = 1.0) -> Optional[JobChunk]:
+        if self._requeue_due():
+            await self.requeue_stale()
+        r = await get_stats_manager().get_async_redis()
+        item = await r.blmove(self.QUEUE_KEY, self.processing_key, max(1, int(timeout)), "LEFT", "RIGHT")
+        if item is None:
+            return None
+
+        job_id, _, index = item.rpartition(":")
+        job_key = self._job_key(job_id)
+        pipe = r.pipeline()
+        pipe.sadd(self.PROCESSING_KEY, self.processing_key)
+        pipe.zadd(self.LEASES_KEY, {item: time.time()})
+        pipe.hincrby(f"{job_key}:attempts", index, 1)
+        pipe.expire(f"{job_key}:attempts", self.ttl_seconds)
+        pipe.hgetall(job_key)
+        pipe.get(f"{job_key}:chunk:{index}")
+        *_, attempt, _, raw_job, raw_images = await pipe.execute()
+        if not raw_job or raw_images is None:
+            logger.warning(f"Dropping chunk {item}: job or images expired")
+            await self._release(r, self.processing_key, item)
+            return None
+
+        job = _decode_job(raw_job)
+        if job["status"] == "queued":
+            await r.hset(job_key, mapping={"status": "running", "updated_at": time.time()})
+        return JobChunk(
+            job_id, int(index), int(index) * job["chunk_size"], json.loads(raw_images), job["params"], attempt
+        )
+
+    async def complete_chunk(self, chunk: JobChunk, results: list[dict[str, Any]]) -> bool:
+        r = await get_stats_manager().get_async_redis()
+        item = f"{chunk.job_id}:{chunk.index}"
+        if not await self._finish_chunk(r, self.processing_key, item, results):
+            logger.warning(f"Dropping results of job {chunk.job_id} chunk {chunk.index}: lease or job expired")
+            return False
+        return True
+
+    async def extend_lease(self, chunk: JobChunk) -> bool:
+        r = await get_stats_manager().get_async_redis()
+        item = f"{chunk.job_id}:{chunk.index}"
+        attempt = await r.hget(f"{self._job_key(chunk.job_id)}:attempts", str(chunk.index))
+        if attempt is None or int(attempt) != chunk.attempt:
+            return False
+        if await r.lpos(self.processing_key, item) is None:
+            return False
+        return bool(await r.zadd(self.LEASES_KEY, {item: time.time()}, xx=True, ch=True))
+
+    async def requeue_stale(self) -> int:
+        r = await get_stats_manager().get_async_redis()
+        cutoff = time.time() - self.visibility_timeout
+        handled = 0
+        for processing_key in await r.smembers(self.PROCESSING_KEY):
+            items = await r.lrange(processing_key, 0, -1)
+            if not items:
+                if processing_key != self.processing_key:
+                    await r.srem(self.PROCESSING_KEY, processing_key)
+                continue
+
+            taken_at = await r.zmscore(self.LEASES_KEY, items)
+            for item, score in zip(items, taken_at):
+                if score is None:
+                    # Taken by a worker that died before recording the lease: start the clock now
+                    await r.zadd(self.LEASES_KEY, {item: time.time()}, nx=True)
+                elif score < cutoff and await self._requeue(r, processing_key, item):
+                    handled += 1
+        return handled
+
+    async def _requeue(self, r: Any, processing_key: str, item: str) -> bool:
+        """Requeue a stale chunk, or abandon it if it is out of attempts."""
+        job_id, _, index = item.rpartition(":")
+        job_key = self._job_key(job_id)
+        attempts = int(await r.hget(f"{job_key}:attempts", index) or 0)
+        if attempts >= self.max_attempts:
+            raw_job = await r.hmget(job_key, ["chunk_size"])
+            images = await r.get(f"{job_key}:chunk:{index}")
+            if raw_job[0] is not None and images is not None:
+                logger.error(f"Job {job_id} chunk {index} abandoned after {attempts} attempts")
+                results = self._abandoned_results(int(index) * int(raw_job[0]), len(json.loads(images)))
+                return await self._finish_chunk(r, processing_key, item, results, abandoned=True)
+            return await self._release(r, processing_key, item)
+
+        async with r.pipeline(transaction=True) as pipe:
+            for _ in range(_WATCH_RETRIES):
+                try:
+                    await pipe.watch(processing_key)
+                    if await pipe.lpos(processing_key, item) is None:
+                        return False
+                    pipe.multi()
+                    pipe.lrem(processing_key, 1, item)
+                    pipe.zrem(self.LEASES_KEY, item)
+                    pipe.rpush(self.QUEUE_KEY, item)
+                    await pipe.execute()
+                    logger.warning(f"Requeued chunk {item}: visibility timeout expired")
+                    return True
+                except WatchError:
+                    continue
+        return False
+
+    async def _release(self, r: Any, processing_key: str, item: str) -> bool:
+        """Drop a taken chunk without recording results."""
+        pipe = r.pipeline()
+        pipe.lrem(processing_key, 1, item)
+        pipe.zrem(self.LEASES_KEY, item)
+        removed, _ = await pipe.execute()
+        return bool(removed)
+
+    async def _finish_chunk(
+        self,
+        r: Any,
+        processing_key: str,
+        item: str,
+        results: list[dict[str, Any]],
+        abandoned: bool = False
+    ) -> bool:
+        """
+        Store a taken chunk's results and update job progress atomically.
+
+        The job record is watched too, so the job's status is decided on
+        the counters this update is applied to.
+
+        Returns:
+            False if the chunk is no longer in the processing list (requeued
+            or finished by someone else) or its job expired; nothing is
+            recorded then
+        """
+        job_id, _, index = item.rpartition(":")
+        job_key = self._job_key(job_id)
+        successful = sum(1 for result in results if result["success"])
+
+        async with r.pipeline(transaction=True) as pipe:
+            for _ in range(_WATCH_RETRIES):
+                try:
+                    await pipe.watch(processing_key, job_key)
+                    if await pipe.lpos(processing_key, item) is None:
+                        return False
+                    chunks, chunks_done, chunks_abandoned = await pipe.hmget(
+                        job_key, ["chunks", "chunks_done", "chunks_abandoned"]
+                    )
+                    pipe.multi()
+                    pipe.lrem(processing_key, 1, item)
+                    pipe.zrem(self.LEASES_KEY, item)
+                    pipe.delete(f"{job_key}:chunk:{index}")
+                    if chunks is None:
+                        # Writing progress now would recreate the job hash without a TTL
+                        await pipe.execute()
+                        logger.warning(f"Dropping chunk {item}: job expired")
+                        return False
+
+                    chunks_done = int(chunks_done) + 1
+                    chunks_abandoned = int(chunks_abandoned) + (1 if abandoned else 0)
+                    update: dict[str, Any] = {"updated_at": time.time()}
+                    if abandoned:
+                        update["status"] = "failed"
+                        update["error"] = f"Chunk {index} not completed after {self.max_attempts} attempts"
+                    elif chunks_done >= int(chunks) and not chunks_abandoned:
+                        update["status"] = "completed"
+
+                    pipe.set(f"{job_key}:results:{index}", json.dumps(results, default=str), ex=self.ttl_seconds)
+                    pipe.hincrby(job_key, "processed", len(results))
+                    pipe.hincrby(job_key, "successful", successful)
+                    pipe.hincrby(job_key, "failed", len(results) - successful)
+                    pipe.hincrby(job_key, "chunks_done", 1)
+                    pipe.hincrby(job_key, "chunks_abandoned", 1 if abandoned else 0)
+                    pipe.hset(job_key, mapping=update)
+                    await pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+        raise RuntimeError(f"Could not record chunk {item}: job or processing list kept changing")
+
+    async def get_job(self, job_id: str) -> Optional[dict[str, Any]]:
+        r = await get_stats_manager().get_async_redis()
+        raw_job = await r.hgetall(self._job_key(job_id))
+        return _decode_job(raw_job) if raw_job else None
+
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 50) -> list[dict[str, Any]]:
+        job = await self.get_job(job_id)
+        if job is None:
+            return []
+        r = await get_stats_manager().get_async_redis()
+        job_key = self._job_key(job_id)
+        payloads = await r.mget([f"{job_key}:results:{i}" for i in self._chunk_range(job, offset, limit)])
+        chunk_results = [json.loads(p) if p is not None else None for p in payloads]
+        return self._slice_results(chunk_results, offset, limit)
+
+
+def _encode_job(job: dict[str, Any]) -> dict[str, Any]:
+    """Encode a job record as Redis hash fields."""
+    encoded = dict(job)
+    encoded["params"] = json.dumps(job["params"])
+    return encoded
+
+
+def _decode_job(raw_job: dict[str, str]) -> dict[str, Any]:
+    """Decode a job record from Redis hash fields."""
+    job: dict[str, Any] = dict(raw_job)
+    for name in _COUNTER_FIELDS:
+        job[name] = int(job.get(name, 0))
+    job["created_at"] = float(job["created_at"])
+    job["updated_at"] = float(job["updated_at"])
+    job["params"] = json.loads(job.get("params") or "{}")
+    return job
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """
+    Get the process-wide job queue.
+
+    Uses Redis when the job_queue_backend setting is "redis" and Redis is
+    enabled, otherwise the in-memory queue.
+    """
+    global _job_queue
+    if _job_queue is None:
+        settings = get_settings()
+        queue_class: type[JobQueue]
+        if settings.job_queue_backend == "redis" and settings.redis_enabled:
+            queue_class = RedisJobQueue
+        else:
+            queue_class = MemoryJobQueue
+        _job_queue = queue_class(
+            settings.job_chunk_size,
+            settings.job_ttl_seconds,
+            settings.job_visibility_timeout_seconds,
+            settings.job_max_attempts
+        )
+    return _job_queue
+
+
+def set_job_queue(queue: Optional[JobQueue]) -> None:
+    """Replace the job queue (None rebuilds it from settings on next use)."""
+    global _job_queue
+    _job_queue = queue
@@ -0,0 +1,243 @@
+"""
+Latency histograms exposed in the Prometheus text format.
+
+Request latency is recorded per route by the HTTP middleware; internal
+stages (image fetch, decode, preprocessing, inference, result wrapping,
+serialization) are recorded with time_stage(), labelled by model and
+batch size, and traced as spans. Histograms are per worker process.
+"""
+
+import contextlib
+import math
+import threading
+import time
+from typing import Iterator, Optional
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import get_settings
+from app.core.tracing import start_span
+
+# Latency buckets in seconds (upper bounds), from 1 ms to 60 s
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Route label of requests that matched no route, keeping the label set bounded
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names, in the order values are passed to observe()
+            buckets: Sorted bucket upper bounds
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value (seconds)
+            *labelvalues: Label values, matching labelnames
+        """
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                # Per-bucket counts, then sum and count
+                series = [[0] * len(self.buckets), 0.0, 0]
+                self._series[labelvalues] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        """Render the histogram in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series_items = sorted(
+                (labels, (list(counts), total, count))
+                for labels, (counts, total, count) in self._series.items()
+            )
+
+        for labelvalues, (counts, total, count) in series_items:
+            labels = list(zip(self.labelnames, labelvalues))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', repr(bound))])} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+    def reset(self) -> None:
+        """Drop all recorded series."""
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Collection of histograms rendered together."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Histogram(name, documentation, labelnames, buckets)
+                self._metrics[name] = metric
+            return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded series of all metrics."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+
+_registry = MetricsRegistry()
+
+REQUEST_LATENCY = _registry.histogram(
+    "aerovision_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route", "status"),
+)
+
+STAGE_LATENCY = _registry.histogram(
+    "aerovision_stage_duration_seconds",
+    "Latency of internal processing stages",
+    ("stage", "model", "batch_size"),
+)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+def batch_size_label(batch_size: int) -> str:
+    """
+    Bucket a batch size into a bounded label value.
+
+    Sizes are rounded up to the next power of two to keep label
+    cardinality low.
+    """
+    if batch_size <= 1:
+        return "1"
+    return str(2 ** math.ceil(math.log2(batch_size)))
+
+
+def observe_stage(stage: str, seconds: float, model: str = "", batch_size: int = 1) -> None:
+    """
+    Record the latency of an internal stage.
+
+    Args:
+        stage: Stage name (e.g. "image_fetch", "inference", "serialize")
+        seconds: Elapsed time in seconds
+        model: Model name, if the stage is model-specific
+        batch_size: Number of images processed by the stage
+    """
+    if get_settings().metrics_enabled:
+        STAGE_LATENCY.observe(seconds, stage, model, batch_size_label(batch_size))
+
+
+@contextlib.contextmanager
+def time_stage(stage: str, model: str = "", batch_size: int = 1) -> Iterator[None]:
+    """
+    Time a block as an internal stage.
+
+    The block is also traced as a span. Failed blocks are recorded as well.
+
+    Args:
+        stage: Stage name
+        model: Model name, if the stage is model-specific
+        batch_size: Number of images processed by the stage
+    """
+    start_time = time.perf_counter()
+    try:
+        with start_span(stage, model=model, batch_size=batch_size):
+            yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start_time, model, batch_size)
+
+
+def observe_request(method: str, route: Optional[str], status_code: int, seconds: float) -> None:
+    """
+    Record the latency of an HTTP request.
+
+    Args:
+        method: HTTP method
+        route: Route path template (unmatched requests are grouped)
+        status_code: Response status code
+        seconds: Elapsed time in seconds
+    """
+    if get_settings().metrics_enabled:
+        REQUEST_LATENCY.observe(seconds, method, route or UNMATCHED_ROUTE, str(status_code))
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON response that records its serialization time as a stage."""
+
+    def render(self, content) -> bytes:
+        with time_stage("serialize"):
+            return super().render(content)
+
+
+def _format_labels(labels: list[tuple[str, str]]) -> str:
+    """Format label pairs as a Prometheus label set."""
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels:
+        escaped = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
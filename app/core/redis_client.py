@@ -2,9 +2,12 @@
 Redis client for shared statistics across multiple workers.
 
 Provides a centralized storage for request statistics that works
-correctly in multi-worker deployments.
+correctly in multi-worker deployments. Requests only bump in-process
+counters; a background task flushes them to Redis in bulk.
 """
 
+import asyncio
+import threading
 import time
 from typing import Optional
 
@@ -14,6 +17,8 @@ from redis.asyncio import Redis as AsyncRedis
 from app.core.config import get_settings
 from app.core.logging import logger
 
+STATS_COUNTERS = ("request_count", "success_count", "error_count")
+
 
 class RedisStatsManager:
     """Manager for request statistics using Redis."""
@@ -23,6 +28,9 @@ class RedisStatsManager:
         self.settings = get_settings()
         self._redis: Optional[Redis] = None
         self._async_redis: Optional[AsyncRedis] = None
+        self._pending = dict.fromkeys(STATS_COUNTERS, 0)
+        self._pending_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
 
     def get_redis(self) -> redis.Redis:
         """
@@ -62,30 +70,100 @@ class RedisStatsManager:
         """
         Increment request counters.
 
+        Only updates in-process counters; no network I/O happens on the
+        request path. Counts reach Redis on the next flush().
+
         Args:
             success: Whether the request was successful
         """
-        try:
-            r = self.get_redis()
-            pipe = r.pipeline()
-            pipe.incr("stats:request_count")
+        with self._pending_lock:
+            self._pending["request_count"] += 1
             if success:
-                pipe.incr("stats:success_count")
+                self._pending["success_count"] += 1
             else:
-                pipe.incr("stats:error_count")
-            pipe.execute()
+                self._pending["error_count"] += 1
+
+    def _take_pending(self) -> dict[str, int]:
+        """Atomically take and reset the unflushed counter deltas."""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = dict.fromkeys(STATS_COUNTERS, 0)
+        return pending
+
+    def _restore_pending(self, deltas: dict[str, int]) -> None:
+        """Put back deltas that could not be flushed."""
+        with self._pending_lock:
+            for name, value in deltas.items():
+                self._pending[name] += value
+
+    def _peek_pending(self) -> dict[str, int]:
+        """Get a snapshot of the unflushed counter deltas."""
+        with self._pending_lock:
+            return dict(self._pending)
+
+    async def flush(self) -> None:
+        """
+        Flush local counter deltas to Redis with a single INCRBY pipeline.
+
+        Deltas are kept for the next flush if Redis is unavailable.
+        """
+        deltas = self._take_pending()
+        if not any(deltas.values()):
+            return
+
+        try:
+            r = await self.get_async_redis()
+            pipe = r.pipeline()
+            for name, value in deltas.items():
+                if value:
+                    pipe.incrby(f"stats:{name}", value)
+            await pipe.execute()
         except Exception as e:
-            logger.error(f"Failed to increment request count in Redis: {e}")
-            # Fallback to local counters if Redis is unavailable
-            # Note: This won't be accurate across workers, but prevents crashes
+            logger.error(f"Failed to flush request counts to Redis: {e}")
+            self._restore_pending(deltas)
+
+    async def _run_flusher(self, interval: float) -> None:
+        """Flush counters periodically until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+    def start_flusher(self, interval: Optional[float] = None) -> None:
+        """
+        Start the background flush task on the running event loop.
+
+        Args:
+            interval: Seconds between flushes (defaults to the
+                stats_flush_interval_seconds setting)
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        if interval is None:
+            interval = self.settings.stats_flush_interval_seconds
+        self._flush_task = asyncio.create_task(self._run_flusher(interval))
+
+    async def stop_flusher(self) -> None:
+        """Stop the background flush task and flush remaining counts."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
 
     async def get_request_stats(self) -> dict:
         """
         Get current request statistics.
 
+        Flushed totals from Redis are merged with this worker's unflushed
+        local deltas.
+
         Returns:
             Dictionary with statistics
         """
+        pending = self._peek_pending()
         try:
             r = await self.get_async_redis()
             pipe = r.pipeline()
@@ -110,23 +188,27 @@ class RedisStatsManager:
             else:
                 start_time = float(start_time)
 
+            request_count = int(request_count) + pending["request_count"]
+            success_count = int(success_count) + pending["success_count"]
+            error_count = int(error_count) + pending["error_count"]
+
             uptime = time.time() - start_time
-            rps = int(request_count) / uptime if uptime > 0 else 0
+            rps = request_count / uptime if uptime > 0 else 0
 
             return {
-                "total_requests": int(request_count),
-                "successful_requests": int(success_count),
-                "failed_requests": int(error_count),
+                "total_requests": request_count,
+                "successful_requests": success_count,
+                "failed_requests": error_count,
                 "uptime_seconds": uptime,
                 "requests_per_second": rps
             }
         except Exception as e:
             logger.error(f"Failed to get request stats from Redis: {e}")
-            # Return empty stats if Redis is unavailable
+            # Return this worker's unflushed counts if Redis is unavailable
             return {
-                "total_requests": 0,
-                "successful_requests": 0,
-                "failed_requests": 0,
+                "total_requests": pending["request_count"],
+                "successful_requests": pending["success_count"],
+                "failed_requests": pending["error_count"],
                 "uptime_seconds": 0,
                 "requests_per_second": 0,
                 "error": "Redis unavailable"
@@ -134,6 +216,7 @@ class RedisStatsManager:
 
     def reset_stats(self) -> None:
         """Reset all statistics."""
+        self._take_pending()
         try:
             r = self.get_redis()
             pipe = r.pipeline()
@@ -183,3 +266,13 @@ async def get_request_stats() -> dict:
 def reset_stats() -> None:
     """Reset all statistics."""
     _stats_manager.reset_stats()
+
+
+def start_stats_flusher() -> None:
+    """Start flushing request counters to Redis in the background."""
+    _stats_manager.start_flusher()
+
+
+async def stop_stats_flusher() -> None:
+    """Stop the background flusher and flush remaining counters."""
+    await _stats_manager.stop_flusher()
@@ -0,0 +1,177 @@
+"""
+Content-addressed cache for inference results.
+
+Results are keyed by a digest of the image bytes, the identity and version
+of the models involved, and the request parameters. Entries live in an
+in-process LRU bounded by a byte budget, with an optional shared Redis
+tier (with TTL) so that workers can reuse each other's results.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.core.redis_client import get_stats_manager
+
+REDIS_KEY_PREFIX = "result_cache:"
+
+
+def make_cache_key(
+    namespace: str,
+    image_digest: str,
+    model_version: str,
+    params: Optional[dict[str, Any]] = None
+) -> str:
+    """
+    Build a cache key.
+
+    Args:
+        namespace: Endpoint or model namespace (e.g. "aircraft", "review")
+        image_digest: Digest of the image bytes
+        model_version: Identity and version of the models producing the result
+        params: Request parameters that influence the result
+
+    Returns:
+        Cache key string
+    """
+    payload = json.dumps(
+        {"model": model_version, "params": params or {}},
+        sort_keys=True,
+        default=str
+    )
+    params_digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    return f"{namespace}:{image_digest}:{params_digest}"
+
+
+class ResultCache:
+    """Two-tier (memory LRU + optional Redis) inference result cache."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        redis_enabled: bool = False,
+        ttl_seconds: int = 3600
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget for the in-process tier
+            redis_enabled: Whether to use the shared Redis tier
+            ttl_seconds: TTL of entries in the Redis tier
+        """
+        self.max_bytes = max_bytes
+        self.redis_enabled = redis_enabled
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._bytes = 0
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached result data, or None on miss
+        """
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+            self._memory_hits += 1
+            return json.loads(payload)
+
+        if self.redis_enabled:
+            try:
+                r = await get_stats_manager().get_async_redis()
+                payload = await r.get(REDIS_KEY_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Result cache Redis lookup failed: {e}")
+                payload = None
+
+            if payload is not None:
+                self._redis_hits += 1
+                self._store_local(key, payload)
+                return json.loads(payload)
+
+        self._misses += 1
+        return None
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Cache key from make_cache_key()
+            value: JSON-serializable result data
+        """
+        payload = json.dumps(value, default=str)
+        self._store_local(key, payload)
+
+        if self.redis_enabled:
+            try:
+                r = await get_stats_manager().get_async_redis()
+                await r.set(REDIS_KEY_PREFIX + key, payload, ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Result cache Redis store failed: {e}")
+
+    def _store_local(self, key: str, payload: str) -> None:
+        """Insert into the LRU tier, evicting old entries to stay within budget."""
+        size = len(key) + len(payload)
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(key) + len(previous)
+
+        self._entries[key] = payload
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            old_key, old_payload = self._entries.popitem(last=False)
+            self._bytes -= len(old_key) + len(old_payload)
+
+    def clear(self) -> None:
+        """Drop all in-process entries and reset counters."""
+        self._entries.clear()
+        self._bytes = 0
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counters and memory usage."""
+        return {
+            "hits": self._memory_hits + self._redis_hits,
+            "memory_hits": self._memory_hits,
+            "redis_hits": self._redis_hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get or create the process-wide result cache."""
+    global _result_cache
+    if _result_cache is None:
+        settings = get_settings()
+        _result_cache = ResultCache(
+            max_bytes=settings.result_cache_max_mb * 1024 * 1024,
+            redis_enabled=settings.result_cache_redis_enabled and settings.redis_enabled,
+            ttl_seconds=settings.result_cache_ttl_seconds
+        )
+    return _result_cache
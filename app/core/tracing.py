@@ -0,0 +1,397 @@
+"""
+Lightweight request tracing.
+
+Every request gets a request ID and a root span; stages measured inside
+it (BaseService.measure_time, time_stage) become nested child spans, and
+batch items become child spans of their batch. Finished spans are handed
+to a pluggable exporter: an in-memory ring buffer that the debug endpoint
+queries, or a JSON-lines file in the OTLP/JSON span layout.
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional, Protocol
+
+from app.core.config import get_settings
+from app.core.logging import logger
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+
+@dataclass
+class Span:
+    """A timed operation within a request."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    request_id: Optional[str]
+    start_time_ns: int
+    end_time_ns: Optional[int] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Span duration in milliseconds, or None while running."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a span attribute."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dictionary representation."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "request_id": self.request_id,
+            "start_time_ns": self.start_time_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Span in the OTLP/JSON layout."""
+        attributes = dict(self.attributes)
+        if self.request_id is not None:
+            attributes["request.id"] = self.request_id
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or self.start_time_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+            ],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+
+
+class SpanExporter(Protocol):
+    """Receives finished spans."""
+
+    def export(self, span: Span) -> None:
+        """Export a finished span."""
+
+
+class RingBufferExporter:
+    """Keeps the most recent spans in memory, indexed by request ID."""
+
+    def __init__(self, max_spans: int = 10000):
+        """
+        Initialize the buffer.
+
+        Args:
+            max_spans: Maximum number of spans kept
+        """
+        self.max_spans = max_spans
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Store a finished span, dropping the oldest when full."""
+        with self._lock:
+            self._spans.append(span)
+
+    def get_trace(self, request_id: str) -> list[Span]:
+        """Get the spans of a request, in start order."""
+        with self._lock:
+            spans = [s for s in self._spans if s.request_id == request_id]
+        return sorted(spans, key=lambda s: s.start_time_ns)
+
+    def recent_requests(self, limit: int = 50) -> list[dict[str, Any]]:
+        """
+        Summarize the most recent requests.
+
+        Returns:
+            Root span summaries, newest first
+        """
+        with self._lock:
+            roots = [s for s in self._spans if s.parent_id is None and s.request_id is not None]
+        roots.sort(key=lambda s: s.start_time_ns, reverse=True)
+        return [
+            {
+                "request_id": s.request_id,
+                "name": s.name,
+                "start_time_ns": s.start_time_ns,
+                "duration_ms": s.duration_ms,
+                "attributes": dict(s.attributes),
+            }
+            for s in roots[:limit]
+        ]
+
+    def clear(self) -> None:
+        """Drop all stored spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonFileExporter:
+    """
+    Appends spans as OTLP/JSON lines to a file.
+
+    Spans are queued and serialized and written by a background thread, so
+    exporting never blocks the event loop on file I/O. When the writer
+    falls behind by max_queue spans, further spans are dropped.
+    """
+
+    def __init__(self, path: str, service_name: str = "aerovision", max_queue: int = 10000):
+        """
+        Initialize the exporter and start its writer thread.
+
+        Args:
+            path: Output file path (one ExportTraceServiceRequest per line)
+            service_name: service.name resource attribute
+            max_queue: Maximum number of spans waiting to be written
+        """
+        self.path = Path(path)
+        self.service_name = service_name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: queue.Queue[Optional[Span]] = queue.Queue(maxsize=max_queue)
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        """Queue a finished span for writing."""
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self._dropped += 1
+
+    def flush(self) -> None:
+        """Wait until all queued spans are written."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write the queued spans and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _to_line(self, span: Span) -> str:
+        """Serialize a span as an ExportTraceServiceRequest line."""
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": self.service_name}},
+                    {"key": "process.pid", "value": {"intValue": str(os.getpid())}},
+                ]},
+                "scopeSpans": [{"scope": {"name": "app.core.tracing"}, "spans": [span.to_otlp()]}],
+            }]
+        }
+        return json.dumps(payload, default=str)
+
+    def _run(self) -> None:
+        """Write queued spans in batches until closed."""
+        stopping = False
+        while not stopping:
+            spans = [self._queue.get()]
+            while True:
+                try:
+                    spans.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = None in spans
+            lines = [self._to_line(span) for span in spans if span is not None]
+            try:
+                if lines:
+                    with self.path.open("a", encoding="utf-8") as f:
+                        f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                logger.warning(f"Failed to export {len(lines)} spans: {e}")
+            finally:
+                for _ in spans:
+                    self._queue.task_done()
+
+            if self._dropped:
+                logger.warning(f"Dropped {self._dropped} spans: trace writer is behind")
+                self._dropped = 0
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "aerovision_current_span", default=None
+)
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "aerovision_request_id", default=None
+)
+
+_exporter: Optional[SpanExporter] = None
+_exporter_configured = False
+_exporter_lock = threading.Lock()
+
+
+def get_exporter() -> Optional[SpanExporter]:
+    """
+    Get the configured span exporter.
+
+    Chosen by the tracing_exporter setting: "memory" (ring buffer),
+    "file" (OTLP/JSON lines) or "none". Returns None when tracing is off.
+    """
+    global _exporter, _exporter_configured
+    if _exporter_configured:
+        return _exporter
+
+    with _exporter_lock:
+        if not _exporter_configured:
+            settings = get_settings()
+            if not settings.tracing_enabled or settings.tracing_exporter == "none":
+                _exporter = None
+            elif settings.tracing_exporter == "file":
+                _exporter = JsonFileExporter(settings.tracing_file_path, settings.app_name)
+            else:
+                _exporter = RingBufferExporter(settings.tracing_buffer_size)
+            _exporter_configured = True
+    return _exporter
+
+
+def set_exporter(exporter: Optional[SpanExporter]) -> None:
+    """Replace the span exporter (None disables tracing)."""
+    global _exporter, _exporter_configured
+    with _exporter_lock:
+        _exporter = exporter
+        _exporter_configured = True
+
+
+def reset_exporter() -> None:
+    """Close the exporter and forget it, so it is rebuilt from settings on next use."""
+    global _exporter, _exporter_configured
+    with _exporter_lock:
+        exporter, _exporter = _exporter, None
+        _exporter_configured = False
+    close = getattr(exporter, "close", None)
+    if close is not None:
+        close()
+
+
+def get_request_id() -> Optional[str]:
+    """Get the ID of the request being handled, if any."""
+    return _request_id.get()
+
+
+def get_current_span() -> Optional[Span]:
+    """Get the innermost active span, if any."""
+    return _current_span.get()
+
+
+def new_request_id() -> str:
+    """Generate a request ID."""
+    return uuid.uuid4().hex
+
+
+@contextlib.contextmanager
+def request_context(request_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Bind a request ID to the current context.
+
+    Args:
+        request_id: Incoming request ID, generated when missing
+
+    Yields:
+        The request ID in effect
+    """
+    request_id = request_id or new_request_id()
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+@contextlib.contextmanager
+def start_span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Open a span as a child of the current span.
+
+    Spans opened with no active span start a new trace. Exceptions are
+    recorded on the span and re-raised. Yields None when tracing is off.
+
+    Args:
+        name: Span name
+        **attributes: Initial span attributes
+    """
+    exporter = get_exporter()
+    if exporter is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent is not None else uuid.uuid4().hex,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent is not None else None,
+        request_id=_request_id.get(),
+        start_time_ns=time.time_ns(),
+        attributes=attributes,
+    )
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.end_time_ns = time.time_ns()
+        _current_span.reset(token)
+        try:
+            exporter.export(span)
+        except Exception as e:
+            logger.warning(f"Failed to export span {name}: {e}")
+
+
+def build_span_tree(spans: list[Span]) -> list[dict[str, Any]]:
+    """
+    Nest spans under their parents.
+
+    Args:
+        spans: Spans of one request
+
+    Returns:
+        Root span dictionaries, each with a "children" list
+    """
+    nodes: OrderedDict[str, dict[str, Any]] = OrderedDict()
+    for span in sorted(spans, key=lambda s: s.start_time_ns):
+        node = span.to_dict()
+        node["children"] = []
+        nodes[span.span_id] = node
+
+    roots = []
+    for node in nodes.values():
+        parent = nodes.get(node["parent_id"]) if node["parent_id"] else None
+        if parent is not None:
+            parent["children"].append(node)
+        else:
+            roots.append(node)
+    return roots
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Convert an attribute value to an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -9,6 +9,17 @@ from app.inference.factory import (
     InferenceFactoryError,
     INFERENCE_AVAILABLE,
 )
+from app.inference.executors import (
+    InferenceExecutor,
+    get_batch_pool,
+    get_inference_executor,
+    get_executor_stats,
+    shutdown_executors,
+)
+from app.inference.registry import (
+    ModelRegistry,
+    get_model_registry,
+)
 from app.inference.wrappers import (
     wrap_quality_result,
     wrap_aircraft_result,
@@ -20,6 +31,13 @@ __all__ = [
     "InferenceFactory",
     "InferenceFactoryError",
     "INFERENCE_AVAILABLE",
+    "InferenceExecutor",
+    "get_batch_pool",
+    "get_inference_executor",
+    "get_executor_stats",
+    "shutdown_executors",
+    "ModelRegistry",
+    "get_model_registry",
     "wrap_quality_result",
     "wrap_aircraft_result",
     "wrap_airline_result",
@@ -0,0 +1,187 @@
+"""
+Dedicated, bounded thread pools for running blocking inference.
+
+Each model gets its own executor with a concurrency limit and a queue
+bound, so a slow model (e.g. remote OCR) cannot starve the others or the
+event loop. Submissions beyond the queue bound are rejected with
+RateLimitError instead of piling up.
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.config import get_settings
+from app.core.exceptions import RateLimitError
+from app.core.logging import logger
+
+DEFAULT_MAX_WORKERS = 1
+DEFAULT_MAX_QUEUE = 32
+DEFAULT_BATCH_WORKERS = 4
+
+
+class InferenceExecutor:
+    """Thread pool with a hard bound on running plus queued work items."""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        """
+        Initialize the executor.
+
+        Args:
+            name: Model name, used for thread names and error messages
+            max_workers: Maximum number of concurrently running calls
+            max_queue: Maximum number of calls waiting for a free worker
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"inference-{name}"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of calls currently running or queued."""
+        return self._pending
+
+    @property
+    def available(self) -> int:
+        """Number of calls that can be submitted before the executor is at capacity."""
+        return max(0, self.max_workers + self.max_queue - self._pending)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Submit a call to the pool.
+
+        The caller's context variables are propagated to the worker thread.
+
+        Raises:
+            RateLimitError: If the executor is at capacity
+        """
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                raise RateLimitError(f"{self.name} inference queue is full")
+            self._pending += 1
+
+        try:
+            context = contextvars.copy_context()
+            future = self._pool.submit(context.run, func, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the pool and await its result."""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def stats(self) -> dict[str, Any]:
+        """Get current executor statistics."""
+        return {
+            "name": self.name,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying pool."""
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+_executors: dict[str, InferenceExecutor] = {}
+_batch_pools: dict[str, Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_inference_executor(name: str) -> InferenceExecutor:
+    """
+    Get or create the executor for a model.
+
+    Sizes come from the ``executor_workers`` and ``executor_queue_sizes``
+    settings, keyed by model name.
+
+    Args:
+        name: Model name (quality, aircraft, airline, registration)
+
+    Returns:
+        InferenceExecutor instance for the model
+    """
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+
+    with _executors_lock:
+        if name not in _executors:
+            settings = get_settings()
+            _executors[name] = InferenceExecutor(
+                name,
+                max_workers=settings.executor_workers.get(name, DEFAULT_MAX_WORKERS),
+                max_queue=settings.executor_queue_sizes.get(name, DEFAULT_MAX_QUEUE)
+            )
+            logger.info(
+                f"Created {name} inference executor "
+                f"(workers={_executors[name].max_workers}, queue={_executors[name].max_queue})"
+            )
+        return _executors[name]
+
+
+def get_batch_pool(name: str) -> Executor:
+    """
+    Get or create the pool used to fan a batch out across images.
+
+    Batch calls already hold a slot on the model's inference executor; the
+    batch pool only parallelises the per-image work inside that call. Sizes
+    come from the ``batch_pool_workers`` setting, keyed by model name.
+
+    Args:
+        name: Model name (quality, registration)
+
+    Returns:
+        Executor shared by all batches of the model
+    """
+    pool = _batch_pools.get(name)
+    if pool is not None:
+        return pool
+
+    with _executors_lock:
+        if name not in _batch_pools:
+            workers = get_settings().batch_pool_workers.get(name, DEFAULT_BATCH_WORKERS)
+            _batch_pools[name] = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix=f"batch-{name}"
+            )
+            logger.info(f"Created {name} batch pool (workers={workers})")
+        return _batch_pools[name]
+
+
+def get_executor_stats() -> list[dict[str, Any]]:
+    """Get statistics for all created executors."""
+    return [executor.stats() for executor in _executors.values()]
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down and forget all executors and batch pools."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
+        for pool in _batch_pools.values():
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+        _batch_pools.clear()
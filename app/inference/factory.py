@@ -3,33 +3,75 @@ Inference model factory for loading and managing aerovision_inference components
 
 This module provides a singleton factory for lazy-loading inference models from
 the aerovision_inference package.
+
+The package (and torch with it) is only imported when the first model is
+loaded, so control-plane endpoints can be imported and served without it.
 """
 
+import gc
+import importlib
+import importlib.util
+import sys
 import threading
-from functools import lru_cache
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, Sequence
 
 from app.core.config import get_settings
 from app.core.logging import logger
+from app.inference.registry import get_model_registry
+
+INFERENCE_PACKAGE = "aerovision_inference"
+
+
+def _inference_package_installed() -> bool:
+    """Check whether aerovision_inference can be imported, without importing it."""
+    if INFERENCE_PACKAGE in sys.modules:
+        return sys.modules[INFERENCE_PACKAGE] is not None
+    try:
+        return importlib.util.find_spec(INFERENCE_PACKAGE) is not None
+    except (ImportError, ValueError):
+        return False
+
 
-# Try to import from aerovision_inference
 # Allow graceful degradation if not available
-try:
-    from aerovision_inference import (
-        AircraftClassifier,
-        AirlineClassifier,
-        RegistrationOCR,
-        QualityAssessor,
-    )
-    INFERENCE_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"aerovision_inference not available: {e}")
-    INFERENCE_AVAILABLE = False
-    AircraftClassifier = None  # type: ignore
-    AirlineClassifier = None  # type: ignore
-    RegistrationOCR = None  # type: ignore
-    QualityAssessor = None  # type: ignore
+INFERENCE_AVAILABLE = _inference_package_installed()
+if not INFERENCE_AVAILABLE:
+    logger.warning(f"{INFERENCE_PACKAGE} not available")
+
+# aerovision_inference classes, imported on first model load by _inference_class()
+AircraftClassifier = None  # type: ignore
+AirlineClassifier = None  # type: ignore
+RegistrationOCR = None  # type: ignore
+QualityAssessor = None  # type: ignore
+
+
+def _inference_class(name: str) -> Any:
+    """
+    Get an aerovision_inference class, importing the package on first use.
+
+    The class is cached in this module's namespace, where tests can patch it.
+
+    Raises:
+        InferenceFactoryError: If the package cannot be imported
+    """
+    value = globals()[name]
+    if value is None:
+        try:
+            value = getattr(importlib.import_module(INFERENCE_PACKAGE), name)
+        except (ImportError, AttributeError) as e:
+            raise InferenceFactoryError(f"{INFERENCE_PACKAGE} could not be imported: {e}")
+        globals()[name] = value
+    return value
+
+
+def _embedding_model(classifier: Any) -> Optional[Any]:
+    """Get the model a classifier embeds with: itself or the ultralytics model it wraps."""
+    for candidate in (classifier, getattr(classifier, "model", None)):
+        if callable(getattr(candidate, "embed", None)):
+            return candidate
+    return None
 
 
 class InferenceFactoryError(Exception):
@@ -38,6 +80,20 @@ class InferenceFactoryError(Exception):
     pass
 
 
+# Model names managed by the factory
+MODEL_NAMES = ("aircraft", "airline", "registration", "quality")
+
+# Model lifecycle: not_loaded -> loading -> loaded -> warming -> ready;
+# failed when loading raised
+MODEL_STATES = ("not_loaded", "loading", "loaded", "warming", "ready", "failed")
+
+# Classifiers that can be swapped at runtime: factory slot and aerovision_inference class
+SWAPPABLE_MODELS = {
+    "aircraft": ("_aircraft_classifier", "AircraftClassifier"),
+    "airline": ("_airline_classifier", "AirlineClassifier"),
+}
+
+
 class InferenceFactory:
     """
     Factory for managing inference models from aerovision_inference.
@@ -51,6 +107,27 @@ class InferenceFactory:
     _registration_ocr: Optional[RegistrationOCR] = None
     _quality_assessor: Optional[QualityAssessor] = None
 
+    # Cached model identity/version strings, keyed by model name
+    _model_versions: dict[str, str] = {}
+
+    # Weights swapped in by swap_classifier() in place of the configured ones
+    _weights_overrides: dict[str, Path] = {}
+
+    # Torch classifiers loaded only to embed with, when the serving backend cannot
+    _embedding_classifiers: dict[str, Any] = {}
+    _embedding_lock = threading.Lock()
+
+    # Guards each classifier slot together with its version; swaps run one at a time
+    _serving_lock = threading.Lock()
+    _swap_lock = threading.Lock()
+
+    # Lifecycle state and last load time per model name (see MODEL_STATES)
+    _model_states: dict[str, str] = {}
+    _load_seconds: dict[str, float] = {}
+    # Models loaded on a later use after failing, still to be warmed up
+    _retried_loads: set[str] = set()
+    _model_states_lock = threading.Lock()
+
     # Thread-safe locks for lazy initialization
     _aircraft_classifier_lock = threading.Lock()
     _airline_classifier_lock = threading.Lock()
@@ -74,6 +151,244 @@ class InferenceFactory:
         settings = get_settings()
         return settings.device
 
+    @classmethod
+    def resolve_classifier_path(cls, name: str) -> Path:
+        """Resolve the weights file for a classifier: swapped-in weights, else the configured ones."""
+        override = cls._weights_overrides.get(name)
+        if override is not None:
+            return override
+        return cls._configured_classifier_path(name)
+
+    @classmethod
+    def _configured_classifier_path(cls, name: str) -> Path:
+        """Resolve the configured weights file for a classifier, falling back to the shared best.pt."""
+        model_path = cls.get_model_dir() / name / "best.pt"
+        if not model_path.exists():
+            model_path = cls.get_model_dir() / "best.pt"
+        return model_path
+
+    @classmethod
+    def get_model_version(cls, name: str) -> str:
+        """
+        Get an identity/version string for a model.
+
+        Classifier versions are derived from the content hash of the weights
+        file; OCR and quality versions from their configuration.
+        The model does not need to be loaded.
+
+        Args:
+            name: Model name (aircraft, airline, registration, quality)
+
+        Returns:
+            Version string that changes whenever the model's outputs may change
+
+        Raises:
+            ValueError: If the model name is unknown
+        """
+        version = cls._model_versions.get(name)
+        if version is not None:
+            return version
+
+        settings = get_settings()
+        if name in ("aircraft", "airline"):
+            model_path = cls.resolve_classifier_path(name)
+            if not model_path.exists():
+                # Not cached: the weights file may appear later
+                return f"{name}:{model_path}:missing"
+            version = cls._classifier_version(name, model_path)
+        elif name == "registration":
+            version = (
+                f"registration:{settings.ocr_mode}:{settings.ocr_lang}:"
+                f"{settings.use_angle_cls}:{settings.qwen_model}"
+            )
+        elif name == "quality":
+            version = (
+                f"quality:{settings.sharpness_weight}:{settings.exposure_weight}:"
+                f"{settings.composition_weight}:{settings.noise_weight}:"
+                f"{settings.color_weight}:{settings.quality_pass_threshold}"
+            )
+        else:
+            raise ValueError(f"Unknown model: {name}")
+
+        cls._model_versions[name] = version
+        return version
+
+    @classmethod
+    def _classifier_version(cls, name: str, model_path: Path) -> str:
+        """Get the version of a classifier served from the given weights file."""
+        settings = get_settings()
+        version = f"{name}:{get_model_registry().file_digest(model_path)[:16]}"
+        if settings.inference_backend != "torch":
+            version += f":{settings.inference_backend}"
+        if cls._quantized_artifact(name, model_path) is not None:
+            version += f":int8-{settings.classifier_quantization}"
+        return version
+
+    @classmethod
+    def _quantized_artifact(cls, name: str, model_path: Path) -> Optional[Path]:
+        """
+        Get the quantized model to run for a classifier, if one is configured and accepted.
+
+        An artifact that is missing or below the agreement floors is refused
+        and the float ONNX model is used instead.
+
+        Args:
+            name: Classifier name (aircraft, airline)
+            model_path: Path to the classifier's .pt weights
+
+        Returns:
+            Path to the quantized ONNX model, or None to run the float model
+        """
+        settings = get_settings()
+        if settings.inference_backend != "onnx" or settings.classifier_quantization == "none":
+            return None
+
+        from app.inference.quantization import QuantizationError, check_quantized_artifact
+
+        try:
+            return check_quantized_artifact(model_path, settings.classifier_quantization)
+        except QuantizationError as e:
+            logger.error(f"Using the float {name} classifier: {e}")
+            return None
+
+    @classmethod
+    def _load_classifier(cls, name: str, class_name: str, model_path: Optional[Path] = None) -> Any:
+        """
+        Load a classifier through the model registry on the configured backend.
+
+        Args:
+            name: Classifier name (aircraft, airline)
+            class_name: aerovision_inference class used by the torch backend
+            model_path: Weights file; resolve_classifier_path() by default
+
+        Returns:
+            Classifier instance with a predict(images, top_k) method
+        """
+        if model_path is None:
+            model_path = cls.resolve_classifier_path(name)
+            # Pin the version to the weights being loaded
+            cls.get_model_version(name)
+        device = cls.get_device()
+
+        if get_settings().inference_backend == "onnx":
+            from app.inference.onnx_backend import OnnxClassifier
+
+            quantized_path = cls._quantized_artifact(name, model_path)
+            if quantized_path is not None:
+                logger.info(f"Loading {name} classifier from {quantized_path} on ONNX Runtime")
+                return get_model_registry().get(
+                    f"{name}_classifier_onnx_int8",
+                    [model_path, quantized_path],
+                    lambda: OnnxClassifier.from_weights(model_path, device, onnx_path=quantized_path),
+                    device=f"onnx:{device}",
+                    user=name,
+                    wrapper="OnnxClassifier"
+                )
+
+            logger.info(f"Loading {name} classifier from {model_path} on ONNX Runtime")
+            return get_model_registry().get(
+                f"{name}_classifier_onnx",
+                [model_path],
+                lambda: OnnxClassifier.from_weights(model_path, device),
+                device=f"onnx:{device}",
+                user=name,
+                wrapper="OnnxClassifier"
+            )
+
+        classifier_class = _inference_class(class_name)
+        logger.info(f"Loading {name} classifier from {model_path}")
+        return get_model_registry().get(
+            f"{name}_classifier",
+            [model_path],
+            lambda: classifier_class(model_path=str(model_path), device=device),
+            device=device,
+            user=name,
+            wrapper=class_name
+        )
+
+    @classmethod
+    def get_model_states(cls) -> dict[str, str]:
+        """Get the lifecycle state of every model."""
+        with cls._model_states_lock:
+            return {name: cls._model_states.get(name, "not_loaded") for name in MODEL_NAMES}
+
+    @classmethod
+    def set_model_state(cls, name: str, state: str) -> None:
+        """
+        Set the lifecycle state of a model.
+
+        Raises:
+            ValueError: If the state is unknown
+        """
+        if state not in MODEL_STATES:
+            raise ValueError(f"Unknown model state: {state}")
+        with cls._model_states_lock:
+            cls._model_states[name] = state
+
+    @classmethod
+    def get_load_seconds(cls) -> dict[str, float]:
+        """Get the load time of each model loaded in this process."""
+        with cls._model_states_lock:
+            return dict(cls._load_seconds)
+
+    @classmethod
+    def _load_tracked(cls, name: str, load: Callable[[], Any]) -> Any:
+        """Run a model load, recording its lifecycle state and load time."""
+        with cls._model_states_lock:
+            retry = cls._model_states.get(name) == "failed"
+        cls.set_model_state(name, "loading")
+        start_time = time.perf_counter()
+        try:
+            instance = load()
+        except Exception:
+            cls.set_model_state(name, "failed")
+            raise
+        with cls._model_states_lock:
+            cls._load_seconds[name] = time.perf_counter() - start_time
+            if retry:
+                cls._retried_loads.add(name)
+        cls.set_model_state(name, "loaded")
+        return instance
+
+    @classmethod
+    def _warm_up_retried_load(cls, name: str) -> None:
+        """
+        Warm up a model that loaded on a later use after failing to load.
+
+        The startup warm-up only covers models that loaded then, so without
+        this a model whose preload failed would never become ready. Called
+        once the model is in its slot, outside its load lock.
+        """
+        with cls._model_states_lock:
+            if name not in cls._retried_loads:
+                return
+            cls._retried_loads.discard(name)
+
+        from app.inference.warmup import warm_up_model
+
+        warm_up_model(name)
+
+    @classmethod
+    def _load_into_slot(cls, name: str) -> None:
+        """
+        Load a classifier on first use and put it in its slot.
+
+        The slot is re-checked under the lock swap_classifier() assigns it
+        under: if a swap filled it while this load ran, the swapped-in model
+        keeps serving and the copy loaded here is released.
+        """
+        slot, class_name = SWAPPABLE_MODELS[name]
+        instance = cls._load_tracked(name, lambda: cls._load_classifier(name, class_name))
+        with cls._serving_lock:
+            current = getattr(cls, slot)
+            if current is None:
+                setattr(cls, slot, instance)
+        if current is not None:
+            # swap_classifier() leaves the model ready
+            cls.set_model_state(name, "ready")
+            if current is not instance:
+                get_model_registry().release(instance, user=name)
+
     @classmethod
     def get_aircraft_classifier(cls) -> AircraftClassifier:
         """
@@ -92,16 +407,9 @@ class InferenceFactory:
         if cls._aircraft_classifier is None:
             with cls._aircraft_classifier_lock:
                 if cls._aircraft_classifier is None:
-                    model_path = cls.get_model_dir() / "aircraft" / "best.pt"
-                    if not model_path.exists():
-                        model_path = cls.get_model_dir() / "best.pt"
-
-                    logger.info(f"Loading aircraft classifier from {model_path}")
-                    cls._aircraft_classifier = AircraftClassifier(
-                        model_path=str(model_path),
-                        device=cls.get_device()
-                    )
+                    cls._load_into_slot("aircraft")
                     logger.info("Aircraft classifier loaded successfully")
+            cls._warm_up_retried_load("aircraft")
 
         return cls._aircraft_classifier
 
@@ -123,16 +431,9 @@ class InferenceFactory:
         if cls._airline_classifier is None:
             with cls._airline_classifier_lock:
                 if cls._airline_classifier is None:
-                    model_path = cls.get_model_dir() / "airline" / "best.pt"
-                    if not model_path.exists():
-                        model_path = cls.get_model_dir() / "best.pt"
-
-                    logger.info(f"Loading airline classifier from {model_path}")
-                    cls._airline_classifier = AirlineClassifier(
-                        model_path=str(model_path),
-                        device=cls.get_device()
-                    )
+                    cls._load_into_slot("airline")
                     logger.info("Airline classifier loaded successfully")
+            cls._warm_up_retried_load("airline")
 
         return cls._airline_classifier
 
@@ -154,23 +455,9 @@ class InferenceFactory:
         if cls._registration_ocr is None:
             with cls._registration_ocr_lock:
                 if cls._registration_ocr is None:
-                    settings = get_settings()
-                    ocr_mode = settings.ocr_mode
-                    ocr_lang = settings.ocr_lang
-                    use_angle_cls = settings.use_angle_cls
-                    qwen_model = settings.qwen_model
-                    ocr_timeout = settings.ocr_timeout
-
-                    logger.info(f"Loading registration OCR in {ocr_mode} mode")
-                    cls._registration_ocr = RegistrationOCR(
-                        mode=ocr_mode,
-                        lang=ocr_lang,
-                        use_angle_cls=use_angle_cls,
-                        qwen_model=qwen_model,
-                        timeout=ocr_timeout,
-                        enabled=True
-                    )
+                    cls._registration_ocr = cls._load_tracked("registration", cls._create_registration_ocr)
                     logger.info("Registration OCR loaded successfully")
+            cls._warm_up_retried_load("registration")
 
         return cls._registration_ocr
 
@@ -192,44 +479,276 @@ class InferenceFactory:
         if cls._quality_assessor is None:
             with cls._quality_assessor_lock:
                 if cls._quality_assessor is None:
-                    settings = get_settings()
-                    sharpness_weight = settings.sharpness_weight
-                    exposure_weight = settings.exposure_weight
-                    composition_weight = settings.composition_weight
-                    noise_weight = settings.noise_weight
-                    color_weight = settings.color_weight
-                    pass_threshold = settings.quality_pass_threshold
-
-                    logger.info("Loading quality assessor")
-                    cls._quality_assessor = QualityAssessor(
-                        sharpness_weight=sharpness_weight,
-                        exposure_weight=exposure_weight,
-                        composition_weight=composition_weight,
-                        noise_weight=noise_weight,
-                        color_weight=color_weight,
-                        pass_threshold=pass_threshold
-                    )
+                    cls._quality_assessor = cls._load_tracked("quality", cls._create_quality_assessor)
                     logger.info("Quality assessor loaded successfully")
+            cls._warm_up_retried_load("quality")
 
         return cls._quality_assessor
 
     @classmethod
-    def preload_models(cls) -> None:
+    def get_serving_classifier(cls, name: str) -> tuple[Any, str]:
+        """
+        Get a classifier together with the version of the model it runs.
+
+        Both are read under the lock swap_classifier() changes them under,
+        so a caller never pairs a model with another model's version.
+
+        Args:
+            name: Classifier name (aircraft, airline)
+
+        Returns:
+            Tuple of (classifier instance, model version)
+
+        Raises:
+            ValueError: If the name is not a classifier
+            InferenceFactoryError: If inference package is not available.
         """
-        Preload all inference models.
+        if name == "aircraft":
+            cls.get_aircraft_classifier()
+        elif name == "airline":
+            cls.get_airline_classifier()
+        else:
+            raise ValueError(f"Unknown classifier: {name}")
 
-        Useful for warming up the service before handling requests.
+        slot, _ = SWAPPABLE_MODELS[name]
+        with cls._serving_lock:
+            return getattr(cls, slot), cls.get_model_version(name)
+
+    @classmethod
+    def get_embedding_model(cls, name: str) -> Any:
         """
+        Get a model that embeds images with a classifier's serving weights.
+
+        The serving classifier is used when it can embed (torch backend).
+        ONNX Runtime only runs the classification head, so on that backend
+        the torch classifier for the same weights is loaded through the
+        model registry instead; the copy for weights swapped out since is
+        released.
+
+        Args:
+            name: Classifier name (aircraft, airline)
+
+        Returns:
+            Model with an ultralytics-style embed() method
+
+        Raises:
+            ValueError: If the name is not a classifier
+            InferenceFactoryError: If inference package is not available or
+                no model can embed with the weights
+        """
+        classifier, _ = cls.get_serving_classifier(name)
+        model = _embedding_model(classifier)
+        if model is not None:
+            return model
+
+        _, class_name = SWAPPABLE_MODELS[name]
+        model_path = cls.resolve_classifier_path(name)
+        device = cls.get_device()
+        user = f"{name}_embedding"
+        with cls._embedding_lock:
+            instance = get_model_registry().get(
+                f"{name}_classifier",
+                [model_path],
+                lambda: _inference_class(class_name)(model_path=str(model_path), device=device),
+                device=device,
+                user=user,
+                wrapper=class_name
+            )
+            previous = cls._embedding_classifiers.get(name)
+            cls._embedding_classifiers[name] = instance
+        if previous is not None and previous is not instance:
+            get_model_registry().release(previous, user=user)
+
+        model = _embedding_model(instance)
+        if model is None:
+            raise InferenceFactoryError(f"{class_name} for {model_path} cannot embed images")
+        return model
+
+    @classmethod
+    def swap_classifier(cls, name: str, weights_path: Optional[str | Path] = None) -> dict[str, Any]:
+        """
+        Load new classifier weights and swap them in without interrupting serving.
+
+        The new model is loaded and warmed up while the current one keeps
+        serving; then the slot and its version are replaced together.
+        Requests that already hold the old model finish on it. The factory
+        and the registry drop their references to it, so its memory is
+        freed as soon as those requests complete.
+
+        Only the calling process is affected; each worker swaps its own
+        model.
+
+        Args:
+            name: Classifier name (aircraft, airline)
+            weights_path: New weights file; the configured best.pt by default,
+                which picks up a best.pt replaced on disk
+
+        Returns:
+            Dictionary with the model name, previous and new version, whether
+            the model was swapped, and load and warm-up seconds
+
+        Raises:
+            ValueError: If the model cannot be swapped
+            InferenceFactoryError: If inference package is not available,
+                the weights do not exist or the new model fails to load or
+                warm up; the current model keeps serving
+        """
+        if name not in SWAPPABLE_MODELS:
+            raise ValueError(f"Model cannot be swapped: {name}")
         if not INFERENCE_AVAILABLE:
-            logger.warning("Cannot preload models: aerovision_inference not available")
-            return
+            raise InferenceFactoryError("aerovision_inference package not available")
 
-        logger.info("Preloading inference models...")
-        cls.get_aircraft_classifier()
-        cls.get_airline_classifier()
-        cls.get_registration_ocr()
-        cls.get_quality_assessor()
-        logger.info("All inference models preloaded")
+        model_path = Path(weights_path) if weights_path is not None else cls._configured_classifier_path(name)
+        if not model_path.is_file():
+            raise InferenceFactoryError(f"Weights not found: {model_path}")
+
+        slot, class_name = SWAPPABLE_MODELS[name]
+        with cls._swap_lock:
+            with cls._serving_lock:
+                old_instance = getattr(cls, slot)
+                old_version = cls.get_model_version(name) if old_instance is not None else None
+
+            version = cls._classifier_version(name, model_path)
+            swap: dict[str, Any] = {
+                "model": name,
+                "previous_version": old_version,
+                "version": version,
+                "swapped": False,
+                "load_seconds": None,
+                "warmup_seconds": None,
+            }
+            if version == old_version:
+                logger.info(f"{name} classifier already serves {version}")
+                return swap
+
+            logger.info(f"Loading {name} classifier {version} to replace {old_version}")
+            start_time = time.perf_counter()
+            try:
+                instance = cls._load_classifier(name, class_name, model_path)
+            except Exception as e:
+                raise InferenceFactoryError(f"Failed to load {model_path}: {e}")
+            swap["load_seconds"] = time.perf_counter() - start_time
+
+            if get_settings().warmup_enabled:
+                from app.inference.warmup import warm_classifier
+
+                start_time = time.perf_counter()
+                try:
+                    warm_classifier(instance)
+                except Exception as e:
+                    get_model_registry().release(instance, user=name)
+                    raise InferenceFactoryError(f"Warm-up of {model_path} failed: {e}")
+                swap["warmup_seconds"] = time.perf_counter() - start_time
+
+            with cls._serving_lock:
+                setattr(cls, slot, instance)
+                cls._model_versions[name] = version
+                if model_path == cls._configured_classifier_path(name):
+                    cls._weights_overrides.pop(name, None)
+                else:
+                    cls._weights_overrides[name] = model_path
+            with cls._model_states_lock:
+                cls._model_states[name] = "ready"
+                cls._load_seconds[name] = swap["load_seconds"]
+            swap["swapped"] = True
+
+        if old_instance is not None:
+            get_model_registry().release(old_instance, user=name)
+            del old_instance
+            gc.collect()
+        logger.info(f"Swapped {name} classifier from {old_version} to {version}")
+        return swap
+
+    @classmethod
+    def _create_registration_ocr(cls) -> RegistrationOCR:
+        """Create the registration OCR from settings."""
+        settings = get_settings()
+        ocr_mode = settings.ocr_mode
+        ocr_lang = settings.ocr_lang
+        use_angle_cls = settings.use_angle_cls
+        qwen_model = settings.qwen_model
+        ocr_timeout = settings.ocr_timeout
+
+        logger.info(f"Loading registration OCR in {ocr_mode} mode")
+        return _inference_class("RegistrationOCR")(
+            mode=ocr_mode,
+            lang=ocr_lang,
+            use_angle_cls=use_angle_cls,
+            qwen_model=qwen_model,
+            timeout=ocr_timeout,
+            enabled=True
+        )
+
+    @classmethod
+    def _create_quality_assessor(cls) -> QualityAssessor:
+        """Create the quality assessor from settings."""
+        settings = get_settings()
+        sharpness_weight = settings.sharpness_weight
+        exposure_weight = settings.exposure_weight
+        composition_weight = settings.composition_weight
+        noise_weight = settings.noise_weight
+        color_weight = settings.color_weight
+        pass_threshold = settings.quality_pass_threshold
+
+        logger.info("Loading quality assessor")
+        return _inference_class("QualityAssessor")(
+            sharpness_weight=sharpness_weight,
+            exposure_weight=exposure_weight,
+            composition_weight=composition_weight,
+            noise_weight=noise_weight,
+            color_weight=color_weight,
+            pass_threshold=pass_threshold
+        )
+
+    @classmethod
+    def preload_models(cls, names: Optional[Sequence[str]] = None) -> dict[str, Optional[float]]:
+        """
+        Preload inference models concurrently.
+
+        Each model loads on its own thread, so startup takes as long as the
+        slowest model rather than the sum of all of them. A model that
+        fails to load is logged and left in the failed state; the others
+        still become available, and the failed one is retried on first use.
+
+        Args:
+            names: Models to load (aircraft, airline, registration, quality);
+                all of them by default
+
+        Returns:
+            Load seconds per model, None for models that failed to load
+        """
+        if not INFERENCE_AVAILABLE:
+            logger.warning("Cannot preload models: aerovision_inference not available")
+            return {}
+
+        loaders: dict[str, Callable[[], Any]] = {
+            "aircraft": cls.get_aircraft_classifier,
+            "airline": cls.get_airline_classifier,
+            "registration": cls.get_registration_ocr,
+            "quality": cls.get_quality_assessor,
+        }
+        if names is None:
+            names = list(loaders)
+
+        logger.info(f"Preloading inference models: {', '.join(names)}")
+        start_time = time.perf_counter()
+        timings: dict[str, Optional[float]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(names)), thread_name_prefix="preload") as pool:
+            futures = {name: pool.submit(loaders[name]) for name in names}
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    timings[name] = cls.get_load_seconds().get(name)
+                except Exception as e:
+                    logger.error(f"Failed to preload {name} model: {e}")
+                    timings[name] = None
+
+        summary = ", ".join(
+            f"{name} {seconds:.2f}s" if seconds is not None else f"{name} failed"
+            for name, seconds in timings.items()
+        )
+        logger.info(f"Inference models preloaded in {time.perf_counter() - start_time:.2f}s ({summary})")
+        return timings
 
     @classmethod
     def reset(cls) -> None:
@@ -238,3 +757,11 @@ class InferenceFactory:
         cls._airline_classifier = None
         cls._registration_ocr = None
         cls._quality_assessor = None
+        cls._model_versions = {}
+        cls._weights_overrides = {}
+        cls._embedding_classifiers = {}
+        with cls._model_states_lock:
+            cls._model_states = {}
+            cls._load_seconds = {}
+            cls._retried_loads = set()
+        get_model_registry().clear()
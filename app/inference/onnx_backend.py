@@ -0,0 +1,239 @@
+"""
+ONNX Runtime backend for the image classifiers.
+
+The PyTorch (.pt) classifier weights are exported to ONNX once, cached by
+content hash under the ONNX cache directory, and run with ONNX Runtime
+using full graph optimisation and configurable intra/inter-op threads.
+``OnnxClassifier.predict`` returns the same result layout as the
+aerovision_inference classifiers, so services and wrappers are unchanged.
+
+Requires the optional ``onnxruntime`` package (and ``ultralytics`` with
+``onnx`` for the one-time export).
+"""
+
+import ast
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+from PIL import Image
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.inference.registry import get_model_registry
+
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ort = None  # type: ignore
+    ONNX_AVAILABLE = False
+
+# Top-k returned when the caller does not ask for a specific number
+DEFAULT_TOP_K = 5
+
+_export_lock = threading.Lock()
+
+
+def get_onnx_cache_dir() -> Path:
+    """Get the directory holding exported ONNX models."""
+    settings = get_settings()
+    if settings.onnx_cache_dir:
+        return Path(settings.onnx_cache_dir)
+    return Path(settings.model_dir) / "onnx"
+
+
+def export_onnx(weights_path: str | Path, cache_dir: str | Path | None = None) -> Path:
+    """
+    Export PyTorch classifier weights to ONNX, reusing a cached export.
+
+    Exports are named after the weights' content hash, so changed weights
+    are re-exported and identical weights under different paths share one
+    artifact.
+
+    Args:
+        weights_path: Path to the .pt weights
+        cache_dir: Directory for exported models (defaults to get_onnx_cache_dir())
+
+    Returns:
+        Path to the ONNX model
+    """
+    weights_path = Path(weights_path)
+    cache_dir = Path(cache_dir) if cache_dir is not None else get_onnx_cache_dir()
+    digest = get_model_registry().file_digest(weights_path)
+    onnx_path = cache_dir / f"{weights_path.stem}-{digest[:16]}.onnx"
+
+    with _export_lock:
+        if onnx_path.exists():
+            return onnx_path
+
+        from ultralytics import YOLO
+
+        logger.info(f"Exporting {weights_path} to ONNX")
+        exported = Path(YOLO(str(weights_path)).export(format="onnx", dynamic=True, simplify=True))
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = onnx_path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.move(str(exported), tmp_path)
+        os.replace(tmp_path, onnx_path)
+        logger.info(f"Cached ONNX model at {onnx_path}")
+
+    return onnx_path
+
+
+def create_session(onnx_path: str | Path, device: str = "cpu") -> Any:
+    """
+    Create an ONNX Runtime session with graph optimisations and tuned threads.
+
+    Args:
+        onnx_path: ONNX model path
+        device: "cuda..." uses the CUDA provider when available, else CPU
+
+    Returns:
+        onnxruntime.InferenceSession
+    """
+    if not ONNX_AVAILABLE:
+        raise ImportError("onnxruntime is not installed")
+
+    settings = get_settings()
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.intra_op_num_threads = settings.onnx_intra_op_threads
+    options.inter_op_num_threads = settings.onnx_inter_op_threads
+
+    providers = ["CPUExecutionProvider"]
+    if device.startswith("cuda") and "CUDAExecutionProvider" in ort.get_available_providers():
+        providers.insert(0, "CUDAExecutionProvider")
+
+    return ort.InferenceSession(str(onnx_path), sess_options=options, providers=providers)
+
+
+def _parse_names(metadata: dict[str, str]) -> dict[int, str]:
+    """Read class names from ONNX metadata written by the ultralytics export."""
+    raw = metadata.get("names")
+    if not raw:
+        return {}
+    names = ast.literal_eval(raw)
+    if isinstance(names, (list, tuple)):
+        return dict(enumerate(names))
+    return {int(k): str(v) for k, v in names.items()}
+
+
+class OnnxClassifier:
+    """Image classifier running an exported model on ONNX Runtime."""
+
+    def __init__(self, session: Any, names: dict[int, str], image_size: int | None = None):
+        """
+        Initialize the classifier.
+
+        Args:
+            session: ONNX Runtime session (or an object with the same API)
+            names: Class index to name mapping
+            image_size: Square input size; read from the model when static
+        """
+        self.session = session
+        self.names = names
+
+        model_input = session.get_inputs()[0]
+        self.input_name = model_input.name
+        shape = model_input.shape
+        # Batch axis is dynamic when exported with dynamic=True
+        self.dynamic_batch = not isinstance(shape[0], int)
+        if image_size is None:
+            image_size = shape[2] if isinstance(shape[2], int) else get_settings().classifier_image_size
+        self.image_size = image_size
+
+    @classmethod
+    def from_weights(
+        cls,
+        weights_path: str | Path,
+        device: str = "cpu",
+        onnx_path: str | Path | None = None
+    ) -> "OnnxClassifier":
+        """
+        Build a classifier from .pt weights, exporting them on first use.
+
+        Args:
+            weights_path: Path to the .pt weights
+            device: Device to run on
+            onnx_path: Model to run instead of the float export (e.g. a
+                quantized artifact built from the same weights)
+        """
+        session = create_session(onnx_path or export_onnx(weights_path), device)
+        names = _parse_names(session.get_modelmeta().custom_metadata_map)
+        return cls(session, names)
+
+    def preprocess(self, image: Image.Image) -> np.ndarray:
+        """
+        Convert an image to a CHW float32 array in [0, 1].
+
+        Matches the classification transforms of the exported model: the
+        shorter side is scaled to the input size, then center-cropped.
+        """
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        width, height = image.size
+        scale = self.image_size / min(width, height)
+        new_size = (max(self.image_size, round(width * scale)), max(self.image_size, round(height * scale)))
+        if new_size != image.size:
+            image = image.resize(new_size, Image.Resampling.BILINEAR)
+
+        left = (new_size[0] - self.image_size) // 2
+        top = (new_size[1] - self.image_size) // 2
+        image = image.crop((left, top, left + self.image_size, top + self.image_size))
+
+        return np.asarray(image, dtype=np.float32).transpose(2, 0, 1) / 255.0
+
+    def _run(self, batch: np.ndarray) -> np.ndarray:
+        """Run the session and return class probabilities."""
+        if self.dynamic_batch:
+            outputs = self.session.run(None, {self.input_name: batch})[0]
+        else:
+            outputs = np.concatenate([
+                self.session.run(None, {self.input_name: batch[i:i + 1]})[0]
+                for i in range(len(batch))
+            ])
+
+        outputs = outputs.reshape(len(batch), -1).astype(np.float32)
+        # Exported classification heads already apply softmax
+        if not np.allclose(outputs.sum(axis=1), 1.0, atol=1e-3) or (outputs < 0).any():
+            outputs = np.exp(outputs - outputs.max(axis=1, keepdims=True))
+            outputs /= outputs.sum(axis=1, keepdims=True)
+        return outputs
+
+    def _format(self, probs: np.ndarray, top_k: int) -> dict[str, Any]:
+        """Build a result in the aerovision_inference classifier layout."""
+        top_k = min(top_k, len(probs))
+        indices = np.argsort(-probs, kind="stable")[:top_k]
+        predictions = [
+            {"class": self.names.get(int(i), str(int(i))), "confidence": float(probs[i])}
+            for i in indices
+        ]
+        return {"top1": predictions[0], "top_k": top_k, "predictions": predictions}
+
+    def predict(
+        self,
+        images: Image.Image | Sequence[Image.Image],
+        top_k: int | None = None
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        Classify one image or a batch.
+
+        Args:
+            images: PIL image or list of PIL images
+            top_k: Number of top predictions to return
+
+        Returns:
+            Result dict for a single image, or a list of them for a batch
+        """
+        single = isinstance(images, Image.Image)
+        batch_images = [images] if single else list(images)
+        batch = np.stack([self.preprocess(image) for image in batch_images])
+
+        probs = self._run(batch)
+        results = [self._format(p, top_k or DEFAULT_TOP_K) for p in probs]
+        return results[0] if single else results
@@ -0,0 +1,350 @@
+"""
+INT8 quantization of the ONNX classifiers.
+
+Quantized artifacts are built offline from the float ONNX export:
+
+    python -m app.inference.quantization --images data/calibration \
+        --eval-images data/evaluation --mode static
+
+"dynamic" quantizes the weights only; "static" also quantizes activations
+with ranges calibrated on the local image folder. Each artifact is written
+to the ONNX cache next to the float export, together with an agreement
+report comparing the quantized model's top-1/top-5 predictions with the
+float model's on a separate evaluation folder (calibration images would
+overstate agreement). The server only loads an artifact whose report
+meets the configured agreement floors.
+
+Requires the optional ``onnxruntime`` and ``onnx`` packages.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from PIL import Image
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.inference.onnx_backend import OnnxClassifier, create_session, export_onnx, get_onnx_cache_dir
+from app.inference.registry import get_model_registry
+
+QUANTIZATION_MODES = ("dynamic", "static")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+class QuantizationError(Exception):
+    """Exception raised when a quantized artifact is missing or fails its guardrails."""
+
+    pass
+
+
+def quantized_paths(
+    weights_path: str | Path,
+    mode: str,
+    cache_dir: str | Path | None = None
+) -> tuple[Path, Path]:
+    """
+    Get the model and report paths of a quantized artifact.
+
+    Like the float export, artifacts are named after the weights' content
+    hash, so changed weights never pick up a stale artifact.
+
+    Args:
+        weights_path: Path to the .pt weights
+        mode: Quantization mode (dynamic, static)
+        cache_dir: Directory for exported models (defaults to get_onnx_cache_dir())
+
+    Returns:
+        Tuple of (ONNX model path, JSON report path)
+    """
+    weights_path = Path(weights_path)
+    cache_dir = Path(cache_dir) if cache_dir is not None else get_onnx_cache_dir()
+    digest = get_model_registry().file_digest(weights_path)
+    base = f"{weights_path.stem}-{digest[:16]}.int8-{mode}"
+    return cache_dir / f"{base}.onnx", cache_dir / f"{base}.json"
+
+
+def check_quantized_artifact(weights_path: str | Path, mode: str) -> Path:
+    """
+    Validate a quantized artifact against its report and the agreement floors.
+
+    Args:
+        weights_path: Path to the .pt weights the artifact was built from
+        mode: Quantization mode (dynamic, static)
+
+    Returns:
+        Path to the quantized ONNX model
+
+    Raises:
+        QuantizationError: If the artifact or its report is missing, does not
+            match the files on disk, or falls below an agreement floor
+    """
+    model_path, report_path = quantized_paths(weights_path, mode)
+    if not model_path.exists() or not report_path.exists():
+        raise QuantizationError(
+            f"No {mode} INT8 artifact for {weights_path}; "
+            f"build it with `python -m app.inference.quantization --mode {mode}`"
+        )
+
+    try:
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        expected_digest = report["model_sha256"]
+        top1, top5 = float(report["top1_agreement"]), float(report["top5_agreement"])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise QuantizationError(f"Invalid quantization report {report_path}: {e}")
+
+    registry = get_model_registry()
+    if registry.file_digest(model_path) != expected_digest:
+        raise QuantizationError(f"{model_path} does not match its report {report_path}")
+
+    settings = get_settings()
+    failures = []
+    if top1 < settings.quantization_min_top1_agreement:
+        failures.append(f"top-1 agreement {top1:.4f} < {settings.quantization_min_top1_agreement}")
+    if top5 < settings.quantization_min_top5_agreement:
+        failures.append(f"top-5 agreement {top5:.4f} < {settings.quantization_min_top5_agreement}")
+    if failures:
+        raise QuantizationError(f"Refusing {model_path}: " + "; ".join(failures))
+
+    return model_path
+
+
+def list_images(folder: str | Path, limit: int | None = None) -> list[Path]:
+    """List the images of a folder in name order, up to limit."""
+    images = sorted(
+        path for path in Path(folder).iterdir()
+        if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
+    )
+    return images[:limit] if limit else images
+
+
+def _load_batches(paths: Sequence[Path], batch_size: int) -> Iterator[list[Image.Image]]:
+    """Load images in batches, skipping unreadable files."""
+    for start in range(0, len(paths), batch_size):
+        batch = []
+        for path in paths[start:start + batch_size]:
+            try:
+                with Image.open(path) as image:
+                    batch.append(image.convert("RGB"))
+            except OSError as e:
+                logger.warning(f"Skipping unreadable image {path}: {e}")
+        if batch:
+            yield batch
+
+
+def agreement_metrics(reference: list[dict[str, Any]], candidate: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Compare a candidate model's predictions with a reference model's.
+
+    Uses the top-1/top-5 definitions of deployment_tests/model_evaluation.py
+    with the reference model's top-1 class as the label: top-1 agreement
+    counts identical top-1 classes, top-5 agreement counts reference top-1
+    classes found in the candidate's first five predictions.
+
+    Args:
+        reference: Classifier results of the float model
+        candidate: Classifier results of the quantized model, same order
+
+    Returns:
+        Dictionary with sample count, agreements and the most frequent
+        top-1 disagreements
+    """
+    total = len(reference)
+    top1_agree = top5_agree = 0
+    disagreements: Counter[str] = Counter()
+
+    for ref, cand in zip(reference, candidate):
+        label = ref["top1"]["class"]
+        predicted = cand["top1"]["class"]
+        if predicted == label:
+            top1_agree += 1
+        else:
+            disagreements[f"{label} -> {predicted}"] += 1
+        if label in [p["class"] for p in cand["predictions"][:5]]:
+            top5_agree += 1
+
+    return {
+        "total_samples": total,
+        "top1_agreement": top1_agree / total if total > 0 else 0,
+        "top5_agreement": top5_agree / total if total > 0 else 0,
+        "disagreements_sample": dict(disagreements.most_common(10)),
+    }
+
+
+def evaluate_agreement(
+    reference: OnnxClassifier,
+    candidate: OnnxClassifier,
+    images: Sequence[Path],
+    batch_size: int = 16
+) -> dict[str, Any]:
+    """
+    Run both classifiers over the evaluation images and compare them.
+
+    Args:
+        reference: Float classifier
+        candidate: Quantized classifier
+        images: Evaluation image paths
+        batch_size: Images per inference call
+
+    Returns:
+        agreement_metrics() result
+    """
+    reference_results: list[dict[str, Any]] = []
+    candidate_results: list[dict[str, Any]] = []
+    for batch in _load_batches(images, batch_size):
+        reference_results.extend(reference.predict(batch, top_k=5))
+        candidate_results.extend(candidate.predict(batch, top_k=5))
+    return agreement_metrics(reference_results, candidate_results)
+
+
+def _calibration_reader(classifier: OnnxClassifier, images: Sequence[Path], batch_size: int) -> Any:
+    """Build an ONNX Runtime calibration reader over preprocessed images."""
+    import numpy as np
+    from onnxruntime.quantization import CalibrationDataReader
+
+    class ImageFolderReader(CalibrationDataReader):
+        def __init__(self) -> None:
+            self._batches = _load_batches(images, batch_size if classifier.dynamic_batch else 1)
+
+        def get_next(self) -> dict[str, Any] | None:
+            batch = next(self._batches, None)
+            if batch is None:
+                return None
+            return {classifier.input_name: np.stack([classifier.preprocess(image) for image in batch])}
+
+    return ImageFolderReader()
+
+
+def _copy_metadata(source: Path, target: Path) -> None:
+    """Copy model metadata (class names) from the float model if the quantizer dropped it."""
+    import onnx
+
+    model = onnx.load(str(target))
+    if model.metadata_props:
+        return
+    model.metadata_props.extend(onnx.load(str(source), load_external_data=False).metadata_props)
+    onnx.save(model, str(target))
+
+
+def build_quantized(
+    weights_path: str | Path,
+    mode: str,
+    calibration_images: Sequence[Path],
+    eval_images: Sequence[Path],
+    batch_size: int = 16
+) -> dict[str, Any]:
+    """
+    Quantize a classifier and write its agreement report.
+
+    Args:
+        weights_path: Path to the .pt weights
+        mode: Quantization mode (dynamic, static)
+        calibration_images: Images used to calibrate activation ranges (static)
+        eval_images: Images the float and quantized models are compared on
+        batch_size: Images per inference call
+
+    Returns:
+        The written report
+
+    Raises:
+        QuantizationError: If the mode is unknown or there are no images
+    """
+    if mode not in QUANTIZATION_MODES:
+        raise QuantizationError(f"Unknown quantization mode: {mode}")
+    if not eval_images or (mode == "static" and not calibration_images):
+        raise QuantizationError("Calibration and evaluation need at least one image")
+
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static
+
+    weights_path = Path(weights_path)
+    float_path = export_onnx(weights_path)
+    model_path, report_path = quantized_paths(weights_path, mode)
+    reference = OnnxClassifier.from_weights(weights_path, device="cpu")
+
+    tmp_path = model_path.with_name(f"{model_path.name}.{os.getpid()}.tmp")
+    logger.info(f"Quantizing {float_path} ({mode})")
+    if mode == "dynamic":
+        quantize_dynamic(str(float_path), str(tmp_path), weight_type=QuantType.QInt8)
+    else:
+        quantize_static(
+            str(float_path),
+            str(tmp_path),
+            _calibration_reader(reference, calibration_images, batch_size),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8
+        )
+    _copy_metadata(float_path, tmp_path)
+
+    candidate = OnnxClassifier(create_session(tmp_path, "cpu"), reference.names, reference.image_size)
+    metrics = evaluate_agreement(reference, candidate, eval_images, batch_size)
+    os.replace(tmp_path, model_path)
+
+    report = {
+        "weights": str(weights_path),
+        "weights_sha256": get_model_registry().file_digest(weights_path),
+        "model": model_path.name,
+        "model_sha256": get_model_registry().file_digest(model_path),
+        "mode": mode,
+        "calibration_images": len(calibration_images) if mode == "static" else 0,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        **metrics,
+    }
+    tmp_report = report_path.with_name(f"{report_path.name}.{os.getpid()}.tmp")
+    tmp_report.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_report, report_path)
+    logger.info(f"Wrote {model_path} and {report_path}")
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Build quantized classifier artifacts from the command line."""
+    from app.inference.factory import InferenceFactory
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.inference.quantization",
+        description="Build INT8 classifier artifacts and their agreement reports"
+    )
+    parser.add_argument("--images", required=True, help="Calibration image folder")
+    parser.add_argument(
+        "--eval-images", required=True,
+        help="Evaluation image folder, disjoint from the calibration images"
+    )
+    parser.add_argument("--mode", choices=QUANTIZATION_MODES, default="static", help="Quantization mode")
+    parser.add_argument(
+        "--models", nargs="+", choices=("aircraft", "airline"), default=["aircraft", "airline"],
+        help="Classifiers to quantize"
+    )
+    parser.add_argument("--limit", type=int, default=500, help="Maximum images used from each folder")
+    parser.add_argument("--batch-size", type=int, default=16, help="Images per inference call")
+    args = parser.parse_args(argv)
+
+    calibration_images = list_images(args.images, args.limit)
+    eval_images = list_images(args.eval_images, args.limit)
+    if {p.resolve() for p in calibration_images} & {p.resolve() for p in eval_images}:
+        parser.error("--eval-images must not contain calibration images")
+
+    exit_code = 0
+    for name in args.models:
+        weights_path = InferenceFactory.resolve_classifier_path(name)
+        report = build_quantized(weights_path, args.mode, calibration_images, eval_images, args.batch_size)
+        try:
+            check_quantized_artifact(weights_path, args.mode)
+            report["accepted"] = True
+        except QuantizationError as e:
+            report["accepted"] = False
+            logger.error(str(e))
+            exit_code = 1
+        print(json.dumps({name: report}, indent=2, ensure_ascii=False))
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
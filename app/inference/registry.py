@@ -0,0 +1,356 @@
+"""
+Process-wide model registry.
+
+Loaded models are identified by the wrapper class built around them, the
+content hash of their weights files and the device they run on, so every
+service asking for the same model gets the same instance instead of
+loading another copy, even under another kind (e.g. aircraft and airline
+classifiers both falling back to the shared best.pt on ONNX Runtime).
+Different wrappers around the same weights are loaded separately. The
+registry also records the resident memory each load added to the process.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+from app.core.logging import logger
+
+# Read size for hashing weights files
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ModelEntry:
+    """A loaded model shared through the registry."""
+
+    kind: str
+    digest: str
+    paths: tuple[str, ...]
+    device: str
+    instance: Any
+    load_seconds: float
+    rss_bytes: int
+    parameter_bytes: Optional[int]
+    wrapper: str = ""
+    users: set[str] = field(default_factory=set)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Memory and identity report for this model."""
+        return {
+            "kind": self.kind,
+            "wrapper": self.wrapper,
+            "digest": self.digest[:16],
+            "paths": list(self.paths),
+            "device": self.device,
+            "users": sorted(self.users),
+            "load_seconds": round(self.load_seconds, 3),
+            "rss_bytes": self.rss_bytes,
+            "parameter_bytes": self.parameter_bytes,
+        }
+
+
+def current_rss_bytes() -> int:
+    """
+    Get the resident set size of this process.
+
+    Returns:
+        RSS in bytes, or 0 where it cannot be read (non-Linux)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def process_memory(pid: int | str = "self") -> dict[str, Optional[int]]:
+    """
+    Get the memory footprint of a process.
+
+    PSS (proportional set size) charges each shared page to the processes
+    sharing it, so summing PSS over forked workers gives their real
+    footprint, while their RSS sums count shared model pages once per
+    worker.
+
+    Args:
+        pid: Process ID (defaults to this process)
+
+    Returns:
+        Dictionary with rss_bytes, pss_bytes, shared_bytes and
+        private_bytes; fields that cannot be read (non-Linux) are None
+    """
+    fields: dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == "kB":
+                    fields[name] = int(parts[0]) * 1024
+    except (OSError, ValueError):
+        pass
+
+    def total(*names: str) -> Optional[int]:
+        if not all(name in fields for name in names):
+            return None
+        return sum(fields[name] for name in names)
+
+    rss = total("Rss")
+    return {
+        "pid": os.getpid() if pid == "self" else int(pid),
+        "rss_bytes": rss if rss is not None else current_rss_bytes(),
+        "pss_bytes": total("Pss"),
+        "shared_bytes": total("Shared_Clean", "Shared_Dirty"),
+        "private_bytes": total("Private_Clean", "Private_Dirty"),
+    }
+
+
+def _find_modules(instance: Any) -> list[Any]:
+    """
+    Find torch-style modules on a model.
+
+    Looks on the instance itself and on its ``model`` attribute, up to two
+    levels deep (as in ultralytics).
+    """
+    wrapped = getattr(instance, "model", None)
+    return [
+        candidate for candidate in (instance, wrapped, getattr(wrapped, "model", None))
+        if callable(getattr(candidate, "parameters", None))
+    ]
+
+
+def parameter_bytes(instance: Any) -> Optional[int]:
+    """
+    Count the bytes held by a model's parameters and buffers.
+
+    Returns:
+        Total bytes, or None if no module could be found
+    """
+    for candidate in _find_modules(instance):
+        try:
+            tensors = list(candidate.parameters())
+            buffers = getattr(candidate, "buffers", None)
+            if callable(buffers):
+                tensors.extend(buffers())
+            return sum(t.numel() * t.element_size() for t in tensors)
+        except Exception:
+            continue
+    return None
+
+
+def freeze_model(instance: Any) -> bool:
+    """
+    Put a model in inference-only mode so its tensor storage is never written.
+
+    Switches modules to eval mode (no batch-norm statistic updates) and
+    turns off gradients on all parameters, so inference neither writes
+    to nor allocates alongside the weights. Pages holding the weights then
+    stay shared between forked workers.
+
+    Returns:
+        True if a torch-style module was found and frozen
+    """
+    frozen = False
+    for candidate in _find_modules(instance):
+        try:
+            if callable(getattr(candidate, "eval", None)):
+                candidate.eval()
+            for parameter in candidate.parameters():
+                parameter.requires_grad_(False)
+            frozen = True
+        except Exception as e:
+            logger.warning(f"Could not freeze {type(candidate).__name__}: {e}")
+    return frozen
+
+
+class ModelRegistry:
+    """Loads models once per (wrapper, weights hash, device) and shares them."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._entries: dict[tuple[str, str, str], ModelEntry] = {}
+        self._load_locks: dict[tuple[str, str, str], threading.Lock] = {}
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def file_digest(self, path: str | Path) -> str:
+        """
+        Get the SHA-256 of a weights file.
+
+        Digests are cached by path, size and modification time, so a file
+        is only hashed again after it changes.
+
+        Args:
+            path: Weights file path
+
+        Returns:
+            Hex digest, or "missing:<path>" if the file does not exist
+        """
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return f"missing:{path}"
+
+        cache_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(cache_key)
+        if digest is not None:
+            return digest
+
+        sha = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        with self._lock:
+            self._digests[cache_key] = digest
+        return digest
+
+    def get(
+        self,
+        kind: str,
+        paths: Sequence[str | Path],
+        loader: Callable[[], Any],
+        device: str = "",
+        user: Optional[str] = None,
+        wrapper: str = ""
+    ) -> Any:
+        """
+        Get a shared model, loading it on first use.
+
+        Args:
+            kind: Loader kind (e.g. "aircraft_classifier"), for logs and
+                reports; the first kind to load an instance names it
+            paths: Weights files the model is built from
+            loader: Builds the model when no matching instance is loaded
+            device: Device the model runs on, including the runtime if it
+                is not torch (e.g. "onnx:cpu")
+            user: Name of the component requesting the model
+            wrapper: Class the loader builds (e.g. "AircraftClassifier");
+                instances are only shared between requests for the same one
+
+        Returns:
+            The shared model instance
+        """
+        digest = "+".join(self.file_digest(p) for p in paths)
+        key = (wrapper, digest, device)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        if entry is None:
+            with load_lock:
+                with self._lock:
+                    entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._load(kind, digest, paths, loader, device)
+                    entry.wrapper = wrapper
+                    with self._lock:
+                        self._entries[key] = entry
+
+        if user is not None:
+            with self._lock:
+                entry.users.add(user)
+        return entry.instance
+
+    def _load(
+        self,
+        kind: str,
+        digest: str,
+        paths: Sequence[str | Path],
+        loader: Callable[[], Any],
+        device: str
+    ) -> ModelEntry:
+        """Load a model and measure what it added to the process."""
+        rss_before = current_rss_bytes()
+        start_time = time.perf_counter()
+        instance = loader()
+        load_seconds = time.perf_counter() - start_time
+        rss_bytes = max(0, current_rss_bytes() - rss_before)
+
+        logger.info(
+            f"Registered {kind} ({digest[:12]}) on {device or 'default'} "
+            f"in {load_seconds:.2f}s, +{rss_bytes / 1e6:.1f} MB RSS"
+        )
+        return ModelEntry(
+            kind=kind,
+            digest=digest,
+            paths=tuple(str(p) for p in paths),
+            device=device,
+            instance=instance,
+            load_seconds=load_seconds,
+            rss_bytes=rss_bytes,
+            parameter_bytes=parameter_bytes(instance),
+        )
+
+    def entries(self) -> list[ModelEntry]:
+        """Get the loaded models."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def memory_report(self) -> list[dict[str, Any]]:
+        """
+        Report resident memory attributed to each loaded model.
+
+        ``rss_bytes`` is the RSS growth measured around the model's load;
+        models loading concurrently may see each other's growth.
+        ``parameter_bytes`` counts parameter and buffer storage when the
+        model exposes a torch module.
+        """
+        return [entry.to_dict() for entry in self.entries()]
+
+    def release(self, instance: Any, user: Optional[str] = None) -> bool:
+        """
+        Release a model instance.
+
+        The entry is dropped once no component uses it anymore; its memory
+        is freed when the last outside reference (e.g. a running request)
+        goes away.
+
+        Args:
+            instance: Model instance returned by get()
+            user: Component releasing the model; None drops the entry for all users
+
+        Returns:
+            True if the entry was dropped
+        """
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry.instance is instance:
+                    break
+            else:
+                return False
+
+            if user is not None:
+                entry.users.discard(user)
+                if entry.users:
+                    return False
+            del self._entries[key]
+            self._load_locks.pop(key, None)
+
+        logger.info(f"Released {entry.kind} ({entry.digest[:12]})")
+        return True
+
+    def clear(self) -> None:
+        """Forget all loaded models (mainly for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._load_locks.clear()
+
+
+_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry."""
+    return _registry
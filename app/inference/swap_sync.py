@@ -0,0 +1,229 @@
+"""
+Model swaps broadcast to every worker process.
+
+A swap accepted by one worker is published in Redis as the model's
+desired weights: ``models:swap:<name>`` holds the latest request (its ID
+and weights path). Every worker polls those keys, applies requests it
+has not applied yet and records the outcome under its worker ID in
+``models:swap:<name>:workers``. Workers also refresh a heartbeat in
+``models:swap:heartbeats``, so the requesting worker knows which workers
+to wait for. A worker started after a swap applies it on its first poll.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.core.redis_client import get_stats_manager
+from app.inference.factory import SWAPPABLE_MODELS, InferenceFactory
+
+REQUEST_KEY = "models:swap:{name}"
+STATUS_KEY = "models:swap:{name}:workers"
+HEARTBEAT_KEY = "models:swap:heartbeats"
+
+# Workers whose heartbeat is older than this many poll intervals are not waited for
+_HEARTBEAT_INTERVALS = 3
+
+
+def worker_id() -> str:
+    """Get the ID of this worker process (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def worker_status(request_id: str, swap: Optional[dict[str, Any]] = None, error: Optional[str] = None) -> dict[str, Any]:
+    """
+    Build a worker's report for a swap request.
+
+    Args:
+        request_id: Swap request ID
+        swap: Result of InferenceFactory.swap_classifier, if it succeeded
+        error: Error message, if it failed
+
+    Returns:
+        Dictionary with the worker ID, request ID, status (swapped,
+        unchanged or failed), served version and error
+    """
+    if swap is None:
+        status = "failed"
+    else:
+        status = "swapped" if swap["swapped"] else "unchanged"
+    return {
+        "worker": worker_id(),
+        "request_id": request_id,
+        "status": status,
+        "version": swap["version"] if swap is not None else None,
+        "error": error,
+    }
+
+
+class ModelSwapSync:
+    """Publishes swaps to Redis and applies swaps published by other workers."""
+
+    def __init__(self):
+        """Initialize with no swap applied yet."""
+        self.settings = get_settings()
+        self._applied: dict[str, str] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+
+    async def apply(self, name: str, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Apply a published swap request in this worker.
+
+        Args:
+            name: Model name
+            request: Published request with request_id and weights_path
+
+        Returns:
+            This worker's status for the request
+        """
+        self._applied[name] = request["request_id"]
+        weights_path = Path(request["weights_path"]) if request.get("weights_path") else None
+        try:
+            swap = await asyncio.to_thread(InferenceFactory.swap_classifier, name, weights_path)
+        except Exception as e:
+            logger.error(f"Broadcast swap of {name} failed in worker {worker_id()}: {e}")
+            return worker_status(request["request_id"], error=str(e))
+        return worker_status(request["request_id"], swap)
+
+    async def poll(self) -> None:
+        """Refresh this worker's heartbeat and apply swaps it has not applied yet."""
+        r = await get_stats_manager().get_async_redis()
+        await r.hset(HEARTBEAT_KEY, worker_id(), str(time.time()))
+        for name in SWAPPABLE_MODELS:
+            raw = await r.get(REQUEST_KEY.format(name=name))
+            if raw is None:
+                continue
+            request = json.loads(raw)
+            if self._applied.get(name) == request["request_id"]:
+                continue
+            status = await self.apply(name, request)
+            await r.hset(STATUS_KEY.format(name=name), status["worker"], json.dumps(status))
+
+    async def broadcast(
+        self,
+        name: str,
+        weights_path: Optional[str | Path],
+        local_swap: dict[str, Any]
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Publish a swap this worker has applied and wait for the other workers.
+
+        Args:
+            name: Model name
+            weights_path: Weights the swap loaded (None for the configured best.pt)
+            local_swap: Result of the swap in this worker
+
+        Returns:
+            Tuple of (per-worker statuses, whether every live worker reported);
+            live workers that have not reported within model_swap_timeout_seconds
+            are listed as pending
+        """
+        request_id = uuid.uuid4().hex
+        local_status = worker_status(request_id, local_swap)
+        self._applied[name] = request_id
+        if not self.settings.redis_enabled:
+            return [local_status], True
+
+        request = {
+            "request_id": request_id,
+            "weights_path": str(weights_path) if weights_path is not None else None,
+            "requested_at": time.time(),
+        }
+        try:
+            r = await get_stats_manager().get_async_redis()
+            await r.set(REQUEST_KEY.format(name=name), json.dumps(request))
+            await r.hset(STATUS_KEY.format(name=name), local_status["worker"], json.dumps(local_status))
+            await r.hset(HEARTBEAT_KEY, local_status["worker"], str(time.time()))
+            return await self._collect(r, name, request_id)
+        except Exception as e:
+            logger.error(f"Failed to broadcast {name} swap: {e}")
+            return [local_status], False
+
+    async def _collect(self, r: Any, name: str, request_id: str) -> tuple[list[dict[str, Any]], bool]:
+        """Wait until every live worker reported on a request, or the timeout."""
+        interval = self.settings.model_swap_poll_seconds
+        deadline = time.monotonic() + self.settings.model_swap_timeout_seconds
+        while True:
+            heartbeats = await r.hgetall(HEARTBEAT_KEY)
+            live_after = time.time() - interval * _HEARTBEAT_INTERVALS
+            live = sorted(worker for worker, seen in heartbeats.items() if float(seen) >= live_after)
+
+            reported = {}
+            for worker, raw in (await r.hgetall(STATUS_KEY.format(name=name))).items():
+                status = json.loads(raw)
+                if status["request_id"] == request_id:
+                    reported[worker] = status
+
+            pending = [worker for worker in live if worker not in reported]
+            if not pending or time.monotonic() >= deadline:
+                statuses = [reported[worker] for worker in sorted(reported)]
+                statuses.extend(
+                    {"worker": worker, "request_id": request_id, "status": "pending", "version": None, "error": None}
+                    for worker in pending
+                )
+                return statuses, not pending
+            await asyncio.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+
+    async def _run_poller(self, interval: float) -> None:
+        """Poll for swaps periodically until cancelled."""
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.warning(f"Failed to poll for model swaps: {e}")
+            await asyncio.sleep(interval)
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """
+        Start polling for swaps on the running event loop.
+
+        Args:
+            interval: Seconds between polls (defaults to the
+                model_swap_poll_seconds setting)
+        """
+        if self._poll_task is not None and not self._poll_task.done():
+            return
+        if interval is None:
+            interval = self.settings.model_swap_poll_seconds
+        self._poll_task = asyncio.create_task(self._run_poller(interval))
+
+    async def stop(self) -> None:
+        """Stop polling and drop this worker's heartbeat."""
+        if self._poll_task is None:
+            return
+        self._poll_task.cancel()
+        try:
+            await self._poll_task
+        except asyncio.CancelledError:
+            pass
+        self._poll_task = None
+        try:
+            r = await get_stats_manager().get_async_redis()
+            await r.hdel(HEARTBEAT_KEY, worker_id())
+        except Exception as e:
+            logger.warning(f"Failed to drop model swap heartbeat: {e}")
+
+
+_swap_sync = ModelSwapSync()
+
+
+def get_swap_sync() -> ModelSwapSync:
+    """Get this process's model swap synchronizer."""
+    return _swap_sync
+
+
+def start_swap_sync() -> None:
+    """Start applying swaps broadcast by other workers."""
+    _swap_sync.start()
+
+
+async def stop_swap_sync() -> None:
+    """Stop applying broadcast swaps."""
+    await _swap_sync.stop()
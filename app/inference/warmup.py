@@ -0,0 +1,132 @@
+"""
+Synthetic warm-up of loaded models.
+
+Constructing a model does not allocate its inference buffers, pick
+kernels or initialise OCR engines; the first real requests pay for that.
+The warm-up runs every loaded model on synthetic inputs (classifiers on
+each configured batch size) and moves it from ``loaded`` through
+``warming`` to ``ready``, which is what /ready reports.
+"""
+
+import time
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+from PIL import Image
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.inference.factory import MODEL_NAMES, InferenceFactory
+
+# Top-k used for classifier warm-up passes
+_WARMUP_TOP_K = 5
+
+# Warm-up seconds of the last pass, keyed by model name
+_warmup_seconds: dict[str, float] = {}
+
+
+def get_warmup_batch_sizes() -> list[int]:
+    """Get the classifier batch sizes exercised by the warm-up."""
+    settings = get_settings()
+    sizes = settings.warmup_batch_sizes or [1, settings.micro_batch_max_size]
+    return sorted({size for size in sizes if size > 0})
+
+
+def synthetic_image(seed: int = 0) -> Image.Image:
+    """
+    Create a deterministic noise image at the classifier input size.
+
+    Noise exercises the same code paths as a photo; a 4:3 aspect ratio
+    exercises resizing and cropping as real inputs do.
+    """
+    size = get_settings().classifier_image_size
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (size, size * 4 // 3, 3), dtype=np.uint8)
+    return Image.fromarray(pixels, "RGB")
+
+
+def warm_classifier(classifier: Any) -> None:
+    """Run a classifier on a single image and on every warm-up batch size."""
+    image = synthetic_image()
+    classifier.predict(image, top_k=_WARMUP_TOP_K)
+    for batch_size in get_warmup_batch_sizes():
+        classifier.predict([image] * batch_size, top_k=_WARMUP_TOP_K)
+
+
+def _warm_registration() -> None:
+    """Run the local OCR engine once; remote OCR needs no warm-up."""
+    from app.services.registration_service import _uses_remote_ocr
+
+    if _uses_remote_ocr():
+        return
+    InferenceFactory.get_registration_ocr().recognize(synthetic_image())
+
+
+def _warm_quality() -> None:
+    """Run the quality assessor once."""
+    InferenceFactory.get_quality_assessor().assess(synthetic_image())
+
+
+_WARMERS: dict[str, Callable[[], None]] = {
+    "aircraft": lambda: warm_classifier(InferenceFactory.get_aircraft_classifier()),
+    "airline": lambda: warm_classifier(InferenceFactory.get_airline_classifier()),
+    "registration": _warm_registration,
+    "quality": _warm_quality,
+}
+
+
+def warm_up_model(name: str) -> Optional[float]:
+    """
+    Warm up one loaded model and mark it ready.
+
+    A failing warm-up is logged and the model is still marked ready: it is
+    loaded and serving, only its first requests will be slower.
+
+    Args:
+        name: Model name
+
+    Returns:
+        Warm-up seconds, or None if the model was not loaded
+    """
+    if InferenceFactory.get_model_states()[name] != "loaded":
+        return None
+
+    if not get_settings().warmup_enabled:
+        InferenceFactory.set_model_state(name, "ready")
+        return None
+
+    InferenceFactory.set_model_state(name, "warming")
+    start_time = time.perf_counter()
+    try:
+        _WARMERS[name]()
+    except Exception as e:
+        logger.error(f"Warm-up of {name} failed: {e}")
+    seconds = time.perf_counter() - start_time
+
+    _warmup_seconds[name] = seconds
+    InferenceFactory.set_model_state(name, "ready")
+    logger.info(f"Warmed up {name} in {seconds:.2f}s")
+    return seconds
+
+
+def warm_up_models(names: Optional[Sequence[str]] = None) -> dict[str, float]:
+    """
+    Warm up loaded models and mark them ready.
+
+    Args:
+        names: Models to warm up; all of them by default
+
+    Returns:
+        Warm-up seconds of each model that was warmed up
+    """
+    timings = {}
+    for name in names or MODEL_NAMES:
+        seconds = warm_up_model(name)
+        if seconds is not None:
+            timings[name] = seconds
+    return timings
+
+
+def get_warmup_seconds() -> dict[str, float]:
+    """Get the warm-up time of each model warmed up in this process."""
+    return dict(_warmup_seconds)
@@ -0,0 +1,227 @@
+"""
+Server launcher for Aerovision-V1-Server.
+
+``python -m app.launcher`` starts the API with the configured number of
+workers. With ``PREFORK=true`` a master process loads the models once,
+freezes its heap and then forks the workers, which share the model pages
+copy-on-write instead of each loading a private copy. The master restarts
+workers that crash and forwards SIGINT/SIGTERM to them; SIGUSR1 logs the
+memory of every worker (compare the PSS sum with one worker's RSS to see
+the saving).
+
+CUDA cannot be used across fork, so prefork falls back to regular workers
+on GPU. ONNX Runtime sessions own thread pools that do not survive fork,
+so on the ONNX backend the classifiers are loaded in each worker.
+"""
+
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Callable, Optional
+
+import uvicorn
+
+from app.core.config import Settings, get_settings
+from app.core.logging import logger
+from app.inference.registry import freeze_model, get_model_registry, process_memory
+
+APP_PATH = "app.main:app"
+
+# Minimum time between restarts of the same worker slot
+_RESTART_DELAY_SECONDS = 1.0
+
+
+def _import_torch() -> Optional[Any]:
+    """Import torch if installed."""
+    try:
+        import torch
+        return torch
+    except ImportError:
+        return None
+
+
+def format_memory(memory: dict[str, Optional[int]]) -> str:
+    """Format a process_memory() result for logging."""
+    def mb(value: Optional[int]) -> str:
+        return "n/a" if value is None else f"{value / 1e6:.1f} MB"
+
+    return (
+        f"RSS {mb(memory['rss_bytes'])}, PSS {mb(memory['pss_bytes'])}, "
+        f"shared {mb(memory['shared_bytes'])}, private {mb(memory['private_bytes'])}"
+    )
+
+
+def fork_safe_models(settings: Settings) -> list[str]:
+    """Get the models that can be loaded before forking."""
+    models = ["registration", "quality"]
+    if settings.inference_backend == "torch":
+        models[:0] = ["aircraft", "airline"]
+    return models
+
+
+def preload_for_fork(settings: Settings) -> Optional[int]:
+    """
+    Load models in the master and prepare its heap for copy-on-write sharing.
+
+    Returns:
+        The torch intra-op thread count to restore in workers, or None
+        without torch
+    """
+    from app.inference import InferenceFactory
+
+    torch = _import_torch()
+    torch_threads = None
+    if torch is not None:
+        # OpenMP thread pools started before fork hang in the children
+        torch_threads = torch.get_num_threads()
+        torch.set_num_threads(1)
+
+    try:
+        InferenceFactory.preload_models(fork_safe_models(settings))
+    except Exception as e:
+        logger.warning(f"Failed to preload models: {e}")
+
+    for entry in get_model_registry().entries():
+        freeze_model(entry.instance)
+
+    # Move everything loaded so far to the permanent generation, so that
+    # collections in the workers do not write to (and un-share) its pages
+    gc.collect()
+    gc.freeze()
+
+    logger.info(f"Master {os.getpid()} preloaded models: {format_memory(process_memory())}")
+    return torch_threads
+
+
+class PreforkSupervisor:
+    """Forks workers from the master process and keeps them running."""
+
+    def __init__(self, target: Callable[[], None], workers: int):
+        """
+        Initialize the supervisor.
+
+        Args:
+            target: Runs one worker in the forked child
+            workers: Number of workers
+        """
+        self.target = target
+        self.workers = workers
+        self.children: dict[int, int] = {}  # pid -> worker slot
+        self.stopping = False
+
+    def _spawn(self, slot: int) -> None:
+        """Fork one worker."""
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR1):
+                    signal.signal(signum, signal.SIG_DFL)
+                self.target()
+            except BaseException as e:
+                logger.exception(f"Worker {os.getpid()} failed: {e}")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        self.children[pid] = slot
+        logger.info(f"Started worker {pid} (slot {slot})")
+
+    def _stop(self, signum: int, frame: Any) -> None:
+        """Forward a shutdown signal to the workers."""
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _log_memory(self, signum: int = 0, frame: Any = None) -> None:
+        """Log the memory of the master and every worker."""
+        total_pss = 0
+        for pid in [os.getpid(), *self.children]:
+            memory = process_memory(pid)
+            total_pss += memory["pss_bytes"] or 0
+            logger.info(f"Process {pid}: {format_memory(memory)}")
+        logger.info(f"Total PSS of master and workers: {total_pss / 1e6:.1f} MB")
+
+    def run(self) -> None:
+        """Fork the workers and wait until all of them have exited."""
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGUSR1, self._log_memory)
+
+        for slot in range(self.workers):
+            self._spawn(slot)
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            slot = self.children.pop(pid, None)
+            if slot is None:
+                continue
+
+            exit_code = os.waitstatus_to_exitcode(status)
+            if self.stopping or exit_code == 0:
+                logger.info(f"Worker {pid} exited")
+                continue
+
+            logger.warning(f"Worker {pid} exited with code {exit_code}, restarting")
+            time.sleep(_RESTART_DELAY_SECONDS)
+            if not self.stopping:
+                self._spawn(slot)
+
+
+def run_prefork(settings: Settings) -> None:
+    """Load models once, then serve from forked workers sharing them."""
+    torch = _import_torch()
+    if settings.device.startswith("cuda") and torch is not None and torch.cuda.is_available():
+        logger.warning("Prefork is not supported with CUDA; starting regular workers")
+        run_uvicorn(settings)
+        return
+
+    config = uvicorn.Config(APP_PATH, host=settings.host, port=settings.port)
+    # Import the application before forking so the workers share it too
+    config.load()
+    torch_threads = preload_for_fork(settings)
+    sock: socket.socket = config.bind_socket()
+
+    def serve() -> None:
+        if torch is not None and torch_threads:
+            torch.set_num_threads(torch_threads)
+        logger.info(f"Worker {os.getpid()} ready: {format_memory(process_memory())}")
+        uvicorn.Server(config).run(sockets=[sock])
+
+    try:
+        PreforkSupervisor(serve, settings.workers).run()
+    finally:
+        sock.close()
+
+
+def run_uvicorn(settings: Settings) -> None:
+    """Serve with uvicorn's own worker management."""
+    uvicorn.run(
+        APP_PATH,
+        host=settings.host,
+        port=settings.port,
+        reload=settings.reload,
+        workers=settings.workers if not settings.reload else 1
+    )
+
+
+def main() -> None:
+    """Start the server in the configured mode."""
+    settings = get_settings()
+    if settings.prefork and not settings.reload and hasattr(os, "fork"):
+        run_prefork(settings)
+    else:
+        run_uvicorn(settings)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
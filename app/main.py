@@ -2,7 +2,9 @@
 FastAPI application entry point for Aerovision-V1-Server.
 """
 
+import asyncio
 import contextlib
+import time
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
@@ -11,9 +13,16 @@ from fastapi.responses import JSONResponse
 
 from app.api import api_router
 from app.core.config import get_settings
+from app.core.http_client import close_image_fetcher
 from app.core.logging import logger, setup_logging
+from app.core.metrics import UNMATCHED_ROUTE, TimedJSONResponse, observe_request
+from app.core.tracing import REQUEST_ID_HEADER, request_context, reset_exporter, start_span
+from app.core.redis_client import start_stats_flusher, stop_stats_flusher
 from app.core.exceptions import AerovisionException
-from app.inference import InferenceFactory
+from app.inference import InferenceFactory, shutdown_executors
+from app.inference.swap_sync import start_swap_sync, stop_swap_sync
+from app.inference.warmup import warm_up_models
+from app.services.job_service import start_job_workers, stop_job_workers
 
 # Get settings
 settings = get_settings()
@@ -28,6 +37,7 @@ app = FastAPI(
     description="AI-powered aviation photography review API",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=TimedJSONResponse,
 )
 
 
@@ -41,6 +51,47 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Record request latency per route template."""
+    start_time = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        observe_request(
+            request.method,
+            _route_template(request),
+            status_code,
+            time.perf_counter() - start_time
+        )
+
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    """Assign a request ID and trace the request as a root span."""
+    with request_context(request.headers.get(REQUEST_ID_HEADER)) as request_id:
+        with start_span("request", **{"http.method": request.method, "http.path": request.url.path}) as span:
+            response = await call_next(request)
+            if span is not None:
+                span.set_attribute("http.status_code", response.status_code)
+        response.headers[REQUEST_ID_HEADER] = request_id
+        return response
+
+
+def _route_template(request: Request) -> str:
+    """Get the matched route's path template, or a fixed label if no route matched."""
+    route = request.scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    # Newer FastAPI matches included routers without copying their routes, so
+    # the route's own path lacks the router prefixes; the effective path has them
+    context = request.scope.get("fastapi", {}).get("effective_route_context")
+    return getattr(context, "path", None) or route.path
+
+
 # Include API routes
 app.include_router(api_router)
 
@@ -88,22 +139,47 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+def prepare_models() -> None:
+    """Preload and warm up the inference models."""
+    try:
+        InferenceFactory.preload_models()
+    except Exception as e:
+        logger.warning(f"Failed to preload models: {e}")
+    warm_up_models()
+
+
 # Lifespan events
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
     logger.info(f"Starting {settings.app_name} v{settings.version}")
 
-    # Preload models if enabled
+    # Preload models if enabled, in the background: /health answers while
+    # they load and /ready reports when they are warm
+    model_startup = None
     if settings.preload_models and settings.environment != "test":
-        try:
-            InferenceFactory.preload_models()
-        except Exception as e:
-            logger.warning(f"Failed to preload models: {e}")
+        model_startup = asyncio.create_task(asyncio.to_thread(prepare_models))
+
+    if settings.redis_enabled:
+        start_stats_flusher()
+        start_swap_sync()
+    if settings.jobs_enabled:
+        start_job_workers()
 
     yield
 
     logger.info(f"Shutting down {settings.app_name}")
+    if model_startup is not None and not model_startup.done():
+        model_startup.cancel()
+    if settings.jobs_enabled:
+        await stop_job_workers()
+    if settings.redis_enabled:
+        await stop_swap_sync()
+        await stop_stats_flusher()
+    await close_image_fetcher()
+    shutdown_executors(wait=False)
+    # Write out the spans still queued by the file exporter
+    await asyncio.to_thread(reset_exporter)
 
 
 app.router.lifespan_context = lifespan
@@ -121,12 +197,6 @@ async def root() -> dict[str, str]:
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(
-        "app.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.reload,
-        workers=settings.workers if not settings.reload else 1
-    )
+    from app.launcher import main
+
+    main()
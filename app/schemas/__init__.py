@@ -2,6 +2,11 @@
 Pydantic schemas for Aerovision-V1-Server.
 """
 
+from app.schemas.admin import (
+    ModelSwapInput,
+    ModelSwapResponse,
+    ModelSwapWorkerStatus,
+)
 from app.schemas.aircraft import (
     AircraftResponse,
     AircraftResult,
@@ -17,14 +22,23 @@ from app.schemas.airline import (
 )
 from app.schemas.common import (
     BatchImageInput,
+    CacheStats,
     ErrorDetail,
     ErrorResponse,
     HealthResponse,
     ImageInput,
     Meta,
+    ModelMemoryStats,
+    ProcessMemoryStats,
+    ReadinessResponse,
     StatsResponse,
     SuccessResponse,
 )
+from app.schemas.job import (
+    JobReviewInput,
+    JobReviewResultsPage,
+    JobStatus,
+)
 from app.schemas.quality import (
     QualityResponse,
     QualityResult,
@@ -41,6 +55,7 @@ from app.schemas.registration import (
     OcrMatch,
 )
 from app.schemas.review import (
+    ReviewMeta,
     ReviewResponse,
     ReviewResult,
     BatchReviewResponse,
@@ -61,6 +76,18 @@ __all__ = [
     "ErrorDetail",
     "HealthResponse",
     "StatsResponse",
+    "CacheStats",
+    "ModelMemoryStats",
+    "ProcessMemoryStats",
+    "ReadinessResponse",
+    # Admin
+    "ModelSwapInput",
+    "ModelSwapResponse",
+    "ModelSwapWorkerStatus",
+    # Jobs
+    "JobReviewInput",
+    "JobReviewResultsPage",
+    "JobStatus",
     # Quality
     "QualityResponse",
     "QualityResult",
@@ -86,6 +113,7 @@ __all__ = [
     "YoloBox",
     "OcrMatch",
     # Review
+    "ReviewMeta",
     "ReviewResponse",
     "ReviewResult",
     "BatchReviewResponse",
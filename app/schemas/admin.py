@@ -0,0 +1,40 @@
+"""
+Schemas for administrative API.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ModelSwapInput(BaseModel):
+    """Input schema for a model swap."""
+
+    weights_path: str | None = Field(
+        None,
+        description="Weights file inside the model directory; the configured best.pt by default"
+    )
+
+
+class ModelSwapWorkerStatus(BaseModel):
+    """Outcome of a model swap in one worker process."""
+
+    worker: str = Field(..., description="Worker ID (host:pid)")
+    status: Literal["swapped", "unchanged", "failed", "pending"] = Field(
+        ..., description="Swap outcome; pending if the worker has not reported in time"
+    )
+    version: str | None = Field(None, description="Version the worker serves after the swap")
+    error: str | None = Field(None, description="Error message if the swap failed")
+
+
+class ModelSwapResponse(BaseModel):
+    """Result of a model swap."""
+
+    model: str = Field(..., description="Model name")
+    previous_version: str | None = Field(None, description="Version served before the swap (None if not loaded)")
+    version: str = Field(..., description="Version served from now on")
+    swapped: bool = Field(..., description="Whether a new model was swapped in (false if the version is unchanged)")
+    load_seconds: float | None = Field(None, description="Time spent loading the new model")
+    warmup_seconds: float | None = Field(None, description="Time spent warming up the new model")
+    workers: list[ModelSwapWorkerStatus] = Field(default_factory=list, description="Swap outcome per worker process")
+    complete: bool = Field(True, description="Whether every live worker reported the swap")
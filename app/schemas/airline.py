@@ -2,7 +2,7 @@
 Schemas for airline classification API.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.common import Meta
 
@@ -17,9 +17,12 @@ class Prediction(BaseModel):
 class AirlineResult(BaseModel):
     """Airline classification result."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     top1: Prediction = Field(..., description="Top-1 prediction")
     top_k: int = Field(..., ge=1, description="Number of top-k predictions returned")
     predictions: list[Prediction] = Field(..., description="Top-k predictions")
+    model_version: str | None = Field(None, description="Version of the model that produced this result")
 
 
 class AirlineResponse(AirlineResult):
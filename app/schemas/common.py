@@ -3,7 +3,7 @@ Common Pydantic schemas for Aerovision-V1-Server.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -76,6 +76,54 @@ class HealthResponse(BaseModel):
     uptime_seconds: float = Field(..., description="Service uptime in seconds")
 
 
+class ReadinessResponse(BaseModel):
+    """Readiness check response."""
+
+    ready: bool = Field(..., description="Whether this worker should receive traffic")
+    models: dict[str, Literal["not_loaded", "loading", "loaded", "warming", "ready", "failed"]] = Field(
+        ..., description="Lifecycle state of each model"
+    )
+    required: list[str] = Field(default_factory=list, description="Models that must be ready for the worker to be ready")
+    failed: list[str] = Field(default_factory=list, description="Models that failed to load")
+    load_seconds: dict[str, float] = Field(default_factory=dict, description="Load time of each model")
+    warmup_seconds: dict[str, float] = Field(default_factory=dict, description="Warm-up time of each model")
+
+
+class CacheStats(BaseModel):
+    """Result cache statistics."""
+
+    hits: int = Field(..., ge=0, description="Total cache hits")
+    memory_hits: int = Field(..., ge=0, description="Hits served from the in-process tier")
+    redis_hits: int = Field(..., ge=0, description="Hits served from the Redis tier")
+    misses: int = Field(..., ge=0, description="Cache misses")
+    entries: int = Field(..., ge=0, description="Entries in the in-process tier")
+    bytes: int = Field(..., ge=0, description="Bytes used by the in-process tier")
+    max_bytes: int = Field(..., ge=0, description="Byte budget of the in-process tier")
+
+
+class ModelMemoryStats(BaseModel):
+    """Identity and memory attribution of a loaded model."""
+
+    kind: str = Field(..., description="Loader kind")
+    digest: str = Field(..., description="Weights content hash (prefix)")
+    paths: list[str] = Field(..., description="Weights files")
+    device: str = Field(..., description="Device the model runs on")
+    users: list[str] = Field(..., description="Components sharing this instance")
+    load_seconds: float = Field(..., ge=0, description="Load time in seconds")
+    rss_bytes: int = Field(..., ge=0, description="Resident memory added by loading the model")
+    parameter_bytes: Optional[int] = Field(default=None, description="Parameter and buffer storage, if known")
+
+
+class ProcessMemoryStats(BaseModel):
+    """Memory footprint of the worker process."""
+
+    pid: int = Field(..., description="Worker process ID")
+    rss_bytes: int = Field(..., ge=0, description="Resident set size")
+    pss_bytes: Optional[int] = Field(default=None, description="Proportional set size (shared pages split between sharers)")
+    shared_bytes: Optional[int] = Field(default=None, description="Resident pages shared with other processes")
+    private_bytes: Optional[int] = Field(default=None, description="Resident pages private to this worker")
+
+
 class StatsResponse(BaseModel):
     """Request statistics response."""
 
@@ -84,3 +132,6 @@ class StatsResponse(BaseModel):
     failed_requests: int = Field(..., description="Number of failed requests")
     uptime_seconds: float = Field(..., description="Service uptime in seconds")
     requests_per_second: float = Field(..., description="Average requests per second")
+    result_cache: Optional[CacheStats] = Field(default=None, description="Result cache statistics")
+    models: list[ModelMemoryStats] = Field(default_factory=list, description="Loaded models in this worker")
+    process: Optional[ProcessMemoryStats] = Field(default=None, description="Memory of this worker")
@@ -0,0 +1,47 @@
+"""
+Schemas for asynchronous batch job API.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.schemas.review import BatchReviewItem
+
+
+class JobReviewInput(BaseModel):
+    """Input schema for a batch review job."""
+
+    images: list[str] = Field(
+        ...,
+        description="List of images as base64 encoded strings or URLs (up to job_max_images)",
+        min_length=1
+    )
+
+
+class JobStatus(BaseModel):
+    """Progress of a batch job."""
+
+    job_id: str = Field(..., description="Job ID")
+    kind: str = Field(..., description="Job kind")
+    status: Literal["queued", "running", "completed", "failed"] = Field(..., description="Job status")
+    error: str | None = Field(None, description="Why the job failed, if it did")
+    total: int = Field(..., ge=0, description="Total number of images")
+    processed: int = Field(..., ge=0, description="Number of images processed so far")
+    successful: int = Field(..., ge=0, description="Number of successful reviews so far")
+    failed: int = Field(..., ge=0, description="Number of failed reviews so far")
+    progress: float = Field(..., ge=0.0, le=1.0, description="Fraction of images processed")
+    created_at: float = Field(..., description="Creation time (Unix seconds)")
+    updated_at: float = Field(..., description="Last update time (Unix seconds)")
+
+
+class JobReviewResultsPage(BaseModel):
+    """A page of batch review job results."""
+
+    job_id: str = Field(..., description="Job ID")
+    status: Literal["queued", "running", "completed", "failed"] = Field(..., description="Job status")
+    offset: int = Field(..., ge=0, description="Index of the first image covered by this page")
+    limit: int = Field(..., ge=1, description="Number of images covered by this page")
+    total: int = Field(..., ge=0, description="Total number of images")
+    next_offset: int | None = Field(None, description="Offset of the next page, if any")
+    results: list[BatchReviewItem] = Field(..., description="Finished results in this page, by index")
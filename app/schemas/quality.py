@@ -2,7 +2,7 @@
 Schemas for quality assessment API.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.common import Meta
 
@@ -20,9 +20,12 @@ class QualityDetails(BaseModel):
 class QualityResult(BaseModel):
     """Quality assessment result."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     pass_: bool = Field(..., alias="pass", description="Whether image passes quality threshold")
     score: float = Field(..., ge=0, le=1, description="Overall quality score (0-1)")
     details: QualityDetails = Field(..., description="Detailed quality scores")
+    model_version: str | None = Field(None, description="Version of the model that produced this result")
 
 
 class QualityResponse(QualityResult):
@@ -46,4 +49,5 @@ class BatchQualityResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of images")
     successful: int = Field(..., ge=0, description="Number of successful assessments")
     failed: int = Field(..., ge=0, description="Number of failed assessments")
+    images_per_second: float = Field(..., ge=0, description="Batch assessment throughput")
     results: list[BatchQualityItem] = Field(..., description="Individual results")
@@ -2,7 +2,7 @@
 Schemas for registration number OCR API.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.common import Meta
 
@@ -29,11 +29,14 @@ class OcrMatch(BaseModel):
 class RegistrationResult(BaseModel):
     """Registration number OCR result."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     registration: str = Field(..., description="Recognized registration number")
     confidence: float = Field(..., ge=0, le=1, description="Overall confidence score (0-1)")
     raw_text: str = Field(..., description="Raw OCR text")
     all_matches: list[OcrMatch] = Field(default_factory=list, description="All OCR matches")
     yolo_boxes: list[YoloBox] = Field(default_factory=list, description="Bounding boxes in YOLO format")
+    model_version: str | None = Field(None, description="Version of the model that produced this result")
 
 
 class RegistrationResponse(RegistrationResult):
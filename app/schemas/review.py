@@ -4,7 +4,7 @@ Schemas for aggregated review API.
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.aircraft import AircraftResult
 from app.schemas.airline import AirlineResult
@@ -16,31 +16,43 @@ from app.schemas.registration import RegistrationResult
 class ReviewQualityResult(BaseModel):
     """Quality result in review response."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     score: float = Field(..., ge=0, le=1, description="Overall quality score (0-1)")
     pass_: bool = Field(..., alias="pass", description="Whether image passes quality threshold")
     details: Optional[QualityDetails] = Field(None, description="Detailed quality scores")
+    model_version: str | None = Field(None, description="Version of the model that produced this result")
 
 
 class ReviewAircraftResult(BaseModel):
     """Aircraft result in review response."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     type_code: str = Field(..., description="Aircraft type code")
     confidence: float = Field(..., ge=0, le=1, description="Confidence score (0-1)")
+    model_version: str | None = Field(None, description="Version of the model that produced this result")
 
 
 class ReviewAirlineResult(BaseModel):
     """Airline result in review response."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     airline_code: str = Field(..., description="Airline code")
     confidence: float = Field(..., ge=0, le=1, description="Confidence score (0-1)")
+    model_version: str | None = Field(None, description="Version of the model that produced this result")
 
 
 class ReviewRegistrationResult(BaseModel):
     """Registration result in review response."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     registration: str = Field(..., description="Recognized registration number")
     confidence: float = Field(..., ge=0, le=1, description="Confidence score (0-1)")
     clarity: float = Field(..., ge=0, le=1, description="Registration clarity score (0-1)")
+    model_version: str | None = Field(None, description="Version of the model that produced this result")
 
 
 class ReviewResult(BaseModel):
@@ -52,10 +64,19 @@ class ReviewResult(BaseModel):
     registration: Optional[ReviewRegistrationResult] = Field(None, description="Registration OCR result")
 
 
+class ReviewMeta(Meta):
+    """Review response metadata with per-component timings."""
+
+    component_times_ms: dict[str, float] = Field(
+        default_factory=dict,
+        description="Processing time of each review component in milliseconds (empty on cache hit)"
+    )
+
+
 class ReviewResponse(ReviewResult):
     """Review response with metadata."""
 
-    meta: Meta
+    meta: ReviewMeta
 
 
 class BatchReviewItem(BaseModel):
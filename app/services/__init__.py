@@ -1,14 +1,23 @@
 """
 Services for Aerovision-V1-Server.
+
+Service classes are imported on first access, so importing one service
+module (e.g. base, for the API dependencies) does not import the others.
 """
 
+import importlib
+from typing import Any
+
 from app.core.exceptions import ImageLoadError
 from app.services.base import BaseService
-from app.services.quality_service import QualityService
-from app.services.aircraft_service import AircraftService
-from app.services.airline_service import AirlineService
-from app.services.registration_service import RegistrationService
-from app.services.review_service import ReviewService
+
+_LAZY_SERVICES = {
+    "QualityService": "app.services.quality_service",
+    "AircraftService": "app.services.aircraft_service",
+    "AirlineService": "app.services.airline_service",
+    "RegistrationService": "app.services.registration_service",
+    "ReviewService": "app.services.review_service",
+}
 
 __all__ = [
     "BaseService",
@@ -19,3 +28,10 @@ __all__ = [
     "RegistrationService",
     "ReviewService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a service class on first access."""
+    if name in _LAZY_SERVICES:
+        return getattr(importlib.import_module(_LAZY_SERVICES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
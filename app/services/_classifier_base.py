@@ -5,13 +5,21 @@ Provides common functionality for aircraft and airline classification services.
 """
 
 import asyncio
-from typing import Any, Callable, TypeVar
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, TypeVar
 
 from PIL import Image
 
-from app.core.exceptions import ImageLoadError
+from app.core.config import get_settings
+from app.core.exceptions import InferenceError
 from app.core.logging import get_logger
-from app.services.base import BaseService
+from app.core.metrics import time_stage
+from app.inference.executors import get_inference_executor
+from app.inference.factory import InferenceFactory
+from app.services.base import BaseService, ImageSource
+from app.services.batching import MicroBatcher
+from app.services.chunking import get_adaptive_chunker
 
 TResult = TypeVar('TResult')
 
@@ -21,41 +29,64 @@ class ClassificationServiceBase(BaseService):
 
     def __init__(
         self,
-        classifier_factory: Callable,
         result_wrapper: Callable,
         result_type: type[TResult],
         service_name: str,
-        error_message: str
+        error_message: str,
+        model_name: str
     ):
         """
         Initialize the classification service.
 
         Args:
-            classifier_factory: Factory function to create/get the classifier
             result_wrapper: Function to wrap raw inference results
             result_type: Type of the result class
             service_name: Name for logging purposes
             error_message: Error message for failed classifications
+            model_name: Model name selecting the classifier and its inference executor
         """
+        # Fixed classifier used instead of the factory's (mainly for testing)
         self._classifier = None
-        self._classifier_factory = classifier_factory
         self._result_wrapper = result_wrapper
         self._result_type = result_type
         self._service_name = service_name
         self._error_message = error_message
+        self._model_name = model_name
+        self._batcher: MicroBatcher | None = None
 
-    def _get_classifier(self):
-        """Lazy load the classifier."""
-        if self._classifier is None:
-            self._classifier = self._classifier_factory()
-        return self._classifier
+    def _get_classifier(self) -> tuple[Any, str]:
+        """
+        Get the classifier for one inference call and its model version.
+
+        The classifier is fetched from the factory on every call rather than
+        kept, so a swapped-in model serves the next call while calls already
+        running finish on the previous one.
 
-    def classify(self, image_input: str, top_k: int | None = None) -> tuple[TResult, float]:
+        Returns:
+            Tuple of (classifier, model version)
+        """
+        if self._classifier is not None:
+            return self._classifier, InferenceFactory.get_model_version(self._model_name)
+        return InferenceFactory.get_serving_classifier(self._model_name)
+
+    def _get_batcher(self) -> MicroBatcher:
+        """Lazy create the micro-batcher feeding this service's classifier."""
+        if self._batcher is None:
+            settings = get_settings()
+            self._batcher = MicroBatcher(
+                self._classify_batch,
+                max_batch_size=settings.micro_batch_max_size,
+                max_wait_ms=settings.micro_batch_max_wait_ms,
+                name=self._service_name
+            )
+        return self._batcher
+
+    def classify(self, image_input: ImageSource, top_k: int | None = None) -> tuple[TResult, float]:
         """
         Classify image.
 
         Args:
-            image_input: Base64 encoded image or URL
+            image_input: Base64 encoded image, URL or raw image bytes
             top_k: Number of top predictions to return
 
         Returns:
@@ -78,39 +109,86 @@ class ClassificationServiceBase(BaseService):
         Returns:
             Tuple of (result, processing time ms)
         """
-        classifier = self._get_classifier()
+        classifier, model_version = self._get_classifier()
 
         def do_classify():
-            result = classifier.predict(image, top_k=top_k)
-            return self._result_wrapper(result)
+            with time_stage("inference", self._model_name):
+                result = classifier.predict(image, top_k=top_k)
+            with time_stage("wrap", self._model_name):
+                wrapped = self._result_wrapper(result)
+                wrapped.model_version = model_version
+                return wrapped
 
         result, timing = self.measure_time(do_classify)
         return result, timing
 
+    async def classify_async(self, image_input: ImageSource, top_k: int | None = None) -> tuple[TResult, float]:
+        """
+        Classify image without blocking the event loop.
+
+        Concurrent calls are merged into batched inference when micro-batching
+        is enabled. Results for previously seen images are served from the
+        result cache.
+
+        Args:
+            image_input: Base64 encoded image, URL or raw image bytes
+            top_k: Number of top predictions to return
+
+        Returns:
+            Tuple of (result, processing time ms)
+
+        Raises:
+            ImageLoadError: If image loading fails
+            InferenceError: If no result was produced for the image
+        """
+        image = await self.load_image_async(image_input)
+        return await self.cached_inference(
+            self._model_name,
+            image,
+            InferenceFactory.get_model_version(self._model_name),
+            {"top_k": top_k},
+            self._result_type,
+            lambda: self._classify_image_async(image, top_k)
+        )
+
+    async def _classify_image_async(self, image: Image.Image, top_k: int | None = None) -> tuple[TResult, float]:
+        """
+        Classify a pre-loaded image through the micro-batcher.
+
+        Args:
+            image: PIL Image object
+            top_k: Number of top predictions to return
+
+        Returns:
+            Tuple of (result, processing time ms)
+        """
+        if not get_settings().micro_batch_enabled:
+            executor = get_inference_executor(self._model_name)
+            return await executor.run(self._classify_image, image, top_k)
+
+        start_time = time.perf_counter()
+        result = await self._get_batcher().submit(image, top_k)
+        if result is None:
+            raise InferenceError(self._error_message)
+        return result, (time.perf_counter() - start_time) * 1000
+
     async def classify_batch(
         self,
-        image_inputs: list[str],
+        image_inputs: list[ImageSource],
         top_k: int | None = None
     ) -> list[dict[str, Any]]:
         """
         Classify multiple images.
 
         Args:
-            image_inputs: List of base64 encoded images or URLs
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
             top_k: Number of top predictions to return
 
         Returns:
             List of results with index, success status, and data/error
         """
-        async def load_image_async(image_input: str):
-            try:
-                loop = asyncio.get_event_loop()
-                image = await loop.run_in_executor(None, lambda: self.load_image(image_input))
-                return image
-            except ImageLoadError:
-                return None
-
-        images = await asyncio.gather(*[load_image_async(img) for img in image_inputs])
+        loaded = await self.load_images_async(image_inputs)
+        images = [image for image, _ in loaded]
 
         results = await self._classify_batch(images, top_k)
 
@@ -133,16 +211,46 @@ class ClassificationServiceBase(BaseService):
 
         return output
 
+    def classify_batch_stream(
+        self,
+        image_inputs: list[ImageSource],
+        top_k: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Classify multiple images, yielding each item as it completes.
+
+        Args:
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
+            top_k: Number of top predictions to return
+
+        Returns:
+            Async iterator of results with index, success status, and data/error
+        """
+        async def classify_one(image_input: ImageSource) -> TResult:
+            result, _ = await self.classify_async(image_input, top_k=top_k)
+            return result
+
+        return self.iter_batch(image_inputs, classify_one, self._error_message)
+
     async def _classify_batch(self, images: list[Image.Image | None], top_k: int | None = None) -> list[TResult]:
         """
         Classify multiple pre-loaded images using batch inference.
 
+        The images are inferred in chunks sized by the model's adaptive
+        chunker. Chunks are pipelined through the inference executor: one
+        chunk runs per executor worker (the chunker splits the memory budget
+        between them) and one more waits in the executor queue, so a worker
+        starts the next chunk as soon as it finishes one. No more is
+        submitted than the executor has free capacity for, so a busy
+        executor slows the batch down instead of rejecting it partway
+        through.
+
         Args:
             images: List of PIL Image objects (can contain None for failed loads)
             top_k: Number of top predictions to return
 
         Returns:
-            List of result objects
+            List of result objects, in the order of the input images
         """
         valid_images = [(idx, img) for idx, img in enumerate(images) if img is not None]
 
@@ -151,24 +259,57 @@ class ClassificationServiceBase(BaseService):
 
         indices, batch_images = zip(*sorted(valid_images, key=lambda x: x[0]))
 
-        def run_batch_prediction():
-            classifier = self._get_classifier()
-            batch_results = classifier.predict(list(batch_images), top_k=top_k)
-            return batch_results
-
-        loop = asyncio.get_event_loop()
-        batch_results = await loop.run_in_executor(None, run_batch_prediction)
+        chunker = get_adaptive_chunker(self._model_name)
+        executor = get_inference_executor(self._model_name)
+
+        def run_chunk_prediction(chunk: list[Image.Image]):
+            classifier, model_version = self._get_classifier()
+            start_time = time.perf_counter()
+            with time_stage("inference", self._model_name, len(chunk)):
+                predictions = classifier.predict(chunk, top_k=top_k)
+            chunker.observe(len(chunk), time.perf_counter() - start_time)
+            return predictions, model_version
+
+        # (positions of the chunk's images, pending chunk prediction)
+        in_flight: deque[tuple[range, asyncio.Future]] = deque()
+        # One chunk per worker plus one queued, if the executor has a queue
+        max_in_flight = executor.max_workers + min(1, executor.max_queue)
+        batch_results: list[tuple[Any, str | None]] = [(None, None)] * len(batch_images)
+        position = 0
+        try:
+            while position < len(batch_images) or in_flight:
+                while (
+                    position < len(batch_images)
+                    and len(in_flight) < max_in_flight
+                    # The first chunk is always submitted: a full executor rejects the batch as before
+                    and (not in_flight or executor.available > 0)
+                ):
+                    size = chunker.next_chunk_size(batch_images, position, executor.max_workers)
+                    chunk = list(batch_images[position:position + size])
+                    future = asyncio.wrap_future(executor.submit(run_chunk_prediction, chunk))
+                    in_flight.append((range(position, position + size), future))
+                    position += size
+
+                positions, future = in_flight.popleft()
+                predictions, model_version = await future
+                for pos, result in zip(positions, predictions):
+                    batch_results[pos] = (result, model_version)
+        finally:
+            for _, future in in_flight:
+                future.cancel()
 
         results = [None] * len(images)
         logger = get_logger(self._service_name)
 
-        for idx, result in zip(indices, batch_results):
-            if result is not None:
-                try:
-                    wrapped_result = self._result_wrapper(result)
-                    results[idx] = wrapped_result
-                except Exception as e:
-                    logger.error(f"Failed to wrap result at index {idx}: {e}")
-                    results[idx] = None
+        with time_stage("wrap", self._model_name, len(batch_images)):
+            for idx, (result, model_version) in zip(indices, batch_results):
+                if result is not None:
+                    try:
+                        wrapped_result = self._result_wrapper(result)
+                        wrapped_result.model_version = model_version
+                        results[idx] = wrapped_result
+                    except Exception as e:
+                        logger.error(f"Failed to wrap result at index {idx}: {e}")
+                        results[idx] = None
 
         return results
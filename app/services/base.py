@@ -5,29 +5,42 @@ Provides common functionality for request processing, image loading,
 and error handling.
 """
 
+import asyncio
 import base64
+import hashlib
 import time
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
 from PIL import Image
 
+from app.core.config import get_settings
 from app.core.exceptions import ImageLoadError
+from app.core.http_client import get_image_fetcher
 from app.core.logging import logger
+from app.core.metrics import time_stage
+from app.core.tracing import start_span
+from app.core.result_cache import get_result_cache, make_cache_key
+
+# Image input: base64 string or URL, or raw encoded image bytes (uploads)
+ImageSource = str | bytes
+
+# Key under which the digest of an image's encoded bytes is kept in Image.info
+IMAGE_DIGEST_KEY = "aerovision_digest"
 
 
 class BaseService:
     """Base class for all services with common utilities."""
 
     @staticmethod
-    def load_image(image_input: str) -> Image.Image:
+    def load_image(image_input: ImageSource) -> Image.Image:
         """
-        Load an image from base64 string or URL.
+        Load an image from base64 string, URL or raw bytes.
 
         Args:
-            image_input: Base64 encoded image or URL
+            image_input: Base64 encoded image, URL or raw image bytes
 
         Returns:
             PIL.Image: Loaded image
@@ -35,6 +48,10 @@ class BaseService:
         Raises:
             ImageLoadError: If image loading fails
         """
+        # Raw uploaded bytes go straight to the decoder
+        if isinstance(image_input, (bytes, bytearray, memoryview)):
+            return BaseService._load_from_bytes(image_input)
+
         # Check if it's a URL
         if image_input.startswith(("http://", "https://")):
             return BaseService._load_from_url(image_input)
@@ -49,13 +66,115 @@ class BaseService:
         except Exception:
             raise ImageLoadError(f"Cannot load image from input: {image_input[:50]}...")
 
+    @staticmethod
+    async def load_image_async(image_input: ImageSource) -> Image.Image:
+        """
+        Load an image without blocking the event loop.
+
+        URLs are downloaded through the shared pooled image fetcher; all
+        inputs, including downloaded ones, are decoded on the default
+        executor.
+
+        Args:
+            image_input: Base64 encoded image, URL or raw image bytes
+
+        Returns:
+            PIL.Image: Loaded image
+
+        Raises:
+            ImageLoadError: If image loading fails
+        """
+        if isinstance(image_input, str) and image_input.startswith(("http://", "https://")):
+            data = await get_image_fetcher().fetch(image_input)
+            return await asyncio.to_thread(BaseService._load_from_bytes, data)
+
+        return await asyncio.to_thread(BaseService.load_image, image_input)
+
+    @staticmethod
+    async def load_images_async(
+        image_inputs: list[ImageSource],
+        concurrency: int | None = None
+    ) -> list[tuple[Image.Image | None, str | None]]:
+        """
+        Load multiple images with bounded concurrency.
+
+        Args:
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
+            concurrency: Maximum number of images loaded at once
+                (defaults to the image_fetch_batch_concurrency setting)
+
+        Returns:
+            List of (image, error) tuples in input order; image is None
+            and error holds the message when loading failed
+        """
+        semaphore = asyncio.Semaphore(concurrency or get_settings().image_fetch_batch_concurrency)
+
+        async def load_one(index: int, image_input: ImageSource) -> tuple[Image.Image | None, str | None]:
+            async with semaphore:
+                with start_span("batch_item", index=index) as span:
+                    try:
+                        return await BaseService.load_image_async(image_input), None
+                    except Exception as e:
+                        if span is not None:
+                            span.error = str(e)
+                        return None, str(e)
+
+        return await asyncio.gather(*[load_one(i, img) for i, img in enumerate(image_inputs)])
+
+    @staticmethod
+    async def iter_batch(
+        image_inputs: list[ImageSource],
+        process: Callable[[ImageSource], Awaitable[Any]],
+        error_message: str,
+        concurrency: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Process images individually and yield batch items as they complete.
+
+        Each image goes through its service's single-image path, so
+        classifier inputs from the same batch are still merged by the
+        micro-batcher and cached results are reused.
+
+        Args:
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
+            process: Async function returning the result model for one image
+            error_message: Error reported for failed items (image load
+                errors report their own message)
+            concurrency: Maximum number of images in flight
+                (defaults to the image_fetch_batch_concurrency setting)
+
+        Yields:
+            Items with index, success status, and data/error, in completion order
+        """
+        semaphore = asyncio.Semaphore(concurrency or get_settings().image_fetch_batch_concurrency)
+
+        async def process_one(index: int, image_input: ImageSource) -> dict[str, Any]:
+            async with semaphore:
+                with start_span("batch_item", index=index) as span:
+                    try:
+                        result = await process(image_input)
+                    except Exception as e:
+                        if span is not None:
+                            span.error = str(e)
+                        error = str(e) if isinstance(e, ImageLoadError) else error_message
+                        return {"index": index, "success": False, "data": None, "error": error}
+            return {"index": index, "success": True, "data": result.model_dump(by_alias=True), "error": None}
+
+        tasks = [asyncio.ensure_future(process_one(i, img)) for i, img in enumerate(image_inputs)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     @staticmethod
     def _load_from_url(url: str) -> Image.Image:
         """Load image from URL."""
         try:
             response = httpx.get(url, timeout=30.0, follow_redirects=True)
             response.raise_for_status()
-            return Image.open(BytesIO(response.content))
+            return BaseService._load_from_bytes(response.content)
         except httpx.HTTPError as e:
             raise ImageLoadError(f"Failed to load image from URL: {e}")
 
@@ -67,16 +186,130 @@ class BaseService:
             if "," in data:
                 data = data.split(",", 1)[1]
 
-            image_bytes = base64.b64decode(data)
-            return Image.open(BytesIO(image_bytes))
-        except (ValueError, OSError) as e:
+            # Reject oversized payloads before decoding the base64 text
+            BaseService._check_encoded_size(len(data) * 3 // 4)
+
+            with time_stage("base64_decode"):
+                image_bytes = base64.b64decode(data)
+        except ValueError as e:
             raise ImageLoadError(f"Failed to decode base64 image: {e}")
 
+        return BaseService._load_from_bytes(image_bytes)
+
+    @staticmethod
+    def _load_from_bytes(data: bytes | bytearray | memoryview) -> Image.Image:
+        """
+        Load image from raw encoded bytes.
+
+        Size and pixel limits are checked from the header before the pixel
+        data is decoded. Large JPEGs are decoded at a reduced DCT scale that
+        still covers the largest model input. Pixel data is decoded eagerly
+        so that decode time and errors surface here.
+        """
+        BaseService._check_encoded_size(len(data))
+
+        try:
+            image = Image.open(BytesIO(data))
+        except (ValueError, OSError, Image.DecompressionBombError) as e:
+            raise ImageLoadError(f"Failed to decode image: {e}")
+
+        settings = get_settings()
+        width, height = image.size
+        if width * height > settings.max_image_pixels:
+            raise ImageLoadError(
+                f"Image too large: {width}x{height} exceeds {settings.max_image_pixels} pixels"
+            )
+
+        if settings.decode_reduced_enabled and image.format == "JPEG":
+            target = settings.decode_min_size
+            if min(width, height) >= 2 * target:
+                image.draft("RGB", (target, target))
+
+        with time_stage("image_decode"):
+            try:
+                image.load()
+            except (ValueError, OSError) as e:
+                raise ImageLoadError(f"Failed to decode image: {e}")
+
+        image.info[IMAGE_DIGEST_KEY] = hashlib.sha256(data).hexdigest()
+        return image
+
+    @staticmethod
+    def _check_encoded_size(size: int) -> None:
+        """Enforce the max_image_size_mb limit on encoded image data."""
+        max_mb = get_settings().max_image_size_mb
+        if size > max_mb * 1024 * 1024:
+            raise ImageLoadError(f"Image too large: {size} bytes exceeds {max_mb} MB")
+
+    @staticmethod
+    def image_digest(image: Image.Image) -> str:
+        """
+        Get the content digest of an image.
+
+        Uses the digest of the encoded bytes recorded at load time, falling
+        back to hashing the pixel data for images created in memory.
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = image.info.get(IMAGE_DIGEST_KEY)
+        if digest is None:
+            digest = hashlib.sha256(image.tobytes()).hexdigest()
+            image.info[IMAGE_DIGEST_KEY] = digest
+        return digest
+
+    @staticmethod
+    async def cached_inference(
+        namespace: str,
+        image: Image.Image,
+        model_version: str,
+        params: dict[str, Any],
+        result_type: type,
+        compute: Callable[[], Awaitable[tuple[Any, float]]],
+        should_cache: Callable[[Any], bool] | None = None
+    ) -> tuple[Any, float]:
+        """
+        Serve an inference result from the result cache, computing it on a miss.
+
+        Args:
+            namespace: Cache namespace (model or endpoint name)
+            image: PIL Image object the result is computed from
+            model_version: Identity/version of the models involved
+            params: Request parameters that influence the result
+            result_type: Pydantic model class of the result
+            compute: Coroutine function returning (result, processing time ms)
+            should_cache: Optional predicate deciding whether a computed
+                result may be stored (e.g. to skip partial results)
+
+        Returns:
+            Tuple of (result, processing time ms)
+        """
+        if not get_settings().result_cache_enabled:
+            return await compute()
+
+        start_time = time.perf_counter()
+        cache = get_result_cache()
+        key = make_cache_key(namespace, BaseService.image_digest(image), model_version, params)
+
+        cached = await cache.get(key)
+        if cached is not None:
+            return result_type.model_validate(cached), (time.perf_counter() - start_time) * 1000
+
+        result, timing = await compute()
+        if should_cache is None or should_cache(result):
+            await cache.set(key, result.model_dump(by_alias=True, mode="json"))
+        return result, timing
+
     @staticmethod
     def measure_time(func, *args, **kwargs) -> tuple[Any, float]:
         """
         Measure execution time of a function.
 
+        The call is traced as a span named after the enclosing function.
+
         Args:
             func: Function to execute
             *args: Function arguments
@@ -85,14 +318,32 @@ class BaseService:
         Returns:
             Tuple of (result, execution_time_ms)
         """
+        span_name = getattr(func, "__qualname__", func.__name__).split(".<locals>")[0]
         start_time = time.perf_counter()
         try:
-            result = func(*args, **kwargs)
+            with start_span(span_name):
+                result = func(*args, **kwargs)
             return result, (time.perf_counter() - start_time) * 1000
         except Exception as e:
             logger.error(f"Error in {func.__name__}: {e}")
             raise
 
+    @staticmethod
+    def traced_item(index: int, func, *args) -> Any:
+        """
+        Run one item of a batch as a child span of the batch.
+
+        Args:
+            index: Item index within the batch
+            func: Function processing the item
+            *args: Function arguments
+
+        Returns:
+            Function result
+        """
+        with start_span("batch_item", index=index):
+            return func(*args)
+
     @staticmethod
     def safe_execute(func, *args, default=None, **kwargs) -> Any:
         """
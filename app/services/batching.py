@@ -0,0 +1,132 @@
+"""
+Dynamic micro-batching for single-image inference requests.
+
+Concurrent single-image requests are collected into small batches and
+dispatched through one batch inference call. Each caller receives the
+result for its own image.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+from PIL import Image
+
+from app.core.logging import get_logger
+
+logger = get_logger("services.batching")
+
+BatchFunction = Callable[[list[Image.Image], Any], Awaitable[list[Any]]]
+
+
+class MicroBatcher:
+    """
+    Merge concurrent single-image requests into batched inference calls.
+
+    Requests are grouped by their inference parameters (e.g. ``top_k``) so
+    that every image in a batch shares the same call arguments. A group is
+    flushed when it reaches ``max_batch_size`` or when its oldest request has
+    waited ``max_wait_ms`` milliseconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFunction,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        name: str = "batcher"
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_fn: Async function taking (images, params) and returning one
+                result per image, in the same order
+            max_batch_size: Maximum number of images per batch
+            max_wait_ms: Maximum time a request waits for more requests to join
+            name: Name for logging purposes
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.name = name
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[Hashable, list[tuple[Image.Image, asyncio.Future]]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, image: Image.Image, params: Hashable = None) -> Any:
+        """
+        Submit one image and wait for its result.
+
+        Args:
+            image: PIL Image object
+            params: Inference parameters shared by the batch (must be hashable)
+
+        Returns:
+            The result produced by the batch function for this image
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pending batches belong to the loop they were created on
+            self._pending.clear()
+            self._timers.clear()
+            self._loop = loop
+
+        future = loop.create_future()
+        queue = self._pending.setdefault(params, [])
+        queue.append((image, future))
+
+        if len(queue) >= self.max_batch_size:
+            self._flush(params)
+        elif params not in self._timers:
+            self._timers[params] = loop.call_later(
+                self.max_wait_ms / 1000, self._flush, params
+            )
+
+        return await future
+
+    def _flush(self, params: Hashable) -> None:
+        """Dispatch the pending group for the given parameters."""
+        timer = self._timers.pop(params, None)
+        if timer is not None:
+            timer.cancel()
+
+        queue = self._pending.pop(params, None)
+        if not queue:
+            return
+
+        task = self._loop.create_task(self._run_batch(queue, params))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        queue: list[tuple[Image.Image, asyncio.Future]],
+        params: Hashable
+    ) -> None:
+        """Run one batch and route each result back to its caller."""
+        images = [image for image, _ in queue]
+        logger.debug(f"{self.name}: dispatching batch of {len(images)}")
+
+        try:
+            results = await self._batch_fn(images, params)
+        except Exception as e:
+            logger.error(f"{self.name}: batch of {len(images)} failed: {e}")
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for idx, (_, future) in enumerate(queue):
+            if future.done():
+                continue
+            if idx < len(results):
+                future.set_result(results[idx])
+            else:
+                future.set_exception(
+                    RuntimeError(f"{self.name}: no result returned for batch item {idx}")
+                )
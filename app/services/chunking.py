@@ -0,0 +1,158 @@
+"""
+Adaptive chunking of batch classification.
+
+A batch is split into chunks that are inferred one classifier call at a
+time. Each chunk stays within a memory budget, estimated from the decoded
+pixels of its images plus a fixed per-image inference overhead, and is
+sized so that its inference takes about a target time given the observed
+per-image latency. Large images therefore run in small chunks, while
+small, fast images are merged into large ones.
+"""
+
+import threading
+from typing import Sequence
+
+from PIL import Image
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger("services.chunking")
+
+# Weight of the newest observation in the per-image latency average
+_LATENCY_SMOOTHING = 0.3
+
+
+class AdaptiveChunker:
+    """Plans chunk sizes for one model from a memory budget and observed latency."""
+
+    def __init__(
+        self,
+        name: str,
+        memory_budget_bytes: int,
+        image_overhead_bytes: int,
+        target_chunk_ms: float,
+        max_chunk_size: int
+    ):
+        """
+        Initialize the chunker.
+
+        Args:
+            name: Model name, for logging purposes
+            memory_budget_bytes: Memory all concurrently running chunks may use
+            image_overhead_bytes: Estimated inference memory per image besides its pixels
+                (input tensor and activations)
+            target_chunk_ms: Inference time a chunk should take
+            max_chunk_size: Maximum number of images per chunk
+        """
+        if max_chunk_size < 1:
+            raise ValueError("max_chunk_size must be at least 1")
+
+        self.name = name
+        self.memory_budget_bytes = memory_budget_bytes
+        self.image_overhead_bytes = image_overhead_bytes
+        self.target_chunk_ms = target_chunk_ms
+        self.max_chunk_size = max_chunk_size
+
+        self._lock = threading.Lock()
+        self._per_image_ms: float | None = None
+
+    @property
+    def per_image_ms(self) -> float | None:
+        """Smoothed inference time per image, or None before the first chunk."""
+        return self._per_image_ms
+
+    def estimate_bytes(self, image: Image.Image) -> int:
+        """Estimate the memory inferring one image takes."""
+        return image.width * image.height * 3 + self.image_overhead_bytes
+
+    def latency_limit(self) -> int:
+        """Largest chunk expected to finish within the target time."""
+        per_image_ms = self._per_image_ms
+        if not per_image_ms:
+            return self.max_chunk_size
+        return max(1, min(self.max_chunk_size, int(self.target_chunk_ms / per_image_ms)))
+
+    def next_chunk_size(self, images: Sequence[Image.Image], start: int = 0, workers: int = 1) -> int:
+        """
+        Get the size of the next chunk.
+
+        Args:
+            images: Images of the batch
+            start: Position of the first image not yet chunked
+            workers: Number of chunks that may run at once, which share the memory budget
+
+        Returns:
+            Number of images from start forming the next chunk (at least one,
+            even if that image alone exceeds the budget)
+        """
+        budget = self.memory_budget_bytes / max(1, workers)
+        end = min(len(images), start + self.latency_limit())
+
+        size, used = 0, 0
+        for image in images[start:end]:
+            cost = self.estimate_bytes(image)
+            if size > 0 and used + cost > budget:
+                break
+            used += cost
+            size += 1
+        return max(1, size)
+
+    def observe(self, images: int, seconds: float) -> None:
+        """
+        Record the inference time of a chunk.
+
+        Args:
+            images: Number of images in the chunk
+            seconds: Inference time of the chunk
+        """
+        if images < 1:
+            return
+        per_image_ms = seconds * 1000 / images
+        with self._lock:
+            if self._per_image_ms is None:
+                self._per_image_ms = per_image_ms
+            else:
+                self._per_image_ms += _LATENCY_SMOOTHING * (per_image_ms - self._per_image_ms)
+        logger.debug(f"{self.name}: {images} images in {seconds * 1000:.0f} ms, next limit {self.latency_limit()}")
+
+
+_chunkers: dict[str, AdaptiveChunker] = {}
+_chunkers_lock = threading.Lock()
+
+
+def get_adaptive_chunker(name: str) -> AdaptiveChunker:
+    """
+    Get or create the chunker for a model.
+
+    Chunkers are shared by every service instance of the model, so latency
+    observed by one informs the others. Sizes come from the batch_chunk_*
+    settings.
+
+    Args:
+        name: Model name (aircraft, airline)
+
+    Returns:
+        AdaptiveChunker instance for the model
+    """
+    chunker = _chunkers.get(name)
+    if chunker is not None:
+        return chunker
+
+    with _chunkers_lock:
+        if name not in _chunkers:
+            settings = get_settings()
+            _chunkers[name] = AdaptiveChunker(
+                name,
+                memory_budget_bytes=int(settings.batch_chunk_memory_mb * 1024 * 1024),
+                image_overhead_bytes=int(settings.batch_chunk_image_overhead_mb * 1024 * 1024),
+                target_chunk_ms=settings.batch_chunk_target_ms,
+                max_chunk_size=settings.batch_chunk_max_size
+            )
+        return _chunkers[name]
+
+
+def clear_chunkers() -> None:
+    """Forget all chunkers and their latency observations (mainly for testing)."""
+    with _chunkers_lock:
+        _chunkers.clear()
@@ -2,9 +2,10 @@
 History service for managing historical audit records with vector database.
 """
 
+import asyncio
 import threading
-from pathlib import Path
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 import numpy as np
 from PIL import Image
@@ -12,6 +13,7 @@ from PIL import Image
 from app.core import get_logger, get_settings
 from app.core.exceptions import AerovisionException
 from app.inference.factory import InferenceFactory
+from app.services.base import BaseService
 
 logger = get_logger("history_service")
 
@@ -28,7 +30,10 @@ class HistoryService:
         """
         Get or create the enhanced predictor with vector database.
 
-        Uses InferenceFactory to load models with configuration.
+        The predictor embeds with the models InferenceFactory provides for
+        the serving aircraft and airline weights instead of loading its own
+        copies; they are re-read on every call, so a swapped classifier is
+        picked up.
 
         Returns:
             Enhanced predictor instance or None if not available.
@@ -36,57 +41,57 @@ class HistoryService:
         Raises:
             AerovisionException: If model loading fails.
         """
-        if self._enhanced_predictor is not None:
-            return self._enhanced_predictor
-
-        with self._lock:
+        try:
+            if self._enhanced_predictor is None:
+                with self._lock:
+                    if self._enhanced_predictor is None:
+                        self._enhanced_predictor = self._create_model_predictor()
             if self._enhanced_predictor is not None:
-                return self._enhanced_predictor
+                self._use_factory_models(self._enhanced_predictor)
+            return self._enhanced_predictor
 
-            try:
-                # Try to import aerovision_inference for vector database support
-                try:
-                    from aerovision_inference import ModelPredictor
-
-                    settings = get_settings()
-                    device = settings.device
-                    model_dir = settings.model_dir
-
-                    config = {
-                        'aircraft': {
-                            'path': str(Path(model_dir) / 'aircraft.pt'),
-                            'device': device,
-                            'image_size': 640
-                        },
-                        'airline': {
-                            'path': str(Path(model_dir) / 'airline.pt'),
-                            'device': device,
-                            'image_size': 640
-                        }
-                    }
-
-                    predictor = ModelPredictor(config)
-                    self._enhanced_predictor = predictor
-                    logger.info("模型预测器初始化完成")
-
-                    return self._enhanced_predictor
-
-                except ImportError as e:
-                    logger.warning(f"aerovision_inference package not available: {e}")
-                    logger.info("向量数据库功能未启用")
-                    return None
+        except Exception as e:
+            logger.error(f"初始化模型预测器失败: {e}")
+            raise AerovisionException(
+                code="MODEL_LOAD_ERROR",
+                message=f"无法初始化特征提取模型: {str(e)}"
+            )
 
-            except Exception as e:
-                logger.error(f"初始化模型预测器失败: {e}")
-                raise AerovisionException(
-                    code="MODEL_LOAD_ERROR",
-                    message=f"无法初始化特征提取模型: {str(e)}"
-                )
+    @staticmethod
+    def _create_model_predictor() -> Optional[Any]:
+        """Create the enhanced predictor, or None if aerovision_inference is not installed."""
+        try:
+            # Try to import aerovision_inference for vector database support
+            from aerovision_inference import ModelPredictor
+        except ImportError as e:
+            logger.warning(f"aerovision_inference package not available: {e}")
+            logger.info("向量数据库功能未启用")
+            return None
+
+        # No model sections, so it loads no classifiers of its own;
+        # _use_factory_models() attaches the embedding models
+        predictor = ModelPredictor({})
+        logger.info("模型预测器初始化完成")
+        return predictor
+
+    @staticmethod
+    def _use_factory_models(enhanced_predictor: Any) -> None:
+        """Point the predictor's embedding models at the ones InferenceFactory provides."""
+        predictor = getattr(enhanced_predictor, 'predictor', None)
+        if predictor is None:
+            predictor = _EmbeddingModels(get_settings().device)
+            enhanced_predictor.predictor = predictor
+        predictor.aircraft_model = InferenceFactory.get_embedding_model('aircraft')
+        predictor.airline_model = InferenceFactory.get_embedding_model('airline')
 
     def push_records(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Push historical audit records to vector database.
 
+        Records are processed in batches of history_batch_size: a batch's
+        images are loaded concurrently, embedded by both classifiers and
+        written to the vector store in bulk before the next batch is loaded.
+
         Args:
             records: List of historical record dictionaries containing:
                 - id: Record ID
@@ -104,131 +109,248 @@ class HistoryService:
                 - total: Total number of records
                 - added: Number of successfully added records
                 - failed: Number of failed records
+                - results: Per-record id, success and error
         """
         logger.info(f"收到历史记录推送请求，记录数: {len(records)}")
+        enhanced_predictor = self._require_vector_db()
+
+        inputs = [self._get_image_input(record) for record in records]
+        errors = self._initial_errors(enhanced_predictor, inputs)
+        workers = max(1, get_settings().image_fetch_batch_concurrency)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for chunk in self._batches(errors):
+                    loaded = list(pool.map(self._load_record_image, [inputs[idx] for idx in chunk]))
+                    self._ingest_batch(enhanced_predictor, records, chunk, loaded, errors)
+        except Exception as e:
+            raise self._push_error(e)
+
+        return self._summarize(records, errors)
 
-        # Check if vector database is available
+    async def push_records_async(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Push historical audit records without blocking the event loop.
+
+        Same as push_records(), with images fetched and decoded through the
+        pooled async loaders and model loading and embedding run on a
+        worker thread.
+
+        Args:
+            records: List of historical record dictionaries
+
+        Returns:
+            Dictionary with push results (see push_records)
+        """
+        logger.info(f"收到历史记录推送请求，记录数: {len(records)}")
+        enhanced_predictor = await asyncio.to_thread(self._require_vector_db)
+
+        inputs = [self._get_image_input(record) for record in records]
+        errors = self._initial_errors(enhanced_predictor, inputs)
+        try:
+            for chunk in self._batches(errors):
+                loaded = await BaseService.load_images_async([inputs[idx] for idx in chunk])
+                await asyncio.to_thread(
+                    self._ingest_batch, enhanced_predictor, records, chunk, loaded, errors
+                )
+        except Exception as e:
+            raise self._push_error(e)
+
+        return self._summarize(records, errors)
+
+    def _require_vector_db(self) -> Any:
+        """Get the enhanced predictor, raising if the vector database is unavailable."""
         enhanced_predictor = self._get_model_predictor()
         if enhanced_predictor is None or not hasattr(enhanced_predictor, 'vector_db'):
             raise AerovisionException(
                 code="VECTOR_DB_NOT_AVAILABLE",
                 message="向量数据库功能未启用"
             )
-
+        return enhanced_predictor
+
+    @staticmethod
+    def _get_image_input(record: Dict[str, Any]) -> Optional[str]:
+        """Get a record's image input: image_data (base64) first, then image_url."""
+        if record.get('metadata') and 'image_data' in record['metadata']:
+            return record['metadata']['image_data']
+        return record.get('image_url') or None
+
+    @staticmethod
+    def _load_record_image(image_input: Optional[str]) -> Tuple[Optional[Image.Image], Optional[str]]:
+        """Load a record's image, returning (image, error)."""
+        if image_input is None:
+            return None, "缺少图片数据"
         try:
-            from aerovision_inference import VectorRecord
-            from app.services.base import BaseService
-
-            added_count = 0
-            failed_count = 0
-
-            for record in records:
-                try:
-                    # Load image: prioritize image_data (base64), then image_url
-                    image_input = None
-
-                    # Check for base64 image data in metadata or use image_url
-                    if record.get('metadata') and 'image_data' in record['metadata']:
-                        image_input = record['metadata']['image_data']
-                    elif record.get('image_url'):
-                        image_input = record['image_url']
-                    else:
-                        logger.warning(f"记录 {record.get('id')} 缺少图片数据，跳过此记录")
-                        failed_count += 1
-                        continue
-
-                    # Load image using BaseService
-                    try:
-                        image = BaseService.load_image(image_input)
-                    except Exception as load_error:
-                        logger.error(f"加载图片失败 {record.get('id')}: {load_error}")
-                        failed_count += 1
-                        continue
-
-                    # Get predictor
-                    predictor = enhanced_predictor.predictor
-                    if predictor is None:
-                        logger.error(f"预测器未初始化，无法处理记录 {record.get('id')}")
-                        failed_count += 1
-                        continue
-
-                    # Use YOLO embed method to extract feature vectors
-                    try:
-                        img_array = np.array(image)
-
-                        aircraft_emb_tensor = predictor.aircraft_model.embed(
-                            img_array,
-                            imgsz=640,
-                            device=predictor.device,
-                            verbose=False
-                        )[0]
-
-                        airline_emb_tensor = predictor.airline_model.embed(
-                            img_array,
-                            imgsz=640,
-                            device=predictor.device,
-                            verbose=False
-                        )[0]
-
-                        # Convert to numpy arrays and flatten
-                        if hasattr(aircraft_emb_tensor, 'cpu'):
-                            aircraft_emb = aircraft_emb_tensor.cpu().numpy()
-                        else:
-                            aircraft_emb = np.array(aircraft_emb_tensor)
-
-                        if hasattr(airline_emb_tensor, 'cpu'):
-                            airline_emb = airline_emb_tensor.cpu().numpy()
-                        else:
-                            airline_emb = np.array(airline_emb_tensor)
-
-                        aircraft_emb = aircraft_emb.flatten()
-                        airline_emb = airline_emb.flatten()
-
-                    except Exception as embed_error:
-                        logger.error(f"特征提取失败 {record.get('id')}: {embed_error}")
-                        failed_count += 1
-                        continue
-
-                    # Create VectorRecord
-                    vector_record = VectorRecord(
-                        id=record.get('id'),
-                        image_path=record.get('image_url') or f"metadata_{record.get('id')}",
-                        aircraft_embedding=aircraft_emb,
-                        airline_embedding=airline_emb,
-                        aircraft_type=record.get('aircraft_type', ''),
-                        airline=record.get('airline', ''),
-                        aircraft_confidence=record.get('aircraft_confidence', 0.0),
-                        airline_confidence=record.get('airline_confidence', 0.0),
-                        timestamp=record.get('timestamp', ''),
-                        metadata=record.get('metadata')
-                    )
-
-                    if enhanced_predictor.vector_db.add_record(vector_record):
-                        added_count += 1
-                    else:
-                        failed_count += 1
-
-                except Exception as e:
-                    logger.error(f"添加记录 {record.get('id')} 失败: {e}")
-                    failed_count += 1
-
-            logger.info(f"历史记录推送完成: 成功={added_count}, 失败={failed_count}")
-
-            return {
-                "success": True,
-                "total": len(records),
-                "added": added_count,
-                "failed": failed_count
-            }
-
-        except AerovisionException:
-            raise
+            return BaseService.load_image(image_input), None
         except Exception as e:
-            logger.error(f"历史记录推送失败: {e}")
-            raise AerovisionException(
-                code="INTERNAL_ERROR",
-                message=f"历史记录推送失败: {str(e)}"
-            )
+            return None, f"加载图片失败: {e}"
+
+    @staticmethod
+    def _initial_errors(enhanced_predictor: Any, inputs: List[Optional[str]]) -> List[Optional[str]]:
+        """Get the errors known before loading: missing images and a missing predictor."""
+        errors: List[Optional[str]] = [
+            "缺少图片数据" if image_input is None else None for image_input in inputs
+        ]
+        if enhanced_predictor.predictor is None:
+            logger.error("预测器未初始化，无法处理记录")
+            errors = [error or "预测器未初始化" for error in errors]
+        return errors
+
+    @staticmethod
+    def _batches(errors: List[Optional[str]]) -> Iterator[List[int]]:
+        """Yield the indexes of records still to process, history_batch_size at a time."""
+        batch_size = max(1, get_settings().history_batch_size)
+        pending = [idx for idx, error in enumerate(errors) if error is None]
+        for start in range(0, len(pending), batch_size):
+            yield pending[start:start + batch_size]
+
+    def _ingest_batch(
+        self,
+        enhanced_predictor: Any,
+        records: List[Dict[str, Any]],
+        chunk: List[int],
+        loaded: List[Tuple[Optional[Image.Image], Optional[str]]],
+        errors: List[Optional[str]]
+    ) -> None:
+        """
+        Embed one batch of loaded images and write its vector records in bulk.
+
+        Args:
+            enhanced_predictor: Predictor holding the models and vector_db
+            records: Historical records
+            chunk: Indexes of the batch's records
+            loaded: (image, error) per record of the batch, aligned with chunk
+            errors: Error per record, updated in place for the batch
+        """
+        from aerovision_inference import VectorRecord
+
+        predictor = enhanced_predictor.predictor
+        embeddable, arrays = [], []
+        for idx, (image, error) in zip(chunk, loaded):
+            if image is None:
+                errors[idx] = error or "加载图片失败"
+            else:
+                embeddable.append(idx)
+                arrays.append(np.array(image))
+        if not embeddable:
+            return
+
+        try:
+            aircraft_embs = self._embed_batch(predictor, predictor.aircraft_model, arrays)
+            airline_embs = self._embed_batch(predictor, predictor.airline_model, arrays)
+        except Exception as embed_error:
+            logger.error(f"批量特征提取失败: {embed_error}")
+            for idx in embeddable:
+                errors[idx] = f"特征提取失败: {embed_error}"
+            return
+
+        vector_records = []
+        for idx, aircraft_emb, airline_emb in zip(embeddable, aircraft_embs, airline_embs):
+            record = records[idx]
+            vector_records.append(VectorRecord(
+                id=record.get('id'),
+                image_path=record.get('image_url') or f"metadata_{record.get('id')}",
+                aircraft_embedding=aircraft_emb,
+                airline_embedding=airline_emb,
+                aircraft_type=record.get('aircraft_type', ''),
+                airline=record.get('airline', ''),
+                aircraft_confidence=record.get('aircraft_confidence', 0.0),
+                airline_confidence=record.get('airline_confidence', 0.0),
+                timestamp=record.get('timestamp', ''),
+                metadata=record.get('metadata')
+            ))
+
+        written = self._write_records(enhanced_predictor.vector_db, vector_records)
+        for idx, ok in zip(embeddable, written):
+            if not ok:
+                errors[idx] = "写入向量数据库失败"
+
+    @staticmethod
+    def _summarize(records: List[Dict[str, Any]], errors: List[Optional[str]]) -> Dict[str, Any]:
+        """Build the push results from the per-record errors."""
+        results = [
+            {"id": record.get('id'), "success": error is None, "error": error}
+            for record, error in zip(records, errors)
+        ]
+        for result in results:
+            if not result["success"]:
+                logger.warning(f"记录 {result['id']} 处理失败: {result['error']}")
+
+        added_count = sum(1 for r in results if r["success"])
+        failed_count = len(results) - added_count
+        logger.info(f"历史记录推送完成: 成功={added_count}, 失败={failed_count}")
+
+        return {
+            "success": True,
+            "total": len(records),
+            "added": added_count,
+            "failed": failed_count,
+            "results": results
+        }
+
+    @staticmethod
+    def _push_error(error: Exception) -> AerovisionException:
+        """Wrap an unexpected push failure, passing AerovisionException through."""
+        if isinstance(error, AerovisionException):
+            return error
+        logger.error(f"历史记录推送失败: {error}")
+        return AerovisionException(
+            code="INTERNAL_ERROR",
+            message=f"历史记录推送失败: {str(error)}"
+        )
+
+    @staticmethod
+    def _embed_batch(predictor: Any, model: Any, arrays: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Extract flattened embeddings for a batch of images.
+
+        Falls back to one call per image if the model does not return one
+        embedding per input for a batched call.
+        """
+        def embed(source):
+            return model.embed(source, imgsz=640, device=predictor.device, verbose=False)
+
+        embeddings = list(embed(arrays)) if len(arrays) > 1 else []
+        if len(embeddings) != len(arrays):
+            embeddings = [embed(array)[0] for array in arrays]
+
+        return [_to_numpy(embedding).flatten() for embedding in embeddings]
+
+    @staticmethod
+    def _write_records(vector_db: Any, vector_records: List[Any]) -> List[bool]:
+        """
+        Write vector records, in one bulk call when the store supports it.
+
+        A store returning None is taken to raise on failure, so None means
+        every record was written. A bulk write that returns neither per-record
+        flags nor a full count is redone record by record (records are keyed
+        by id, so rewriting stored ones replaces them) to find which failed.
+
+        Returns:
+            Per-record success flags
+        """
+        add_records = getattr(vector_db, 'add_records', None)
+        if add_records is not None:
+            try:
+                written = add_records(vector_records)
+                if written is None or written is True:
+                    return [True] * len(vector_records)
+                if isinstance(written, (list, tuple)) and len(written) == len(vector_records):
+                    return [ok is None or bool(ok) for ok in written]
+                if isinstance(written, int) and not isinstance(written, bool) and written == len(vector_records):
+                    return [True] * len(vector_records)
+                logger.warning(f"批量写入向量数据库结果不明确 ({written!r})，逐条写入")
+            except Exception as e:
+                logger.error(f"批量写入向量数据库失败，逐条写入: {e}")
+
+        results = []
+        for vector_record in vector_records:
+            try:
+                written = vector_db.add_record(vector_record)
+                results.append(written is None or bool(written))
+            except Exception as e:
+                logger.error(f"添加记录 {getattr(vector_record, 'id', None)} 失败: {e}")
+                results.append(False)
+        return results
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -261,6 +383,22 @@ class HistoryService:
             )
 
 
+class _EmbeddingModels:
+    """Embedding models for a predictor created without models of its own."""
+
+    def __init__(self, device: str):
+        self.device = device
+        self.aircraft_model: Optional[Any] = None
+        self.airline_model: Optional[Any] = None
+
+
+def _to_numpy(embedding: Any) -> np.ndarray:
+    """Convert an embedding tensor or array to a NumPy array."""
+    if hasattr(embedding, 'cpu'):
+        return embedding.cpu().numpy()
+    return np.array(embedding)
+
+
 # Global service instance
 _history_service: Optional[HistoryService] = None
 
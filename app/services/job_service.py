@@ -0,0 +1,144 @@
+"""
+Background processing of batch review jobs.
+
+Workers take chunks from the job queue and review them with the same
+ReviewService.review_batch path as the /review/batch endpoint.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.core.job_queue import JobChunk, JobQueue, get_job_queue
+from app.core.logging import logger
+from app.services.review_service import ReviewService
+
+# Seconds to back off after a queue error (e.g. Redis unavailable)
+_ERROR_BACKOFF_SECONDS = 1.0
+
+# Lease extensions per visibility timeout while a chunk is processed
+_HEARTBEATS_PER_TIMEOUT = 3
+
+
+class JobWorker:
+    """Processes queued job chunks with bounded concurrency."""
+
+    def __init__(
+        self,
+        queue: Optional[JobQueue] = None,
+        review_service: Optional[ReviewService] = None,
+        concurrency: int = 1
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            queue: Job queue (defaults to the process-wide queue)
+            review_service: Service used to review chunks
+            concurrency: Number of chunks processed at once
+        """
+        self.queue = queue or get_job_queue()
+        self.review_service = review_service or ReviewService()
+        self.concurrency = max(1, concurrency)
+        self._tasks: list[asyncio.Task] = []
+
+    async def process_chunk(self, chunk: JobChunk) -> None:
+        """
+        Review a chunk and store its results.
+
+        A chunk that fails as a whole is recorded as failed for each image,
+        so the job still completes. The chunk's lease is extended while it
+        is reviewed, so a slow chunk is not requeued to another worker.
+        """
+        heartbeat = asyncio.create_task(self._extend_lease(chunk))
+        try:
+            results = await self.review_service.review_batch(chunk.images, **chunk.params)
+        except Exception as e:
+            logger.error(f"Job {chunk.job_id} chunk {chunk.index} failed: {e}")
+            results = [
+                {"index": i, "success": False, "data": None, "error": f"Review failed: {e}"}
+                for i in range(len(chunk.images))
+            ]
+        finally:
+            heartbeat.cancel()
+
+        for result in results:
+            result["index"] += chunk.start
+        await self.queue.complete_chunk(chunk, results)
+
+    async def _extend_lease(self, chunk: JobChunk) -> None:
+        """Extend a chunk's lease periodically until cancelled or the lease is lost."""
+        interval = self.queue.visibility_timeout / _HEARTBEATS_PER_TIMEOUT
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.queue.extend_lease(chunk):
+                    logger.warning(f"Job {chunk.job_id} chunk {chunk.index} lost its lease")
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to extend lease of job {chunk.job_id} chunk {chunk.index}: {e}")
+
+    async def _run(self) -> None:
+        """Process chunks until cancelled."""
+        while True:
+            try:
+                chunk = await self.queue.next_chunk(timeout=1.0)
+                if chunk is not None:
+                    await self.process_chunk(chunk)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job worker error: {e}")
+                await asyncio.sleep(_ERROR_BACKOFF_SECONDS)
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        """
+        Stop the worker tasks.
+
+        Chunks being processed stay leased until their visibility timeout
+        expires, then they are requeued for another worker.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def submit_review_job(images: list[str], params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Queue a batch review job.
+
+    Args:
+        images: Base64 encoded images or URLs
+        params: ReviewService.review_batch keyword arguments (include_* flags)
+
+    Returns:
+        The job record
+    """
+    job = await get_job_queue().create_job("review", images, params)
+    logger.info(f"Queued review job {job['job_id']}: {job['total']} images in {job['chunks']} chunks")
+    return job
+
+
+_worker: Optional[JobWorker] = None
+
+
+def start_job_workers() -> None:
+    """Start processing queued jobs in this process."""
+    global _worker
+    if _worker is None:
+        _worker = JobWorker(concurrency=get_settings().job_workers)
+        _worker.start()
+
+
+async def stop_job_workers() -> None:
+    """Stop processing queued jobs in this process."""
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
@@ -0,0 +1,165 @@
+"""
+Shared image preprocessing.
+
+A review runs several models on the same image. Rather than letting every
+model convert, orient and resize the raw upload on its own, the image is
+prepared once per request: EXIF orientation and RGB conversion are applied
+once, and resized variants are cached by input geometry so that models
+consuming the same geometry share one array.
+"""
+
+import threading
+from typing import NamedTuple
+
+from PIL import Image, ImageOps
+
+from app.core.config import get_settings
+from app.core.metrics import time_stage
+
+# Padding colour used by YOLO-style letterboxing
+LETTERBOX_FILL = (114, 114, 114)
+
+
+class InputGeometry(NamedTuple):
+    """Input geometry a model consumes."""
+
+    size: int
+    letterbox: bool = False
+
+
+def get_input_geometry(model_name: str) -> InputGeometry | None:
+    """
+    Get the input geometry of a model.
+
+    Args:
+        model_name: Model name ("quality", "aircraft", "airline", "registration")
+
+    Returns:
+        Input geometry, or None if the model consumes the full-resolution image
+    """
+    if model_name in ("aircraft", "airline"):
+        settings = get_settings()
+        return InputGeometry(settings.classifier_image_size, settings.classifier_letterbox)
+    # Quality metrics and OCR need full resolution detail
+    return None
+
+
+class PreparedImage:
+    """An image prepared once and shared by every model in a request."""
+
+    def __init__(self, image: Image.Image):
+        """
+        Initialize the prepared image.
+
+        Args:
+            image: Decoded PIL image
+        """
+        self.source = image
+        self._rgb: Image.Image | None = None
+        self._resized: dict[InputGeometry, Image.Image] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rgb(self) -> Image.Image:
+        """The image with EXIF orientation applied, in RGB."""
+        with self._lock:
+            if self._rgb is None:
+                image = ImageOps.exif_transpose(self.source)
+                if image.mode != "RGB":
+                    image = image.convert("RGB")
+                self._rgb = image
+            return self._rgb
+
+    def resized(self, geometry: InputGeometry) -> Image.Image:
+        """
+        Get the image resized to an input geometry.
+
+        Without letterboxing the shorter side is scaled to the target size,
+        which matches the resize step of classification transforms. With
+        letterboxing the image is fitted inside a square canvas and padded.
+        Images are never upscaled.
+
+        Args:
+            geometry: Target input geometry
+
+        Returns:
+            Resized RGB image (cached per geometry)
+        """
+        rgb = self.rgb
+        with self._lock:
+            cached = self._resized.get(geometry)
+            if cached is None:
+                cached = _resize(rgb, geometry)
+                self._resized[geometry] = cached
+            return cached
+
+    def for_model(self, model_name: str) -> Image.Image:
+        """
+        Get the input for a model.
+
+        Args:
+            model_name: Model name
+
+        Returns:
+            Image in the geometry the model consumes
+        """
+        geometry = get_input_geometry(model_name)
+        if geometry is None:
+            return self.rgb
+        return self.resized(geometry)
+
+    def prepare(self, model_names: list[str]) -> dict[str, Image.Image]:
+        """
+        Prepare inputs for several models at once.
+
+        Args:
+            model_names: Model names
+
+        Returns:
+            Dictionary mapping model name to its input image
+        """
+        with time_stage("preprocess"):
+            return {name: self.for_model(name) for name in model_names}
+
+
+def _resize(image: Image.Image, geometry: InputGeometry) -> Image.Image:
+    """Resize an RGB image to an input geometry."""
+    width, height = image.size
+    if geometry.letterbox:
+        scale = min(geometry.size / width, geometry.size / height, 1.0)
+    else:
+        scale = min(geometry.size / min(width, height), 1.0)
+
+    new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    resized = image if new_size == image.size else image.resize(new_size, Image.Resampling.BILINEAR)
+
+    if not geometry.letterbox:
+        return resized
+
+    canvas = Image.new("RGB", (geometry.size, geometry.size), LETTERBOX_FILL)
+    canvas.paste(resized, ((geometry.size - new_size[0]) // 2, (geometry.size - new_size[1]) // 2))
+    return canvas
+
+
+def prepare_images(
+    images: list[Image.Image | None],
+    model_names: list[str]
+) -> dict[str, list[Image.Image | None]]:
+    """
+    Prepare a batch of images for several models.
+
+    Args:
+        images: Decoded images (None for failed loads)
+        model_names: Model names
+
+    Returns:
+        Dictionary mapping model name to its list of inputs, index-aligned
+        with images
+    """
+    inputs: dict[str, list[Image.Image | None]] = {name: [] for name in model_names}
+    with time_stage("preprocess", batch_size=len(images)):
+        for image in images:
+            prepared = PreparedImage(image) if image is not None else None
+            for name in model_names:
+                inputs[name].append(prepared.for_model(name) if prepared is not None else None)
+    return inputs
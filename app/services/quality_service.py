@@ -2,16 +2,17 @@
 Quality assessment service.
 """
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+import contextvars
+from typing import Any, AsyncIterator
 
 from PIL import Image
 
-from app.core.exceptions import ImageLoadError
+from app.core.config import get_settings
 from app.core import get_logger
-from app.inference import InferenceFactory, wrap_quality_result
+from app.core.metrics import time_stage
+from app.inference import InferenceFactory, get_batch_pool, get_inference_executor, wrap_quality_result
 from app.schemas.quality import QualityResult
-from app.services.base import BaseService
+from app.services.base import BaseService, ImageSource
 
 logger = get_logger("services.quality")
 
@@ -29,12 +30,12 @@ class QualityService(BaseService):
             self._assessor = InferenceFactory.get_quality_assessor()
         return self._assessor
 
-    def assess(self, image_input: str) -> tuple[QualityResult, float]:
+    def assess(self, image_input: ImageSource) -> tuple[QualityResult, float]:
         """
         Assess image quality.
 
         Args:
-            image_input: Base64 encoded image or URL
+            image_input: Base64 encoded image, URL or raw image bytes
 
         Returns:
             Tuple of (quality result, processing time ms)
@@ -45,6 +46,33 @@ class QualityService(BaseService):
         image = self.load_image(image_input)
         return self._assess_image(image)
 
+    async def assess_async(self, image_input: ImageSource) -> tuple[QualityResult, float]:
+        """
+        Assess image quality without blocking the event loop.
+
+        Inference runs on the dedicated quality executor; results for
+        previously seen images are served from the result cache.
+
+        Args:
+            image_input: Base64 encoded image, URL or raw image bytes
+
+        Returns:
+            Tuple of (quality result, processing time ms)
+
+        Raises:
+            ImageLoadError: If image loading fails
+            RateLimitError: If the quality executor is at capacity
+        """
+        image = await self.load_image_async(image_input)
+        return await self.cached_inference(
+            "quality",
+            image,
+            InferenceFactory.get_model_version("quality"),
+            {},
+            QualityResult,
+            lambda: get_inference_executor("quality").run(self._assess_image, image)
+        )
+
     def _assess_image(self, image: Image.Image) -> tuple[QualityResult, float]:
         """
         Assess quality of a pre-loaded image.
@@ -58,36 +86,30 @@ class QualityService(BaseService):
         assessor = self._get_assessor()
 
         def do_assess():
-            result = assessor.assess(image)
-            return wrap_quality_result(result)
+            with time_stage("inference", "quality"):
+                result = assessor.assess(image)
+            with time_stage("wrap", "quality"):
+                wrapped = wrap_quality_result(result)
+                wrapped.model_version = InferenceFactory.get_model_version("quality")
+                return wrapped
 
         result, timing = self.measure_time(do_assess)
         return result, timing
 
-    async def assess_batch(self, image_inputs: list[str]) -> list[dict[str, Any]]:
+    async def assess_batch(self, image_inputs: list[ImageSource]) -> list[dict[str, Any]]:
         """
         Assess quality of multiple images.
 
         Args:
-            image_inputs: List of base64 encoded images or URLs
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
 
         Returns:
             List of results with index, success status, and data/error
         """
-        import asyncio
-
-        async def load_image_async(image_input: str):
-            try:
-                loop = asyncio.get_event_loop()
-                image = await loop.run_in_executor(None, lambda: self.load_image(image_input))
-                return image
-            except ImageLoadError:
-                return None
-
-        images = await asyncio.gather(*[load_image_async(img) for img in image_inputs])
+        loaded = await self.load_images_async(image_inputs)
+        images = [image for image, _ in loaded]
 
-        loop = asyncio.get_event_loop()
-        quality_results = await loop.run_in_executor(None, self._assess_batch, images)
+        quality_results = await get_inference_executor("quality").run(self._assess_batch, images)
 
         results = []
         for idx, result in enumerate(quality_results):
@@ -108,10 +130,30 @@ class QualityService(BaseService):
 
         return results
 
+    def assess_batch_stream(self, image_inputs: list[ImageSource]) -> AsyncIterator[dict[str, Any]]:
+        """
+        Assess quality of multiple images, yielding each item as it completes.
+
+        Args:
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
+
+        Returns:
+            Async iterator of results with index, success status, and data/error
+        """
+        async def assess_one(image_input: ImageSource) -> QualityResult:
+            result, _ = await self.assess_async(image_input)
+            return result
+
+        return self.iter_batch(image_inputs, assess_one, "Quality assessment failed")
+
     def _assess_batch(self, images: list[Image.Image | None]) -> list[QualityResult]:
         """
         Assess quality of multiple pre-loaded images concurrently.
 
+        Depending on the quality_batch_mode setting, images are assessed one
+        after another ("serial") or fanned out over the shared quality batch
+        thread pool ("threads").
+
         Args:
             images: List of PIL Image objects (can contain None for failed loads)
 
@@ -119,16 +161,29 @@ class QualityService(BaseService):
             List of QualityResult objects
         """
         results = [None] * len(images)
-
-        for i, image in enumerate(images):
-            if image is None:
-                results[i] = None
-                continue
+        valid = [(i, image) for i, image in enumerate(images) if image is not None]
+
+        mode = get_settings().quality_batch_mode
+        if mode == "serial" or len(valid) <= 1:
+            for i, image in valid:
+                try:
+                    result, _ = self.traced_item(i, self._assess_image, image)
+                    results[i] = result
+                except Exception as e:
+                    logger.error(f"Failed to assess image at index {i}: {e}")
+            return results
+
+        pool = get_batch_pool("quality")
+        futures = [
+            (i, pool.submit(contextvars.copy_context().run, self.traced_item, i, self._assess_image, image))
+            for i, image in valid
+        ]
+
+        for i, future in futures:
             try:
-                result, _ = self._assess_image(image)
-                results[i] = result
+                results[i], _ = future.result()
             except Exception as e:
                 logger.error(f"Failed to assess image at index {i}: {e}")
-                results[i] = None
 
         return results
+
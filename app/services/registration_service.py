@@ -2,16 +2,18 @@
 Registration number OCR service.
 """
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+import contextvars
+import os
+from typing import Any, AsyncIterator
 
 from PIL import Image
 
-from app.core.exceptions import ImageLoadError
+from app.core.config import get_settings
 from app.core import get_logger
-from app.inference import InferenceFactory, wrap_registration_result
+from app.core.metrics import time_stage
+from app.inference import InferenceFactory, get_batch_pool, get_inference_executor, wrap_registration_result
 from app.schemas.registration import RegistrationResult
-from app.services.base import BaseService
+from app.services.base import BaseService, ImageSource
 
 logger = get_logger("services.registration")
 
@@ -29,12 +31,12 @@ class RegistrationService(BaseService):
             self._ocr = InferenceFactory.get_registration_ocr()
         return self._ocr
 
-    def recognize(self, image_input: str) -> tuple[RegistrationResult, float]:
+    def recognize(self, image_input: ImageSource) -> tuple[RegistrationResult, float]:
         """
         Recognize registration number.
 
         Args:
-            image_input: Base64 encoded image or URL
+            image_input: Base64 encoded image, URL or raw image bytes
 
         Returns:
             Tuple of (registration result, processing time ms)
@@ -45,6 +47,33 @@ class RegistrationService(BaseService):
         image = self.load_image(image_input)
         return self._recognize_image(image)
 
+    async def recognize_async(self, image_input: ImageSource) -> tuple[RegistrationResult, float]:
+        """
+        Recognize registration number without blocking the event loop.
+
+        Inference runs on the dedicated registration executor; results for
+        previously seen images are served from the result cache.
+
+        Args:
+            image_input: Base64 encoded image, URL or raw image bytes
+
+        Returns:
+            Tuple of (registration result, processing time ms)
+
+        Raises:
+            ImageLoadError: If image loading fails
+            RateLimitError: If the registration executor is at capacity
+        """
+        image = await self.load_image_async(image_input)
+        return await self.cached_inference(
+            "registration",
+            image,
+            InferenceFactory.get_model_version("registration"),
+            {},
+            RegistrationResult,
+            lambda: get_inference_executor("registration").run(self._recognize_image, image)
+        )
+
     def _recognize_image(self, image: Image.Image) -> tuple[RegistrationResult, float]:
         """
         Recognize registration number of a pre-loaded image.
@@ -58,36 +87,30 @@ class RegistrationService(BaseService):
         ocr = self._get_ocr()
 
         def do_recognize():
-            result = ocr.recognize(image)
-            return wrap_registration_result(result)
+            with time_stage("inference", "registration"):
+                result = ocr.recognize(image)
+            with time_stage("wrap", "registration"):
+                wrapped = wrap_registration_result(result)
+                wrapped.model_version = InferenceFactory.get_model_version("registration")
+                return wrapped
 
         result, timing = self.measure_time(do_recognize)
         return result, timing
 
-    async def recognize_batch(self, image_inputs: list[str]) -> list[dict[str, Any]]:
+    async def recognize_batch(self, image_inputs: list[ImageSource]) -> list[dict[str, Any]]:
         """
         Recognize registration numbers from multiple images.
 
         Args:
-            image_inputs: List of base64 encoded images or URLs
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
 
         Returns:
             List of results with index, success status, and data/error
         """
-        import asyncio
-
-        async def load_image_async(image_input: str):
-            try:
-                loop = asyncio.get_event_loop()
-                image = await loop.run_in_executor(None, lambda: self.load_image(image_input))
-                return image
-            except ImageLoadError:
-                return None
+        loaded = await self.load_images_async(image_inputs)
+        images = [image for image, _ in loaded]
 
-        images = await asyncio.gather(*[load_image_async(img) for img in image_inputs])
-
-        loop = asyncio.get_event_loop()
-        registration_results = await loop.run_in_executor(None, self._recognize_batch, images)
+        registration_results = await get_inference_executor("registration").run(self._recognize_batch, images)
 
         results = []
         for idx, result in enumerate(registration_results):
@@ -108,10 +131,31 @@ class RegistrationService(BaseService):
 
         return results
 
+    def recognize_batch_stream(self, image_inputs: list[ImageSource]) -> AsyncIterator[dict[str, Any]]:
+        """
+        Recognize registration numbers, yielding each item as it completes.
+
+        Args:
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
+
+        Returns:
+            Async iterator of results with index, success status, and data/error
+        """
+        async def recognize_one(image_input: ImageSource) -> RegistrationResult:
+            result, _ = await self.recognize_async(image_input)
+            return result
+
+        return self.iter_batch(image_inputs, recognize_one, "Registration OCR failed")
+
     def _recognize_batch(self, images: list[Image.Image | None]) -> list[RegistrationResult]:
         """
         Recognize registration numbers from multiple pre-loaded images concurrently.
 
+        With ocr_batch_parallel enabled, images are fanned out over a shared
+        batch pool: the "registration" pool bounds local detection and
+        recognition, the "registration_remote" pool bounds the number of
+        in-flight remote VLM calls.
+
         Args:
             images: List of PIL Image objects (can contain None for failed loads)
 
@@ -119,16 +163,35 @@ class RegistrationService(BaseService):
             List of RegistrationResult objects
         """
         results = [None] * len(images)
-
-        for i, image in enumerate(images):
-            if image is None:
-                results[i] = None
-                continue
+        valid = [(i, image) for i, image in enumerate(images) if image is not None]
+
+        if not get_settings().ocr_batch_parallel or len(valid) <= 1:
+            for i, image in valid:
+                try:
+                    result, _ = self.traced_item(i, self._recognize_image, image)
+                    results[i] = result
+                except Exception as e:
+                    logger.error(f"Failed to recognize image at index {i}: {e}")
+            return results
+
+        pool = get_batch_pool("registration_remote" if _uses_remote_ocr() else "registration")
+        futures = [
+            (i, pool.submit(contextvars.copy_context().run, self.traced_item, i, self._recognize_image, image))
+            for i, image in valid
+        ]
+
+        for i, future in futures:
             try:
-                result, _ = self._recognize_image(image)
-                results[i] = result
+                results[i], _ = future.result()
             except Exception as e:
                 logger.error(f"Failed to recognize image at index {i}: {e}")
-                results[i] = None
 
         return results
+
+
+def _uses_remote_ocr() -> bool:
+    """Whether the configured OCR mode calls the remote VLM."""
+    mode = get_settings().ocr_mode
+    if mode == "auto":
+        return bool(os.environ.get("DASHSCOPE_API_KEY"))
+    return mode in ("qwen", "api")
@@ -4,21 +4,25 @@ Aggregated review service.
 
 import asyncio
 import time
-from typing import Any
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator
 
 from app.schemas.review import ReviewResult, ReviewQualityResult, ReviewAircraftResult, ReviewAirlineResult, ReviewRegistrationResult
 from app.schemas.quality import QualityResult
 from app.schemas.aircraft import AircraftResult
 from app.schemas.airline import AirlineResult
 from app.schemas.registration import RegistrationResult
-from app.core.exceptions import ImageLoadError
+from app.core.config import get_settings
+from app.core.exceptions import RateLimitError
 from app.core.logging import get_logger
+from app.core.tracing import start_span
+from app.inference.executors import get_inference_executor
+from app.inference.factory import InferenceFactory
 from app.services.quality_service import QualityService
 from app.services.aircraft_service import AircraftService
 from app.services.airline_service import AirlineService
 from app.services.registration_service import RegistrationService
-from app.services.base import BaseService
+from app.services.base import BaseService, ImageSource
+from app.services.preprocessing import PreparedImage, prepare_images
 
 logger = get_logger("review_service")
 
@@ -35,7 +39,7 @@ class ReviewService(BaseService):
 
     def review(
         self,
-        image_input: str,
+        image_input: ImageSource,
         include_quality: bool = True,
         include_aircraft: bool = True,
         include_airline: bool = True,
@@ -45,7 +49,7 @@ class ReviewService(BaseService):
         Perform a complete review of an image.
 
         Args:
-            image_input: Base64 encoded image or URL
+            image_input: Base64 encoded image, URL or raw image bytes
             include_quality: Whether to include quality assessment
             include_aircraft: Whether to include aircraft classification
             include_airline: Whether to include airline classification
@@ -59,91 +63,244 @@ class ReviewService(BaseService):
         """
         start_time = self._now()
 
-        # Load image once
+        # Load and prepare image once
         image = self.load_image(image_input)
+        prepared = PreparedImage(image)
 
         # Collect results
-        quality_result = None
-        aircraft_result = None
-        airline_result = None
-        registration_result = None
+        quality_data = None
+        aircraft_data = None
+        airline_data = None
+        reg_data = None
 
         if include_quality:
             quality_data_tuple = self.safe_execute(
-                self.quality_service._assess_image, image
+                self.quality_service._assess_image, prepared.for_model("quality")
             )
             if quality_data_tuple:
                 quality_data, _ = quality_data_tuple
-                quality_result = ReviewQualityResult(
-                    score=quality_data.score,
-                    **{"pass": quality_data.pass_},
-                    details=quality_data.details
-                )
 
         if include_aircraft:
             aircraft_data_tuple = self.safe_execute(
-                self.aircraft_service._classify_image, image
+                self.aircraft_service._classify_image, prepared.for_model("aircraft")
             )
             if aircraft_data_tuple:
                 aircraft_data, _ = aircraft_data_tuple
-                aircraft_result = ReviewAircraftResult(
-                    type_code=aircraft_data.top1.class_,
-                    confidence=aircraft_data.top1.confidence
-                )
 
         if include_airline:
             airline_data_tuple = self.safe_execute(
-                self.airline_service._classify_image, image
+                self.airline_service._classify_image, prepared.for_model("airline")
             )
             if airline_data_tuple:
                 airline_data, _ = airline_data_tuple
-                airline_result = ReviewAirlineResult(
-                    airline_code=airline_data.top1.class_,
-                    confidence=airline_data.top1.confidence
-                )
 
         if include_registration:
             reg_data_tuple = self.safe_execute(
-                self.registration_service._recognize_image, image
+                self.registration_service._recognize_image, prepared.for_model("registration")
             )
             if reg_data_tuple:
                 reg_data, _ = reg_data_tuple
-                # Use registration confidence as clarity
-                registration_result = ReviewRegistrationResult(
-                    registration=reg_data.registration,
-                    confidence=reg_data.confidence,
-                    clarity=reg_data.confidence  # Using OCR confidence as proxy
-                )
 
-        # Build final result
-        # Quality is mandatory - provide default if failed
-        if quality_result is None:
+        result = self._build_review_result(quality_data, aircraft_data, airline_data, reg_data)
+
+        timing = (self._now() - start_time) * 1000
+        return result, timing
+
+    async def review_async(
+        self,
+        image_input: ImageSource,
+        include_quality: bool = True,
+        include_aircraft: bool = True,
+        include_airline: bool = True,
+        include_registration: bool = True,
+        concurrent: bool | None = None
+    ) -> tuple[ReviewResult, float, dict[str, float]]:
+        """
+        Perform a complete review of an image without blocking the event loop.
+
+        Each component runs on its model's dedicated inference executor. In
+        concurrent mode the independent components run in parallel on the
+        shared image, so latency approaches that of the slowest component.
+        The image is oriented, converted and resized once and each component
+        receives the input geometry its model consumes. Results for
+        previously seen images are served from the result cache.
+
+        Args:
+            image_input: Base64 encoded image, URL or raw image bytes
+            include_quality: Whether to include quality assessment
+            include_aircraft: Whether to include aircraft classification
+            include_airline: Whether to include airline classification
+            include_registration: Whether to include registration OCR
+            concurrent: Run components in parallel (defaults to the
+                review_concurrent setting)
+
+        Returns:
+            Tuple of (review result, processing time ms, per-component
+            processing time ms); component timings are empty on a cache hit
+
+        Raises:
+            ImageLoadError: If image loading fails
+            RateLimitError: If a component's executor is at capacity
+        """
+        if concurrent is None:
+            concurrent = get_settings().review_concurrent
+
+        start_time = self._now()
+
+        image = await self.load_image_async(image_input)
+
+        components = []
+        if include_quality:
+            components.append(("quality", self.quality_service._assess_image))
+        if include_aircraft:
+            components.append(("aircraft", self.aircraft_service._classify_image))
+        if include_airline:
+            components.append(("airline", self.airline_service._classify_image))
+        if include_registration:
+            components.append(("registration", self.registration_service._recognize_image))
+
+        component_timings: dict[str, float] = {}
+        failed_components = []
+
+        async def compute() -> tuple[ReviewResult, float]:
+            inputs = await asyncio.to_thread(
+                PreparedImage(image).prepare, [name for name, _ in components]
+            )
+
+            if concurrent:
+                outputs = await asyncio.gather(*[
+                    self._run_component(name, func, inputs[name]) for name, func in components
+                ])
+            else:
+                outputs = []
+                for name, func in components:
+                    outputs.append(await self._run_component(name, func, inputs[name]))
+
+            results = {}
+            for (name, _), (data, timing) in zip(components, outputs):
+                results[name] = data
+                component_timings[name] = timing
+                if data is None:
+                    failed_components.append(name)
+
+            result = self._build_review_result(
+                results.get("quality"),
+                results.get("aircraft"),
+                results.get("airline"),
+                results.get("registration")
+            )
+            return result, (self._now() - start_time) * 1000
+
+        result, _ = await self.cached_inference(
+            "review",
+            image,
+            "|".join(InferenceFactory.get_model_version(name) for name, _ in components),
+            {
+                "include_quality": include_quality,
+                "include_aircraft": include_aircraft,
+                "include_airline": include_airline,
+                "include_registration": include_registration,
+            },
+            ReviewResult,
+            compute,
+            should_cache=lambda _: not failed_components
+        )
+
+        timing = (self._now() - start_time) * 1000
+        return result, timing, component_timings
+
+    async def _run_component(self, name: str, func, image) -> tuple[Any, float]:
+        """
+        Run one review component on its inference executor.
+
+        Returns:
+            Tuple of (component result or None if it failed, elapsed time ms)
+        """
+        start_time = self._now()
+        with start_span("review_component", component=name) as span:
+            try:
+                output = await get_inference_executor(name).run(func, image)
+            except RateLimitError:
+                raise
+            except Exception as e:
+                logger.warning(f"Review component {name} failed: {e}")
+                if span is not None:
+                    span.error = str(e)
+                output = None
+
+        elapsed = (self._now() - start_time) * 1000
+        if not output:
+            return None, elapsed
+        data, _ = output
+        return data, elapsed
+
+    @staticmethod
+    def _build_review_result(
+        quality_data: QualityResult | None,
+        aircraft_data: AircraftResult | None,
+        airline_data: AirlineResult | None,
+        reg_data: RegistrationResult | None
+    ) -> ReviewResult:
+        """
+        Build a review result from component results.
+
+        Quality and aircraft are mandatory and fall back to defaults when
+        missing; airline and registration are omitted when missing.
+        """
+        if quality_data is not None:
+            quality_result = ReviewQualityResult(
+                score=quality_data.score,
+                **{"pass": quality_data.pass_},
+                details=quality_data.details,
+                model_version=quality_data.model_version
+            )
+        else:
             quality_result = ReviewQualityResult.model_validate({
                 "score": 0.0,
                 "pass": False,
                 "details": None
             })
 
-        # Aircraft is mandatory - provide default if failed
-        if aircraft_result is None:
+        if aircraft_data is not None:
+            aircraft_result = ReviewAircraftResult(
+                type_code=aircraft_data.top1.class_,
+                confidence=aircraft_data.top1.confidence,
+                model_version=aircraft_data.model_version
+            )
+        else:
             aircraft_result = ReviewAircraftResult(
                 type_code="UNKNOWN",
                 confidence=0.0
             )
 
-        result = ReviewResult(
+        airline_result = None
+        if airline_data is not None:
+            airline_result = ReviewAirlineResult(
+                airline_code=airline_data.top1.class_,
+                confidence=airline_data.top1.confidence,
+                model_version=airline_data.model_version
+            )
+
+        registration_result = None
+        if reg_data is not None:
+            # Use registration confidence as clarity
+            registration_result = ReviewRegistrationResult(
+                registration=reg_data.registration,
+                confidence=reg_data.confidence,
+                clarity=reg_data.confidence,  # Using OCR confidence as proxy
+                model_version=reg_data.model_version
+            )
+
+        return ReviewResult(
             quality=quality_result,
             aircraft=aircraft_result,
             airline=airline_result,
             registration=registration_result
         )
 
-        timing = (self._now() - start_time) * 1000
-        return result, timing
-
     async def review_batch(
         self,
-        image_inputs: list[str],
+        image_inputs: list[ImageSource],
         include_quality: bool = True,
         include_aircraft: bool = True,
         include_airline: bool = True,
@@ -153,7 +310,7 @@ class ReviewService(BaseService):
         Review multiple images using concurrent inference.
 
         Args:
-            image_inputs: List of base64 encoded images or URLs
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
             include_quality: Whether to include quality assessment
             include_aircraft: Whether to include aircraft classification
             include_airline: Whether to include airline classification
@@ -162,21 +319,22 @@ class ReviewService(BaseService):
         Returns:
             List of results with index, success status, and data/error
         """
-        # Load all images in parallel
-        async def load_image_async(image_input: str):
-            try:
-                loop = asyncio.get_event_loop()
-                image = await loop.run_in_executor(None, lambda: self.load_image(image_input))
-                return image, None
-            except ImageLoadError as e:
-                return None, str(e)
-            except Exception as e:
-                return None, str(e)
-
-        loaded_results = await asyncio.gather(*[load_image_async(img) for img in image_inputs])
+        # Load all images with bounded concurrency
+        loaded_results = await self.load_images_async(image_inputs)
         images = [r[0] for r in loaded_results]
         image_errors = [r[1] for r in loaded_results]
 
+        # Orient, convert and resize each image once, per input geometry
+        model_names = [
+            name for name, included in (
+                ("quality", include_quality),
+                ("aircraft", include_aircraft),
+                ("airline", include_airline),
+                ("registration", include_registration),
+            ) if included
+        ]
+        inputs = await asyncio.to_thread(prepare_images, images, model_names)
+
         # Collect results from all services using async concurrent execution
         tasks = []
 
@@ -184,21 +342,19 @@ class ReviewService(BaseService):
         if include_quality:
             # Quality service uses sync _assess_batch, wrap it in executor
             async def run_quality():
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, self.quality_service._assess_batch, images)
+                return await get_inference_executor("quality").run(self.quality_service._assess_batch, inputs['quality'])
             tasks.append(('quality', run_quality()))
 
         if include_aircraft:
-            tasks.append(('aircraft', self.aircraft_service._classify_batch(images)))
+            tasks.append(('aircraft', self.aircraft_service._classify_batch(inputs['aircraft'])))
 
         if include_airline:
-            tasks.append(('airline', self.airline_service._classify_batch(images)))
+            tasks.append(('airline', self.airline_service._classify_batch(inputs['airline'])))
 
         if include_registration:
             # Registration service uses sync _recognize_batch, wrap it in executor
             async def run_registration():
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, self.registration_service._recognize_batch, images)
+                return await get_inference_executor("registration").run(self.registration_service._recognize_batch, inputs['registration'])
             tasks.append(('registration', run_registration()))
 
         # Execute tasks concurrently using asyncio.gather
@@ -207,6 +363,9 @@ class ReviewService(BaseService):
 
         results_map = {}
         for task_name, result in zip(task_map.keys(), results_list):
+            # A saturated executor rejects the whole batch, as in review_async
+            if isinstance(result, RateLimitError):
+                raise result
             if isinstance(result, Exception):
                 logger.error(f"Failed to execute {task_name} task: {result}")
                 results_map[task_name] = None
@@ -246,7 +405,8 @@ class ReviewService(BaseService):
                         review_quality = ReviewQualityResult(
                             score=quality_result.score,
                             **{"pass": quality_result.pass_},
-                            details=quality_result.details
+                            details=quality_result.details,
+                            model_version=quality_result.model_version
                         )
                     else:
                         review_quality = ReviewQualityResult.model_validate({
@@ -260,7 +420,8 @@ class ReviewService(BaseService):
                     if aircraft_result is not None:
                         review_aircraft = ReviewAircraftResult(
                             type_code=aircraft_result.top1.class_,
-                            confidence=aircraft_result.top1.confidence
+                            confidence=aircraft_result.top1.confidence,
+                            model_version=aircraft_result.model_version
                         )
                     else:
                         review_aircraft = ReviewAircraftResult(
@@ -273,7 +434,8 @@ class ReviewService(BaseService):
                     if airline_result is not None:
                         review_airline = ReviewAirlineResult(
                             airline_code=airline_result.top1.class_,
-                            confidence=airline_result.top1.confidence
+                            confidence=airline_result.top1.confidence,
+                            model_version=airline_result.model_version
                         )
 
                 review_registration = None
@@ -282,7 +444,8 @@ class ReviewService(BaseService):
                         review_registration = ReviewRegistrationResult(
                             registration=registration_result.registration,
                             confidence=registration_result.confidence,
-                            clarity=registration_result.confidence
+                            clarity=registration_result.confidence,
+                            model_version=registration_result.model_version
                         )
 
                 result = ReviewResult(
@@ -308,6 +471,39 @@ class ReviewService(BaseService):
 
         return results
 
+    def review_batch_stream(
+        self,
+        image_inputs: list[ImageSource],
+        include_quality: bool = True,
+        include_aircraft: bool = True,
+        include_airline: bool = True,
+        include_registration: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Review multiple images, yielding each item as it completes.
+
+        Args:
+            image_inputs: List of base64 encoded images, URLs or raw image bytes
+            include_quality: Whether to include quality assessment
+            include_aircraft: Whether to include aircraft classification
+            include_airline: Whether to include airline classification
+            include_registration: Whether to include registration OCR
+
+        Returns:
+            Async iterator of results with index, success status, and data/error
+        """
+        async def review_one(image_input: ImageSource) -> ReviewResult:
+            result, _, _ = await self.review_async(
+                image_input,
+                include_quality=include_quality,
+                include_aircraft=include_aircraft,
+                include_airline=include_airline,
+                include_registration=include_registration
+            )
+            return result
+
+        return self.iter_batch(image_inputs, review_one, "Review failed")
+
     @staticmethod
     def _now() -> float:
         """Get current time in seconds."""
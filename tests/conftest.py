@@ -20,6 +20,16 @@ os.environ.setdefault("MODEL_DIR", "tests/fixtures/models")
 os.environ.setdefault("DEVICE", "cpu")
 
 
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Keep cached inference results from leaking between tests."""
+    from app.core.result_cache import get_result_cache
+
+    get_result_cache().clear()
+    yield
+    get_result_cache().clear()
+
+
 @pytest.fixture
 def test_image_path() -> Path:
     """Path to a test image."""
@@ -0,0 +1,126 @@
+"""
+Unit tests for the admin and debug endpoints.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.routes import admin, debug
+from app.core.config import get_settings
+from app.core.tracing import RingBufferExporter, reset_exporter, set_exporter
+from app.inference.factory import InferenceFactory, InferenceFactoryError
+
+SWAP = {
+    "model": "aircraft",
+    "previous_version": "aircraft:1111111111111111",
+    "version": "aircraft:2222222222222222",
+    "swapped": True,
+    "load_seconds": 1.5,
+    "warmup_seconds": 0.5,
+}
+
+
+@pytest.fixture
+async def client(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    monkeypatch.setattr(settings, "model_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "redis_enabled", False)
+    app = FastAPI()
+    app.include_router(admin.router)
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={"X-Admin-Token": "secret"}
+    ) as client:
+        yield client
+
+
+class TestSwapModel:
+    """Tests for POST /admin/models/{name}/swap."""
+
+    async def test_swap(self, client, tmp_path):
+        (tmp_path / "aircraft").mkdir()
+        (tmp_path / "aircraft" / "v2.pt").write_bytes(b"weights")
+
+        with patch.object(InferenceFactory, "swap_classifier", return_value=SWAP) as swap:
+            response = await client.post("/admin/models/aircraft/swap", json={"weights_path": "aircraft/v2.pt"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert {key: body[key] for key in SWAP} == SWAP
+        assert body["complete"] is True
+        assert [(w["status"], w["version"]) for w in body["workers"]] == [("swapped", SWAP["version"])]
+        swap.assert_called_once_with("aircraft", (tmp_path / "aircraft" / "v2.pt").resolve())
+
+    async def test_default_weights(self, client):
+        with patch.object(InferenceFactory, "swap_classifier", return_value=SWAP) as swap:
+            response = await client.post("/admin/models/aircraft/swap")
+
+        assert response.status_code == 200
+        swap.assert_called_once_with("aircraft", None)
+
+    async def test_swap_is_broadcast(self, client):
+        workers = [
+            {"worker": "host:1", "status": "swapped", "version": SWAP["version"], "error": None},
+            {"worker": "host:2", "status": "pending", "version": None, "error": None},
+        ]
+        with patch.object(InferenceFactory, "swap_classifier", return_value=SWAP), \
+                patch.object(admin.get_swap_sync(), "broadcast", return_value=(workers, False)) as broadcast:
+            response = await client.post("/admin/models/aircraft/swap")
+
+        assert response.status_code == 200
+        assert response.json()["complete"] is False
+        assert response.json()["workers"] == workers
+        broadcast.assert_called_once_with("aircraft", None, SWAP)
+
+    async def test_weights_outside_model_dir(self, client):
+        response = await client.post("/admin/models/aircraft/swap", json={"weights_path": "../../etc/passwd"})
+
+        assert response.status_code == 400
+
+    async def test_failed_swap(self, client):
+        with patch.object(InferenceFactory, "swap_classifier", side_effect=InferenceFactoryError("bad weights")), \
+                patch.object(admin.get_swap_sync(), "broadcast") as broadcast:
+            response = await client.post("/admin/models/aircraft/swap")
+
+        assert response.status_code == 500
+        assert "keeps serving" in response.json()["detail"]
+        broadcast.assert_not_called()
+
+    async def test_unknown_model(self, client):
+        response = await client.post("/admin/models/quality/swap")
+
+        assert response.status_code == 422
+
+    async def test_invalid_token(self, client):
+        response = await client.post("/admin/models/aircraft/swap", headers={"X-Admin-Token": "guess"})
+
+        assert response.status_code == 403
+
+    async def test_disabled_without_token(self, client, monkeypatch):
+        monkeypatch.setattr(get_settings(), "admin_token", None)
+
+        response = await client.post("/admin/models/aircraft/swap")
+
+        assert response.status_code == 404
+
+
+class TestDebugTraces:
+    """The trace endpoints are guarded by the admin token."""
+
+    async def test_requires_token(self, client):
+        """Traces are only listed with the admin token."""
+        app = FastAPI()
+        app.include_router(debug.router)
+        set_exporter(RingBufferExporter())
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as anonymous:
+                assert (await anonymous.get("/debug/traces")).status_code == 403
+                response = await anonymous.get("/debug/traces", headers={"X-Admin-Token": "secret"})
+        finally:
+            reset_exporter()
+        assert response.status_code == 200
@@ -0,0 +1,122 @@
+"""
+Unit tests for API dependencies.
+"""
+
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.deps import get_batch_image_input, get_image_input
+from app.services.base import ImageSource
+
+
+def _describe(value: ImageSource) -> dict:
+    """Describe an extracted image input."""
+    if isinstance(value, bytes):
+        return {"kind": "bytes", "size": len(value)}
+    return {"kind": "str", "value": value}
+
+
+@pytest.fixture
+async def client():
+    """Client for a minimal app exercising the image input dependencies."""
+    app = FastAPI()
+
+    @app.post("/single")
+    async def single(image: Annotated[ImageSource, Depends(get_image_input)]) -> dict:
+        return _describe(image)
+
+    @app.post("/batch")
+    async def batch(images: Annotated[list[ImageSource], Depends(get_batch_image_input)]) -> list:
+        return [_describe(image) for image in images]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestImageInputDependencies:
+    """Tests for get_image_input and get_batch_image_input."""
+
+    async def test_json_body(self, client, test_image_base64):
+        """JSON bodies keep working as before."""
+        response = await client.post("/single", json={"image": test_image_base64})
+        assert response.status_code == 200
+        assert response.json() == {"kind": "str", "value": test_image_base64}
+
+    async def test_invalid_json_body_is_422(self, client):
+        """Invalid JSON bodies are rejected like regular body validation."""
+        response = await client.post("/single", json={"wrong": "field"})
+        assert response.status_code == 422
+
+    async def test_octet_stream_body(self, client, test_image_bytes):
+        """Raw binary bodies are passed through as bytes."""
+        response = await client.post(
+            "/single",
+            content=test_image_bytes,
+            headers={"Content-Type": "application/octet-stream"}
+        )
+        assert response.json() == {"kind": "bytes", "size": len(test_image_bytes)}
+
+    async def test_image_content_type_body(self, client, test_image_bytes):
+        """image/* bodies are treated as raw binary."""
+        response = await client.post(
+            "/single",
+            content=test_image_bytes,
+            headers={"Content-Type": "image/jpeg"}
+        )
+        assert response.json()["kind"] == "bytes"
+
+    async def test_empty_binary_body_is_422(self, client):
+        """Empty binary bodies are rejected."""
+        response = await client.post(
+            "/single",
+            content=b"",
+            headers={"Content-Type": "application/octet-stream"}
+        )
+        assert response.status_code == 422
+
+    async def test_multipart_file(self, client, test_image_bytes):
+        """Multipart file uploads are read as bytes."""
+        response = await client.post(
+            "/single",
+            files={"image": ("plane.jpg", test_image_bytes, "image/jpeg")}
+        )
+        assert response.json() == {"kind": "bytes", "size": len(test_image_bytes)}
+
+    async def test_multipart_missing_field_is_422(self, client, test_image_bytes):
+        """Multipart bodies without an image field are rejected."""
+        response = await client.post(
+            "/single",
+            files={"other": ("plane.jpg", test_image_bytes, "image/jpeg")}
+        )
+        assert response.status_code == 422
+
+    async def test_batch_multipart_files_and_text(self, client, test_image_bytes):
+        """Batch multipart accepts several files and text fields in order."""
+        response = await client.post(
+            "/batch",
+            files=[
+                ("images", ("a.jpg", test_image_bytes, "image/jpeg")),
+                ("images", ("b.jpg", test_image_bytes, "image/jpeg")),
+            ],
+            data={"images": "https://example.com/c.jpg"}
+        )
+        body = response.json()
+        assert [item["kind"] for item in body].count("bytes") == 2
+        assert {"kind": "str", "value": "https://example.com/c.jpg"} in body
+
+    async def test_batch_json_limits_enforced(self, client):
+        """Batch JSON bodies keep their size limits."""
+        response = await client.post("/batch", json={"images": []})
+        assert response.status_code == 422
+
+    async def test_batch_octet_stream_is_single_item(self, client, test_image_bytes):
+        """A raw binary batch body is a batch of one image."""
+        response = await client.post(
+            "/batch",
+            content=test_image_bytes,
+            headers={"Content-Type": "application/octet-stream"}
+        )
+        assert response.json() == [{"kind": "bytes", "size": len(test_image_bytes)}]
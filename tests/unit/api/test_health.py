@@ -0,0 +1,130 @@
+"""
+Unit tests for the readiness endpoint.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.routes import health
+from app.core.config import get_settings
+from app.inference.factory import MODEL_NAMES, InferenceFactory
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(health.router)
+    InferenceFactory.reset()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    InferenceFactory.reset()
+
+
+class TestReadiness:
+    """Tests for /ready."""
+
+    async def test_not_ready_until_all_models_are_warm(self, client, monkeypatch):
+        monkeypatch.setattr(get_settings(), "preload_models", True)
+        InferenceFactory.set_model_state("aircraft", "warming")
+
+        response = await client.get("/ready")
+
+        assert response.status_code == 503
+        body = response.json()
+        assert body["ready"] is False
+        assert body["models"]["aircraft"] == "warming"
+        assert body["models"]["quality"] == "not_loaded"
+
+    async def test_ready(self, client, monkeypatch):
+        monkeypatch.setattr(get_settings(), "preload_models", True)
+        for name in MODEL_NAMES:
+            InferenceFactory.set_model_state(name, "ready")
+
+        response = await client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["ready"] is True
+
+    async def test_optional_model_does_not_block_readiness(self, client, monkeypatch):
+        """A failed model outside ready_required_models is reported but does not block readiness."""
+        monkeypatch.setattr(get_settings(), "preload_models", True)
+        monkeypatch.setattr(get_settings(), "ready_required_models", ["aircraft", "airline"])
+        InferenceFactory.set_model_state("aircraft", "ready")
+        InferenceFactory.set_model_state("airline", "ready")
+        InferenceFactory.set_model_state("registration", "failed")
+
+        response = await client.get("/ready")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ready"] is True
+        assert body["required"] == ["aircraft", "airline"]
+        assert body["failed"] == ["registration"]
+
+    async def test_failed_required_model_is_not_ready(self, client, monkeypatch):
+        monkeypatch.setattr(get_settings(), "preload_models", True)
+        for name in MODEL_NAMES:
+            InferenceFactory.set_model_state(name, "ready")
+        InferenceFactory.set_model_state("quality", "failed")
+
+        response = await client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["failed"] == ["quality"]
+
+    async def test_failed_required_model_becomes_ready_once_loaded(self, client, monkeypatch):
+        """A required model whose preload failed is warmed up when a later use loads it."""
+        monkeypatch.setattr(get_settings(), "preload_models", True)
+        monkeypatch.setattr(get_settings(), "warmup_enabled", True)
+        monkeypatch.setattr(get_settings(), "ready_required_models", ["quality"])
+        assessor = MagicMock()
+        load = MagicMock(side_effect=[RuntimeError("no weights"), assessor])
+
+        with patch("app.inference.factory.INFERENCE_AVAILABLE", True), \
+                patch.object(InferenceFactory, "_create_quality_assessor", load):
+            InferenceFactory.preload_models(["quality"])
+            assert (await client.get("/ready")).status_code == 503
+
+            assert InferenceFactory.get_quality_assessor() is assessor
+
+        response = await client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["models"]["quality"] == "ready"
+        assessor.assess.assert_called_once()
+
+    async def test_always_ready_without_preloading(self, client, monkeypatch):
+        """Models load on first use when preloading is off."""
+        monkeypatch.setattr(get_settings(), "preload_models", False)
+
+        response = await client.get("/ready")
+
+        assert response.status_code == 200
+
+
+class TestGpuProbe:
+    """Tests for the cached GPU probe."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        health.gpu_available.cache_clear()
+        yield
+        health.gpu_available.cache_clear()
+
+    def test_cpu_device(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "device", "cpu")
+        assert health.gpu_available() is False
+
+    def test_uses_loaded_torch_once(self, monkeypatch):
+        """An already imported torch is asked once; the answer is cached."""
+        monkeypatch.setattr(get_settings(), "device", "cuda")
+        torch = MagicMock()
+        torch.cuda.is_available.return_value = True
+
+        with patch.dict("sys.modules", {"torch": torch}):
+            assert health.gpu_available() is True
+            assert health.gpu_available() is True
+
+        torch.cuda.is_available.assert_called_once()
@@ -0,0 +1,87 @@
+"""
+Unit tests for streaming batch responses.
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.api.streaming import get_stream_format, stream_batch
+from app.schemas.quality import BatchQualityItem
+
+
+async def _items():
+    yield {"index": 1, "success": False, "data": None, "error": "Quality assessment failed"}
+    yield {
+        "index": 0,
+        "success": True,
+        "data": {
+            "score": 0.9,
+            "pass": True,
+            "details": {"sharpness": 0.9, "exposure": 0.9, "composition": 0.9, "noise": 0.9, "color": 0.9},
+        },
+        "error": None,
+    }
+
+
+async def _failing_items():
+    yield {"index": 0, "success": False, "data": None, "error": "x"}
+    raise RuntimeError("executor gone")
+
+
+@pytest.fixture
+async def client():
+    """Client for an app streaming fixed items."""
+    app = FastAPI()
+
+    @app.post("/batch")
+    async def batch(request: Request, fail: bool = False):
+        return stream_batch(
+            _failing_items() if fail else _items(),
+            BatchQualityItem,
+            2,
+            get_stream_format(request),
+            summary_extra=lambda count, elapsed: {"streamed": count}
+        )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestStreaming:
+    """Tests for NDJSON and SSE batch streams."""
+
+    async def test_ndjson(self, client):
+        """Items are streamed one per line in completion order, then a summary."""
+        response = await client.post("/batch", headers={"Accept": "application/x-ndjson"})
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line.get("index") for line in lines[:2]] == [1, 0]
+        assert lines[1]["data"]["pass"] is True
+        assert lines[2] == {"summary": {"total": 2, "successful": 1, "failed": 1, "streamed": 2}}
+
+    async def test_sse(self, client):
+        """SSE streams item events followed by a summary event."""
+        response = await client.post("/batch", headers={"Accept": "text/event-stream"})
+
+        events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+        assert [e[0] for e in events] == ["event: item", "event: item", "event: summary"]
+        assert json.loads(events[2][1][len("data: "):])["successful"] == 1
+
+    async def test_failure_ends_with_error_record(self, client):
+        """A failure mid-stream ends with an error record instead of a summary."""
+        response = await client.post("/batch?fail=true", headers={"Accept": "application/x-ndjson"})
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[-1] == {"error": "executor gone"}
+
+    def test_stream_format(self):
+        """Plain JSON requests are not streamed."""
+        def request(accept):
+            return Request({"type": "http", "headers": [(b"accept", accept.encode())]})
+
+        assert get_stream_format(request("application/json")) is None
+        assert get_stream_format(request("text/event-stream")) == "text/event-stream"
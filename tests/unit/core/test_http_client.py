@@ -0,0 +1,106 @@
+"""
+Unit tests for the pooled async image fetcher.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.exceptions import ImageLoadError
+from app.core.http_client import ImageFetcher
+
+
+def _fetcher(handler, **kwargs) -> ImageFetcher:
+    """Create a fetcher backed by a mock transport."""
+    kwargs.setdefault("max_bytes", 1024)
+    return ImageFetcher(http2=False, transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestImageFetcher:
+    """Tests for ImageFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_body(self):
+        """fetch() returns the response body."""
+        fetcher = _fetcher(lambda request: httpx.Response(200, content=b"image-bytes"))
+        try:
+            assert await fetcher.fetch("https://example.com/a.jpg") == b"image-bytes"
+        finally:
+            await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self):
+        """Consecutive fetches share one pooled client."""
+        fetcher = _fetcher(lambda request: httpx.Response(200, content=b"x"))
+        try:
+            await fetcher.fetch("https://example.com/a.jpg")
+            first_client = fetcher._client
+            await fetcher.fetch("https://example.com/b.jpg")
+            assert fetcher._client is first_client
+        finally:
+            await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_image_load_error(self):
+        """HTTP error statuses surface as ImageLoadError."""
+        fetcher = _fetcher(lambda request: httpx.Response(404))
+        try:
+            with pytest.raises(ImageLoadError, match="Failed to load image from URL"):
+                await fetcher.fetch("https://example.com/missing.jpg")
+        finally:
+            await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_declared_oversize_rejected(self):
+        """A Content-Length above the limit is rejected before reading the body."""
+        fetcher = _fetcher(
+            lambda request: httpx.Response(200, headers={"content-length": "4096"}, content=b"x" * 4096),
+            max_bytes=1024
+        )
+        try:
+            with pytest.raises(ImageLoadError, match="size limit"):
+                await fetcher.fetch("https://example.com/big.jpg")
+        finally:
+            await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streamed_oversize_aborted(self):
+        """Bodies without Content-Length are aborted once they exceed the limit."""
+        chunks_sent = []
+
+        async def body():
+            for _ in range(100):
+                chunks_sent.append(1)
+                yield b"x" * 256
+
+        fetcher = _fetcher(lambda request: httpx.Response(200, content=body()), max_bytes=1024)
+        try:
+            with pytest.raises(ImageLoadError, match="size limit"):
+                await fetcher.fetch("https://example.com/stream.jpg")
+            assert len(chunks_sent) < 100
+        finally:
+            await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_cap(self):
+        """No more than per_host_limit downloads run against one host."""
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, content=b"x")
+
+        fetcher = _fetcher(handler, per_host_limit=2)
+        try:
+            await asyncio.gather(*[
+                fetcher.fetch(f"https://example.com/{i}.jpg") for i in range(8)
+            ])
+            assert peak == 2
+        finally:
+            await fetcher.aclose()
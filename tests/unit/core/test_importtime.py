@@ -0,0 +1,112 @@
+"""
+Unit tests for the import-time budget check.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.core.importtime import ImportReport, main, measure_imports, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        900 |   app.core.config
+import time:      5000 |       5000 |     torch._C
+import time:      1000 |       6000 |   torch
+import time:       200 |       7100 | app.main
+"""
+
+
+class TestParse:
+    """Tests for parse_importtime and ImportReport."""
+
+    def test_parse(self):
+        timings = parse_importtime(SAMPLE)
+
+        assert [t.module for t in timings] == ["_io", "app.core.config", "torch._C", "torch", "app.main"]
+        assert timings[2].self_us == 5000
+        assert timings[2].depth == 2
+        assert timings[4].depth == 0
+
+    def test_report(self):
+        report = ImportReport("app.main", parse_importtime(SAMPLE))
+
+        assert report.total_ms == pytest.approx(7.1)
+        assert report.slowest(1)[0].module == "torch._C"
+        assert report.slowest(1, cumulative=True)[0].module == "app.main"
+        assert report.imported("torch")
+        assert not report.imported("tor")
+
+
+# Makes any import of the inference stack fail, even where it is installed;
+# lookups (importlib.util.find_spec) still succeed
+_BLOCK_INFERENCE_STACK = """
+import importlib, importlib.abc, importlib.machinery, sys
+
+BLOCKED = {"torch", "ultralytics", "onnxruntime", "aerovision_inference"}
+
+
+class BlockInferenceStack(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, name, path=None, target=None):
+        if name.partition(".")[0] in BLOCKED:
+            return importlib.machinery.ModuleSpec(name, self)
+        return None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        raise RuntimeError(f"control plane imported {module.__name__}")
+
+
+sys.meta_path.insert(0, BlockInferenceStack())
+importlib.import_module(sys.argv[1])
+"""
+
+
+def _import_with_inference_stack_blocked(module: str) -> subprocess.CompletedProcess:
+    """Import a module in a fresh interpreter that refuses to import the inference stack."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    return subprocess.run(
+        [sys.executable, "-c", _BLOCK_INFERENCE_STACK, module],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+
+
+@pytest.mark.parametrize("module", ["app.api.routes.health", "app.main"])
+def test_control_plane_does_not_import_inference_stack(module):
+    """Health and the app import with torch, ultralytics, ONNX Runtime and the inference package blocked."""
+    result = _import_with_inference_stack_blocked(module)
+
+    assert result.returncode == 0, result.stderr[-2000:]
+
+
+def test_blocked_import_fails():
+    """The blocker catches an inference stack import (so the test above is not vacuous)."""
+    result = _import_with_inference_stack_blocked("onnxruntime")
+
+    assert result.returncode != 0
+    assert "control plane imported onnxruntime" in result.stderr
+
+
+def test_health_route_does_not_import_data_plane():
+    """Importing the health routes does not import the other route modules."""
+    report = measure_imports("app.api.routes.health")
+
+    assert not report.imported("app.api.routes.review")
+    assert not report.imported("app.services.review_service")
+
+
+def test_cli_budget(capsys):
+    """The CLI lists the slowest modules and fails over budget."""
+    assert main(["app.core.config", "--top", "3", "--forbid", "torch"]) == 0
+    assert main(["app.core.config", "--budget-ms", "0"]) == 1
+
+    output = capsys.readouterr().out
+    assert "app.core.config" in output
+    assert "exceeds the 0 ms budget" in output
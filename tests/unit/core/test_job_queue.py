@@ -0,0 +1,301 @@
+"""
+Unit tests for job queue leases, requeuing and retries.
+"""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core import job_queue
+from app.core.job_queue import JobQueue, MemoryJobQueue, RedisJobQueue
+
+
+class FakePipeline:
+    """Pipeline over FakeRedis: commands run immediately while watching, else on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+        self._immediate = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._commands = []
+
+    async def watch(self, *keys):
+        self._immediate = True
+
+    def multi(self):
+        self._immediate = False
+
+    def __getattr__(self, name):
+        method = getattr(self._redis, name)
+        if self._immediate:
+            return method
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        commands, self._commands = self._commands, []
+        return [await method(*args, **kwargs) for method, args, kwargs in commands]
+
+
+class FakeRedis:
+    """The Redis commands the job queue uses, in memory, with decoded responses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def expire(self, key, seconds):
+        return key in self.data
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = str(value)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        fields = dict(mapping or {})
+        if field is not None:
+            fields[field] = value
+        self.data.setdefault(key, {}).update({k: str(v) for k, v in fields.items()})
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def hmget(self, key, fields):
+        return [self.data.get(key, {}).get(field) for field in fields]
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hincrby(self, key, field, amount=1):
+        value = int(self.data.setdefault(key, {}).get(field, 0)) + amount
+        self.data[key][field] = str(value)
+        return value
+
+    async def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+
+    async def blmove(self, source, destination, timeout, src="LEFT", dest="RIGHT"):
+        items = self.data.get(source)
+        if not items:
+            return None
+        item = items.pop(0)
+        self.data.setdefault(destination, []).append(item)
+        return item
+
+    async def lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+
+    async def lpos(self, key, value):
+        items = self.data.get(key, [])
+        return items.index(value) if value in items else None
+
+    async def lrem(self, key, count, value):
+        items = self.data.get(key, [])
+        if value in items:
+            items.remove(value)
+            return 1
+        return 0
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def srem(self, key, *members):
+        self.data.get(key, set()).difference_update(members)
+
+    async def zadd(self, key, mapping, nx=False, xx=False, ch=False):
+        scores = self.data.setdefault(key, {})
+        changed = 0
+        for member, score in mapping.items():
+            if (nx and member in scores) or (xx and member not in scores):
+                continue
+            changed += member not in scores or (ch and scores[member] != score)
+            scores[member] = score
+        return changed
+
+    async def zmscore(self, key, members):
+        scores = self.data.get(key, {})
+        return [scores.get(member) for member in members]
+
+    async def zrem(self, key, member):
+        return int(self.data.get(key, {}).pop(member, None) is not None)
+
+
+def _results(chunk):
+    return [{"index": chunk.start + i, "success": True, "data": None, "error": None} for i in range(len(chunk.images))]
+
+
+def _expire_leases(queue):
+    """Make every current lease older than the visibility timeout."""
+    if isinstance(queue, MemoryJobQueue):
+        for key in queue._leases:
+            queue._leases[key] -= queue.visibility_timeout + 1
+    else:
+        leases = queue._redis.data.get(RedisJobQueue.LEASES_KEY, {})
+        for item in leases:
+            leases[item] -= queue.visibility_timeout + 1
+
+
+@pytest.fixture(params=["memory", "redis"])
+def queue(request):
+    """Both queue backends, with two chunks per job and two attempts per chunk."""
+    if request.param == "memory":
+        yield MemoryJobQueue(chunk_size=2, visibility_timeout=60, max_attempts=2)
+        return
+
+    redis = FakeRedis()
+    with patch.object(job_queue.get_stats_manager(), "get_async_redis", AsyncMock(return_value=redis)):
+        queue = RedisJobQueue(chunk_size=2, visibility_timeout=60, max_attempts=2)
+        queue._redis = redis
+        yield queue
+
+
+def test_queue_interface_is_abstract():
+    with pytest.raises(TypeError):
+        JobQueue(chunk_size=2, ttl_seconds=60)
+
+
+class TestLeases:
+    """Tests shared by both backends."""
+
+    async def test_completed_chunk_is_acknowledged(self, queue):
+        job = await queue.create_job("review", ["a", "b", "c"], {})
+
+        while (chunk := await queue.next_chunk(timeout=0.01)) is not None:
+            assert await queue.complete_chunk(chunk, _results(chunk)) is True
+
+        _expire_leases(queue)
+        assert await queue.requeue_stale() == 0
+        status = await queue.get_job(job["job_id"])
+        assert (status["status"], status["processed"]) == ("completed", 3)
+
+    async def test_stale_chunk_is_requeued(self, queue):
+        """A chunk whose worker never completes it is handed out again."""
+        job = await queue.create_job("review", ["a", "b"], {})
+        lost = await queue.next_chunk(timeout=0.01)
+        assert await queue.next_chunk(timeout=0.01) is None
+
+        _expire_leases(queue)
+        assert await queue.requeue_stale() == 1
+
+        retry = await queue.next_chunk(timeout=0.01)
+        assert (retry.index, retry.images, retry.attempt) == (lost.index, ["a", "b"], 2)
+        assert await queue.complete_chunk(retry, _results(retry)) is True
+        assert (await queue.get_job(job["job_id"]))["status"] == "completed"
+
+    async def test_results_of_expired_lease_are_dropped(self, queue):
+        """A slow worker finishing after its chunk was requeued does not count it twice."""
+        job = await queue.create_job("review", ["a", "b"], {})
+        slow = await queue.next_chunk(timeout=0.01)
+        _expire_leases(queue)
+        await queue.requeue_stale()
+        retry = await queue.next_chunk(timeout=0.01)
+
+        assert await queue.complete_chunk(retry, _results(retry)) is True
+        assert await queue.complete_chunk(slow, _results(slow)) is False
+        assert (await queue.get_job(job["job_id"]))["processed"] == 2
+
+    async def test_extended_lease_is_not_requeued(self, queue):
+        """A worker still processing a chunk keeps it past the visibility timeout."""
+        job = await queue.create_job("review", ["a", "b"], {})
+        chunk = await queue.next_chunk(timeout=0.01)
+
+        _expire_leases(queue)
+        assert await queue.extend_lease(chunk) is True
+        assert await queue.requeue_stale() == 0
+
+        assert await queue.complete_chunk(chunk, _results(chunk)) is True
+        assert (await queue.get_job(job["job_id"]))["status"] == "completed"
+
+    async def test_lost_lease_is_not_extended(self, queue):
+        """Once a chunk was requeued, the slow worker cannot take it back."""
+        await queue.create_job("review", ["a", "b"], {})
+        slow = await queue.next_chunk(timeout=0.01)
+        _expire_leases(queue)
+        await queue.requeue_stale()
+
+        assert await queue.extend_lease(slow) is False
+        retry = await queue.next_chunk(timeout=0.01)
+        assert await queue.extend_lease(slow) is False
+        assert await queue.extend_lease(retry) is True
+
+    async def test_job_fails_when_attempts_run_out(self, queue):
+        job = await queue.create_job("review", ["a", "b", "c"], {})
+        first = await queue.next_chunk(timeout=0.01)
+        second = await queue.next_chunk(timeout=0.01)
+        await queue.complete_chunk(second, _results(second))
+
+        # Second attempt, which also never completes
+        _expire_leases(queue)
+        await queue.requeue_stale()
+        retry = await queue.next_chunk(timeout=0.01)
+        assert (retry.index, retry.attempt) == (first.index, 2)
+
+        _expire_leases(queue)
+        assert await queue.requeue_stale() == 1
+
+        status = await queue.get_job(job["job_id"])
+        assert status["status"] == "failed"
+        assert "2 attempts" in status["error"]
+        assert (status["processed"], status["failed"]) == (3, 2)
+        results = await queue.get_results(job["job_id"], offset=0, limit=2)
+        assert [r["success"] for r in results] == [False, False]
+        assert await queue.next_chunk(timeout=0.01) is None
+        assert await queue.complete_chunk(retry, _results(retry)) is False
+
+
+async def test_redis_chunk_moves_to_processing_list():
+    """Taking a chunk moves it to the worker's processing list instead of removing it."""
+    redis = FakeRedis()
+    with patch.object(job_queue.get_stats_manager(), "get_async_redis", AsyncMock(return_value=redis)):
+        queue = RedisJobQueue(chunk_size=2)
+        job = await queue.create_job("review", ["a", "b"], {})
+
+        chunk = await queue.next_chunk(timeout=0.01)
+
+        item = f"{job['job_id']}:0"
+        assert redis.data[RedisJobQueue.QUEUE_KEY] == []
+        assert redis.data[queue.processing_key] == [item]
+        assert redis.data[f"jobs:{job['job_id']}:chunk:0"] is not None
+        assert redis.data[RedisJobQueue.LEASES_KEY][item] <= time.time()
+
+        await queue.complete_chunk(chunk, _results(chunk))
+        assert redis.data[queue.processing_key] == []
+        assert f"jobs:{job['job_id']}:chunk:0" not in redis.data
+
+
+async def test_redis_expired_job_is_not_recreated():
+    """Completing a chunk of an expired job does not write a job hash without a TTL."""
+    redis = FakeRedis()
+    with patch.object(job_queue.get_stats_manager(), "get_async_redis", AsyncMock(return_value=redis)):
+        queue = RedisJobQueue(chunk_size=2)
+        job = await queue.create_job("review", ["a", "b"], {})
+        chunk = await queue.next_chunk(timeout=0.01)
+        del redis.data[f"jobs:{job['job_id']}"]
+
+        assert await queue.complete_chunk(chunk, _results(chunk)) is False
+
+        assert f"jobs:{job['job_id']}" not in redis.data
+        assert f"jobs:{job['job_id']}:results:0" not in redis.data
+        assert redis.data[queue.processing_key] == []
@@ -0,0 +1,108 @@
+"""
+Unit tests for latency histograms.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.metrics import (
+    STAGE_LATENCY,
+    Histogram,
+    TimedJSONResponse,
+    batch_size_label,
+    get_metrics_registry,
+    time_stage,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_render_cumulative_buckets(self):
+        """Buckets are cumulative and end with +Inf, sum and count."""
+        histogram = Histogram("test_seconds", "Test", ("route",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.5, "/a")
+        histogram.observe(5.0, "/a")
+
+        lines = histogram.render()
+
+        assert '# TYPE test_seconds histogram' in lines
+        assert 'test_seconds_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{route="/a",le="1.0"} 2' in lines
+        assert 'test_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'test_seconds_sum{route="/a"} 5.55' in lines
+        assert 'test_seconds_count{route="/a"} 3' in lines
+
+    def test_label_values_escaped(self):
+        """Quotes in label values are escaped."""
+        histogram = Histogram("test_seconds", "Test", ("route",), buckets=(1.0,))
+        histogram.observe(0.1, 'a"b')
+        assert 'test_seconds_count{route="a\\"b"} 1' in histogram.render()
+
+    def test_label_count_checked(self):
+        """Observations must provide every label."""
+        histogram = Histogram("test_seconds", "Test", ("a", "b"))
+        with pytest.raises(ValueError):
+            histogram.observe(0.1, "x")
+
+
+class TestStageTiming:
+    """Tests for stage timing helpers."""
+
+    def test_batch_size_label_bounded(self):
+        """Batch sizes are rounded up to powers of two."""
+        assert [batch_size_label(n) for n in (0, 1, 2, 3, 5, 50)] == ["1", "1", "2", "4", "8", "64"]
+
+    def test_time_stage_records_failures(self):
+        """Failed stages are recorded too."""
+        with pytest.raises(RuntimeError):
+            with time_stage("inference", "aircraft", 3):
+                raise RuntimeError("boom")
+
+        rendered = get_metrics_registry().render()
+        assert (
+            'aerovision_stage_duration_seconds_count{stage="inference",model="aircraft",batch_size="4"} 1'
+            in rendered
+        )
+
+    def test_disabled_metrics_not_recorded(self):
+        """Nothing is recorded when metrics are disabled."""
+        with patch("app.core.metrics.get_settings", return_value=MagicMock(metrics_enabled=False)):
+            with time_stage("inference", "quality"):
+                pass
+        assert "stage=" not in get_metrics_registry().render()
+
+    def test_timed_json_response_records_serialization(self):
+        """Rendering a response records a serialize stage."""
+        response = TimedJSONResponse({"ok": True})
+        assert response.body == b'{"ok":true}'
+        assert any(labels[0] == "serialize" for labels in STAGE_LATENCY._series)
+
+
+class TestRequestRouteLabel:
+    """Tests for the route label of request latencies."""
+
+    async def test_route_template_and_unmatched_label(self):
+        """Path parameters map to the route template; unknown paths share one label."""
+        from httpx import ASGITransport, AsyncClient
+
+        from app.main import app
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/api/v1/debug/traces/debug")
+            await client.get("/no/such/path/1")
+            await client.get("/no/such/path/2")
+
+        rendered = get_metrics_registry().render()
+        assert 'route="/api/v1/debug/traces/{request_id}"' in rendered
+        assert 'route="unmatched"' in rendered
+        assert "/no/such/path" not in rendered
@@ -68,3 +68,77 @@ class TestGlobalFunctions:
         """Test that reset_stats calls the manager."""
         reset_stats()
         mock_manager.reset_stats.assert_called_once()
+
+
+class TestAggregatedCounters:
+    """Tests for in-process counters flushed to Redis in bulk."""
+
+    def _mock_redis(self, totals=(None, None, None, None)):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=list(totals))
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        redis.set = AsyncMock()
+        return redis, pipe
+
+    def test_increment_does_no_redis_io(self):
+        """Incrementing only touches local counters."""
+        manager = RedisStatsManager()
+        with patch.object(manager, "get_redis") as mock_get_redis:
+            manager.increment_request_count(success=True)
+            manager.increment_request_count(success=False)
+            mock_get_redis.assert_not_called()
+
+        assert manager._peek_pending() == {"request_count": 2, "success_count": 1, "error_count": 1}
+
+    async def test_flush_uses_incrby_and_clears_deltas(self):
+        """flush() sends accumulated deltas with INCRBY in one pipeline."""
+        manager = RedisStatsManager()
+        redis, pipe = self._mock_redis()
+        manager.get_async_redis = AsyncMock(return_value=redis)
+
+        for _ in range(3):
+            manager.increment_request_count(success=True)
+        await manager.flush()
+
+        pipe.incrby.assert_any_call("stats:request_count", 3)
+        pipe.incrby.assert_any_call("stats:success_count", 3)
+        assert pipe.incrby.call_count == 2
+        pipe.execute.assert_awaited_once()
+        assert manager._peek_pending()["request_count"] == 0
+
+    async def test_flush_failure_keeps_deltas(self):
+        """Deltas survive a failed flush."""
+        manager = RedisStatsManager()
+        manager.get_async_redis = AsyncMock(side_effect=ConnectionError("down"))
+
+        manager.increment_request_count(success=False)
+        await manager.flush()
+
+        assert manager._peek_pending() == {"request_count": 1, "success_count": 0, "error_count": 1}
+
+    async def test_stats_merge_flushed_and_local(self):
+        """get_request_stats adds unflushed local deltas to Redis totals."""
+        manager = RedisStatsManager()
+        redis, _ = self._mock_redis(totals=("10", "8", "2", "1000.0"))
+        manager.get_async_redis = AsyncMock(return_value=redis)
+
+        manager.increment_request_count(success=True)
+        stats = await manager.get_request_stats()
+
+        assert stats["total_requests"] == 11
+        assert stats["successful_requests"] == 9
+        assert stats["failed_requests"] == 2
+
+    async def test_stop_flusher_flushes_remaining(self):
+        """Stopping the background task performs a final flush."""
+        manager = RedisStatsManager()
+        redis, pipe = self._mock_redis()
+        manager.get_async_redis = AsyncMock(return_value=redis)
+
+        manager.start_flusher(interval=60)
+        manager.increment_request_count(success=True)
+        await manager.stop_flusher()
+
+        pipe.incrby.assert_any_call("stats:request_count", 1)
+        assert manager._flush_task is None
@@ -0,0 +1,127 @@
+"""
+Unit tests for the content-addressed result cache.
+"""
+
+import base64
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.core.result_cache import ResultCache, make_cache_key
+from app.services.aircraft_service import AircraftService
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_same_inputs_same_key(self):
+        """Keys are deterministic and independent of param order."""
+        key1 = make_cache_key("aircraft", "abc", "v1", {"top_k": 5, "x": 1})
+        key2 = make_cache_key("aircraft", "abc", "v1", {"x": 1, "top_k": 5})
+        assert key1 == key2
+
+    def test_key_changes_with_version_and_params(self):
+        """Model version and parameters are part of the key."""
+        base = make_cache_key("aircraft", "abc", "v1", {"top_k": 5})
+        assert make_cache_key("aircraft", "abc", "v2", {"top_k": 5}) != base
+        assert make_cache_key("aircraft", "abc", "v1", {"top_k": 3}) != base
+        assert make_cache_key("airline", "abc", "v1", {"top_k": 5}) != base
+        assert make_cache_key("aircraft", "def", "v1", {"top_k": 5}) != base
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_counters(self):
+        """Lookups are counted as hits or misses."""
+        cache = ResultCache(max_bytes=10_000)
+
+        assert await cache.get("k") is None
+        await cache.set("k", {"score": 0.5})
+        assert await cache.get("k") == {"score": 0.5}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_respects_byte_budget(self):
+        """Least recently used entries are evicted to stay within budget."""
+        cache = ResultCache(max_bytes=50)
+
+        await cache.set("a", {"v": "x" * 10})
+        await cache.set("b", {"v": "y" * 10})
+        await cache.get("a")  # "a" becomes most recently used
+        await cache.set("c", {"v": "z" * 10})
+
+        assert cache.stats()["bytes"] <= 50
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+
+    @pytest.mark.asyncio
+    async def test_oversized_entry_not_stored(self):
+        """Entries larger than the whole budget are skipped."""
+        cache = ResultCache(max_bytes=10)
+        await cache.set("k", {"v": "x" * 100})
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_hit_populates_memory(self):
+        """A Redis hit is promoted to the in-process tier."""
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value='{"score": 0.9}')
+        manager = MagicMock()
+        manager.get_async_redis = AsyncMock(return_value=redis)
+
+        cache = ResultCache(max_bytes=10_000, redis_enabled=True)
+        with patch("app.core.result_cache.get_stats_manager", return_value=manager):
+            assert await cache.get("k") == {"score": 0.9}
+            assert await cache.get("k") == {"score": 0.9}
+
+        stats = cache.stats()
+        assert stats["redis_hits"] == 1
+        assert stats["memory_hits"] == 1
+        redis.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_is_a_miss(self):
+        """Redis errors degrade to a miss instead of failing the request."""
+        manager = MagicMock()
+        manager.get_async_redis = AsyncMock(side_effect=ConnectionError("down"))
+
+        cache = ResultCache(max_bytes=10_000, redis_enabled=True, ttl_seconds=60)
+        with patch("app.core.result_cache.get_stats_manager", return_value=manager):
+            assert await cache.get("k") is None
+            await cache.set("k", {"v": 1})
+
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["entries"] == 1
+
+
+class TestServiceResultCaching:
+    """Tests for result caching in the service layer."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_image_served_from_cache(self, sample_aircraft_result):
+        """Re-submitting the same image does not re-run inference."""
+        img = Image.new("RGB", (32, 32), color=(1, 2, 3))
+        buffer = BytesIO()
+        img.save(buffer, format="PNG")
+        image_b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+        classifier = MagicMock()
+        classifier.predict.side_effect = lambda images, top_k=None: [sample_aircraft_result] * len(images)
+        service = AircraftService()
+        service._classifier = classifier
+
+        first, _ = await service.classify_async(image_b64, top_k=5)
+        second, _ = await service.classify_async(image_b64, top_k=5)
+        await service.classify_async(image_b64, top_k=3)
+
+        assert first == second
+        assert classifier.predict.call_count == 2
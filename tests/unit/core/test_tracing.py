@@ -0,0 +1,195 @@
+"""
+Unit tests for request tracing.
+"""
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from app.core.tracing import (
+    JsonFileExporter,
+    RingBufferExporter,
+    build_span_tree,
+    get_request_id,
+    request_context,
+    reset_exporter,
+    set_exporter,
+    start_span,
+)
+from app.inference.executors import InferenceExecutor
+from app.services.base import BaseService
+
+
+@pytest.fixture
+def buffer():
+    """Install an in-memory exporter for the test."""
+    exporter = RingBufferExporter(max_spans=100)
+    set_exporter(exporter)
+    yield exporter
+    reset_exporter()
+
+
+class TestSpans:
+    """Tests for span creation and nesting."""
+
+    def test_nested_spans_share_trace_and_request(self, buffer):
+        """Child spans point at their parent and carry the request ID."""
+        with request_context("req-1"):
+            with start_span("request"):
+                with start_span("stage", model="aircraft"):
+                    pass
+
+        spans = buffer.get_trace("req-1")
+        root, child = spans
+        assert root.parent_id is None
+        assert child.parent_id == root.span_id
+        assert child.trace_id == root.trace_id
+        assert child.attributes == {"model": "aircraft"}
+        assert child.duration_ms >= 0
+
+    def test_exception_recorded_and_reraised(self, buffer):
+        """Errors are recorded on the span."""
+        with pytest.raises(ValueError):
+            with start_span("failing"):
+                raise ValueError("boom")
+
+        assert buffer.recent_requests() == []
+        assert buffer._spans[0].error == "ValueError: boom"
+
+    def test_request_context_generates_id(self):
+        """A request ID is generated when none is given."""
+        with request_context() as request_id:
+            assert get_request_id() == request_id
+        assert get_request_id() is None
+
+    def test_disabled_tracing_yields_none(self):
+        """No spans are produced without an exporter."""
+        set_exporter(None)
+        try:
+            with start_span("stage") as span:
+                assert span is None
+        finally:
+            reset_exporter()
+
+    def test_ring_buffer_bounded(self):
+        """The ring buffer drops the oldest spans."""
+        exporter = RingBufferExporter(max_spans=2)
+        set_exporter(exporter)
+        try:
+            for name in ("a", "b", "c"):
+                with start_span(name):
+                    pass
+        finally:
+            reset_exporter()
+        assert [s.name for s in exporter._spans] == ["b", "c"]
+
+
+class TestExporters:
+    """Tests for span exporters and trace views."""
+
+    def test_json_file_exporter_writes_otlp_lines(self, tmp_path):
+        """Spans are written in the OTLP/JSON layout."""
+        path = tmp_path / "traces.jsonl"
+        set_exporter(JsonFileExporter(str(path)))
+        try:
+            with request_context("req-2"):
+                with start_span("stage", batch_size=4):
+                    pass
+        finally:
+            reset_exporter()
+
+        payload = json.loads(path.read_text().splitlines()[0])
+        span = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert span["name"] == "stage"
+        assert {"key": "batch_size", "value": {"intValue": "4"}} in span["attributes"]
+        assert {"key": "request.id", "value": {"stringValue": "req-2"}} in span["attributes"]
+
+    def test_json_file_exporter_writes_in_background(self, tmp_path):
+        """Spans are written by the writer thread, not by the exporting caller."""
+        path = tmp_path / "traces.jsonl"
+        exporter = JsonFileExporter(str(path))
+        writer_threads = set()
+        real_open = Path.open
+
+        def tracking_open(self, *args, **kwargs):
+            writer_threads.add(threading.get_ident())
+            return real_open(self, *args, **kwargs)
+
+        set_exporter(exporter)
+        try:
+            with patch.object(Path, "open", tracking_open):
+                for i in range(20):
+                    with start_span(f"stage-{i}"):
+                        pass
+                exporter.flush()
+        finally:
+            reset_exporter()
+
+        assert writer_threads and threading.get_ident() not in writer_threads
+        assert len(path.read_text().splitlines()) == 20
+
+    def test_build_span_tree(self, buffer):
+        """Spans are nested under their parents."""
+        with request_context("req-3"):
+            with start_span("request"):
+                with start_span("a"):
+                    with start_span("a1"):
+                        pass
+                with start_span("b"):
+                    pass
+
+        (root,) = build_span_tree(buffer.get_trace("req-3"))
+        assert [c["name"] for c in root["children"]] == ["a", "b"]
+        assert root["children"][0]["children"][0]["name"] == "a1"
+
+
+class TestServiceTracing:
+    """Tests for spans produced by the service layer."""
+
+    def test_measure_time_creates_named_span(self, buffer):
+        """measure_time spans are named after the enclosing function."""
+        def outer():
+            def do_work():
+                return 1
+            return BaseService.measure_time(do_work)
+
+        with request_context("req-4"):
+            outer()
+
+        (span,) = buffer.get_trace("req-4")
+        assert span.name.endswith("test_measure_time_creates_named_span")
+
+    async def test_batch_items_are_child_spans(self, buffer):
+        """Each loaded batch item gets a child span of the batch."""
+        image = Image.new("RGB", (10, 10))
+        with patch.object(BaseService, "load_image", side_effect=[image, ValueError("bad")]):
+            with request_context("req-5"):
+                with start_span("batch"):
+                    await BaseService.load_images_async(["a", "b"])
+
+        (root,) = build_span_tree(buffer.get_trace("req-5"))
+        items = [c for c in root["children"] if c["name"] == "batch_item"]
+        assert sorted(c["attributes"]["index"] for c in items) == [0, 1]
+        assert any(c["error"] == "bad" for c in items)
+
+    async def test_context_propagates_to_inference_executor(self, buffer):
+        """Spans opened on inference threads join the request trace."""
+        executor = InferenceExecutor("traced", max_workers=1, max_queue=1)
+
+        def infer():
+            with start_span("inference"):
+                return True
+
+        try:
+            with request_context("req-6"):
+                with start_span("request"):
+                    await executor.run(infer)
+        finally:
+            executor.shutdown()
+
+        (root,) = build_span_tree(buffer.get_trace("req-6"))
+        assert root["children"][0]["name"] == "inference"
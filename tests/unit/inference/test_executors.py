@@ -0,0 +1,124 @@
+"""
+Unit tests for the bounded inference executors.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.exceptions import RateLimitError
+from app.inference.executors import (
+    InferenceExecutor,
+    get_executor_stats,
+    get_inference_executor,
+    shutdown_executors,
+)
+
+
+class TestInferenceExecutor:
+    """Tests for InferenceExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result(self):
+        """run() awaits the blocking call and returns its result."""
+        executor = InferenceExecutor("test", max_workers=1, max_queue=1)
+        try:
+            result = await executor.run(lambda x: x * 2, 21)
+            assert result == 42
+            assert executor.pending == 0
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exceptions(self):
+        """Exceptions raised in the worker reach the caller."""
+        executor = InferenceExecutor("test", max_workers=1, max_queue=0)
+
+        def fail():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                await executor.run(fail)
+            assert executor.pending == 0
+        finally:
+            executor.shutdown()
+
+    def test_submit_rejects_when_full(self):
+        """Submissions beyond workers + queue are rejected."""
+        executor = InferenceExecutor("slow", max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        try:
+            first = executor.submit(release.wait)
+            second = executor.submit(release.wait)
+
+            with pytest.raises(RateLimitError):
+                executor.submit(release.wait)
+
+            release.set()
+            first.result(timeout=5)
+            second.result(timeout=5)
+            assert executor.pending == 0
+        finally:
+            release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """Blocking inference does not stall other coroutines."""
+        executor = InferenceExecutor("blocking", max_workers=1, max_queue=1)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        try:
+            await asyncio.gather(executor.run(time.sleep, 0.1), ticker())
+            assert len(ticks) == 5
+        finally:
+            executor.shutdown()
+
+    def test_invalid_sizes(self):
+        """Worker and queue bounds are validated."""
+        with pytest.raises(ValueError):
+            InferenceExecutor("bad", max_workers=0, max_queue=1)
+        with pytest.raises(ValueError):
+            InferenceExecutor("bad", max_workers=1, max_queue=-1)
+
+
+class TestExecutorRegistry:
+    """Tests for the per-model executor registry."""
+
+    def setup_method(self):
+        shutdown_executors()
+
+    def teardown_method(self):
+        shutdown_executors()
+
+    def test_executor_per_model_from_settings(self):
+        """Each model gets its own executor sized from settings."""
+        settings = MagicMock(
+            executor_workers={"registration": 3},
+            executor_queue_sizes={"registration": 7}
+        )
+        with patch("app.inference.executors.get_settings", return_value=settings):
+            registration = get_inference_executor("registration")
+            quality = get_inference_executor("quality")
+
+        assert registration is get_inference_executor("registration")
+        assert registration is not quality
+        assert registration.max_workers == 3
+        assert registration.max_queue == 7
+        assert {s["name"] for s in get_executor_stats()} == {"registration", "quality"}
+
+    def test_shutdown_clears_registry(self):
+        """shutdown_executors forgets all executors."""
+        get_inference_executor("aircraft")
+        shutdown_executors()
+        assert get_executor_stats() == []
@@ -217,3 +217,80 @@ class TestInferenceFactory:
                 first_result = classifier_results[0]
                 for result in classifier_results[1:]:
                     assert result is first_result, f"{classifier_type} should return same instance"
+
+
+class TestPreloadModels:
+    """Tests for concurrent preloading."""
+
+    @pytest.fixture(autouse=True)
+    def reset_factory(self):
+        InferenceFactory.reset()
+        yield
+        InferenceFactory.reset()
+
+    @patch("app.inference.factory.INFERENCE_AVAILABLE", True)
+    def test_models_load_concurrently(self):
+        """All models are loading at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def create(name):
+            def load():
+                barrier.wait()
+                return MagicMock(name=name)
+            return load
+
+        with patch.object(InferenceFactory, "_load_classifier", side_effect=lambda name, _: create(name)()), \
+                patch.object(InferenceFactory, "_create_registration_ocr", side_effect=create("ocr")), \
+                patch.object(InferenceFactory, "_create_quality_assessor", side_effect=create("quality")):
+            timings = InferenceFactory.preload_models()
+
+        assert set(timings) == {"aircraft", "airline", "registration", "quality"}
+        assert all(seconds is not None for seconds in timings.values())
+        assert set(InferenceFactory.get_model_states().values()) == {"loaded"}
+        assert set(InferenceFactory.get_load_seconds()) == set(timings)
+
+    @patch("app.inference.factory.INFERENCE_AVAILABLE", True)
+    def test_failure_does_not_block_other_models(self):
+        """A model that fails to load is isolated from the others."""
+        def fail():
+            raise RuntimeError("paddle not installed")
+
+        with patch.object(InferenceFactory, "_load_classifier", return_value=MagicMock()), \
+                patch.object(InferenceFactory, "_create_registration_ocr", side_effect=fail), \
+                patch.object(InferenceFactory, "_create_quality_assessor", return_value=MagicMock()):
+            timings = InferenceFactory.preload_models()
+
+        assert timings["registration"] is None
+        states = InferenceFactory.get_model_states()
+        assert states["registration"] == "failed"
+        assert states["aircraft"] == states["airline"] == states["quality"] == "loaded"
+
+
+class TestLazyInferenceImport:
+    """Tests for the lazy aerovision_inference import."""
+
+    def test_package_detection_tolerates_mocked_module(self):
+        """A module mocked into sys.modules counts as installed."""
+        from app.inference.factory import _inference_package_installed
+
+        with patch.dict("sys.modules", {"aerovision_inference": MagicMock()}):
+            assert _inference_package_installed() is True
+        with patch.dict("sys.modules", {"aerovision_inference": None}):
+            assert _inference_package_installed() is False
+
+    def test_class_imported_on_first_use(self):
+        """Classes are imported from the package when first needed."""
+        from app.inference import factory
+
+        package = MagicMock()
+        with patch.dict("sys.modules", {"aerovision_inference": package}), \
+                patch.object(factory, "QualityAssessor", None):
+            assert factory._inference_class("QualityAssessor") is package.QualityAssessor
+
+    def test_missing_package_raises_factory_error(self):
+        from app.inference import factory
+
+        with patch.dict("sys.modules", {"aerovision_inference": None}), \
+                patch.object(factory, "QualityAssessor", None):
+            with pytest.raises(InferenceFactoryError, match="could not be imported"):
+                factory._inference_class("QualityAssessor")
@@ -0,0 +1,180 @@
+"""
+Unit tests for hot classifier swaps.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import get_settings
+from app.inference.factory import InferenceFactory, InferenceFactoryError
+from app.inference.registry import get_model_registry
+from app.services.aircraft_service import AircraftService
+
+
+@pytest.fixture(autouse=True)
+def factory(tmp_path, monkeypatch):
+    """Factory loading mock classifiers through the registry from a temporary model directory."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "model_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "inference_backend", "torch")
+    monkeypatch.setattr(settings, "warmup_enabled", True)
+    monkeypatch.setattr(settings, "warmup_batch_sizes", [2])
+    monkeypatch.setattr(settings, "classifier_image_size", 32)
+    (tmp_path / "aircraft").mkdir()
+    (tmp_path / "aircraft" / "best.pt").write_bytes(b"weights-v1")
+
+    def load(name, class_name, model_path=None):
+        model_path = model_path or InferenceFactory.resolve_classifier_path(name)
+        return get_model_registry().get(
+            f"{name}_classifier", [model_path], lambda: MagicMock(name=model_path.read_text()), user=name
+        )
+
+    InferenceFactory.reset()
+    with patch("app.inference.factory.INFERENCE_AVAILABLE", True), \
+            patch.object(InferenceFactory, "_load_classifier", side_effect=load) as loader:
+        yield loader
+    InferenceFactory.reset()
+
+
+class TestSwapClassifier:
+    """Tests for InferenceFactory.swap_classifier."""
+
+    def test_swap_replaces_model_and_version(self, tmp_path):
+        old, old_version = InferenceFactory.get_serving_classifier("aircraft")
+        (tmp_path / "aircraft" / "v2.pt").write_bytes(b"weights-v2")
+
+        swap = InferenceFactory.swap_classifier("aircraft", tmp_path / "aircraft" / "v2.pt")
+
+        new, new_version = InferenceFactory.get_serving_classifier("aircraft")
+        assert swap["swapped"] is True
+        assert swap["previous_version"] == old_version
+        assert swap["version"] == new_version != old_version
+        assert new is not old
+        assert new.predict.called, "the new model is warmed up before serving"
+        assert [entry.instance for entry in get_model_registry().entries()] == [new]
+        assert InferenceFactory.get_model_states()["aircraft"] == "ready"
+
+    def test_in_flight_call_keeps_old_model(self, tmp_path):
+        """A caller holding the old model keeps using it; new callers get the new one."""
+        service = AircraftService()
+        held, held_version = service._get_classifier()
+        (tmp_path / "aircraft" / "v2.pt").write_bytes(b"weights-v2")
+
+        InferenceFactory.swap_classifier("aircraft", tmp_path / "aircraft" / "v2.pt")
+
+        held.predict("image")
+        assert held.predict.called
+        current, current_version = service._get_classifier()
+        assert current is not held and current_version != held_version
+
+    def test_replaced_best_pt_is_picked_up(self, tmp_path):
+        """Without a path the configured best.pt is reloaded."""
+        old, _ = InferenceFactory.get_serving_classifier("aircraft")
+        (tmp_path / "aircraft" / "best.pt").write_bytes(b"weights-v2-retrained")
+
+        swap = InferenceFactory.swap_classifier("aircraft")
+
+        assert swap["swapped"] is True
+        assert InferenceFactory.get_serving_classifier("aircraft")[0] is not old
+
+    def test_unchanged_weights_are_not_reloaded(self, factory):
+        InferenceFactory.get_serving_classifier("aircraft")
+        factory.reset_mock()
+
+        swap = InferenceFactory.swap_classifier("aircraft")
+
+        assert swap["swapped"] is False
+        assert swap["version"] == swap["previous_version"]
+        factory.assert_not_called()
+
+    def test_failed_load_keeps_old_model(self, tmp_path, factory):
+        old, old_version = InferenceFactory.get_serving_classifier("aircraft")
+        (tmp_path / "aircraft" / "v2.pt").write_bytes(b"corrupt")
+        factory.side_effect = RuntimeError("invalid load key")
+
+        with pytest.raises(InferenceFactoryError, match="invalid load key"):
+            InferenceFactory.swap_classifier("aircraft", tmp_path / "aircraft" / "v2.pt")
+
+        assert InferenceFactory.get_serving_classifier("aircraft") == (old, old_version)
+
+    def test_failed_warmup_keeps_old_model(self, tmp_path):
+        old, old_version = InferenceFactory.get_serving_classifier("aircraft")
+        (tmp_path / "aircraft" / "v2.pt").write_bytes(b"weights-v2")
+
+        with patch("app.inference.warmup.warm_classifier", side_effect=RuntimeError("CUDA out of memory")):
+            with pytest.raises(InferenceFactoryError, match="CUDA out of memory"):
+                InferenceFactory.swap_classifier("aircraft", tmp_path / "aircraft" / "v2.pt")
+
+        assert InferenceFactory.get_serving_classifier("aircraft") == (old, old_version)
+        assert [entry.instance for entry in get_model_registry().entries()] == [old]
+
+    def test_lazy_load_does_not_overwrite_swap(self, tmp_path, factory):
+        """A first load still running when a swap finishes does not replace the swapped-in model."""
+        loading, release = threading.Event(), threading.Event()
+        load = factory.side_effect
+
+        def slow_first_load(name, class_name, model_path=None):
+            if model_path is None:
+                loading.set()
+                release.wait(5)
+            return load(name, class_name, model_path)
+
+        factory.side_effect = slow_first_load
+        (tmp_path / "aircraft" / "v2.pt").write_bytes(b"weights-v2")
+        first_use = threading.Thread(target=InferenceFactory.get_aircraft_classifier)
+        first_use.start()
+        assert loading.wait(5)
+
+        swap = InferenceFactory.swap_classifier("aircraft", tmp_path / "aircraft" / "v2.pt")
+        release.set()
+        first_use.join(5)
+
+        classifier, version = InferenceFactory.get_serving_classifier("aircraft")
+        assert version == swap["version"]
+        assert [entry.instance for entry in get_model_registry().entries()] == [classifier]
+        assert InferenceFactory.get_model_states()["aircraft"] == "ready"
+
+    def test_missing_weights(self, tmp_path):
+        with pytest.raises(InferenceFactoryError, match="Weights not found"):
+            InferenceFactory.swap_classifier("aircraft", tmp_path / "missing.pt")
+
+    def test_only_classifiers_can_be_swapped(self):
+        with pytest.raises(ValueError):
+            InferenceFactory.swap_classifier("quality")
+
+
+
+class TestEmbeddingModel:
+    """Tests for InferenceFactory.get_embedding_model."""
+
+    def test_serving_classifier_embeds_when_it_can(self):
+        classifier, _ = InferenceFactory.get_serving_classifier("aircraft")
+        assert InferenceFactory.get_embedding_model("aircraft") is classifier
+
+    def test_torch_copy_follows_swap(self, tmp_path, factory):
+        """A backend that cannot embed gets torch classifiers for the serving weights."""
+        factory.side_effect = lambda name, class_name, model_path=None: MagicMock(spec=["predict"])
+        torch_class = MagicMock(side_effect=lambda model_path, device: MagicMock(spec=["model"]))
+        (tmp_path / "aircraft" / "v2.pt").write_bytes(b"weights-v2")
+
+        with patch("app.inference.factory.AircraftClassifier", torch_class):
+            first = InferenceFactory.get_embedding_model("aircraft")
+            InferenceFactory.swap_classifier("aircraft", tmp_path / "aircraft" / "v2.pt")
+            second = InferenceFactory.get_embedding_model("aircraft")
+
+        assert first is not second
+        assert torch_class.call_args.kwargs["model_path"] == str(tmp_path / "aircraft" / "v2.pt")
+        assert [entry.instance.model for entry in get_model_registry().entries()] == [second]
+
+
+async def test_results_report_serving_version(tmp_path, sample_aircraft_result):
+    """Batch results carry the version of the model that produced them."""
+    classifier, version = InferenceFactory.get_serving_classifier("aircraft")
+    classifier.predict.side_effect = lambda images, top_k=None: [sample_aircraft_result] * len(images)
+
+    results = await AircraftService()._classify_batch([MagicMock(), None])
+
+    assert results[0].model_version == version
+    assert results[1] is None
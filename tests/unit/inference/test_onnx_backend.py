@@ -0,0 +1,140 @@
+"""
+Unit tests for the ONNX Runtime classifier backend.
+"""
+
+import importlib.util
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.inference.onnx_backend import OnnxClassifier, _parse_names, export_onnx
+
+PARITY_DEPS = all(importlib.util.find_spec(m) for m in ("onnxruntime", "onnx", "ultralytics", "torch"))
+
+
+def _session(probs, batch_dim="batch", size=32):
+    """Fake ONNX Runtime session returning fixed outputs."""
+    session = MagicMock()
+    model_input = MagicMock()
+    model_input.name = "images"
+    model_input.shape = [batch_dim, 3, size, size]
+    session.get_inputs.return_value = [model_input]
+    session.run.side_effect = lambda _, feeds: [np.tile(probs, (len(feeds["images"]), 1))]
+    return session
+
+
+class TestOnnxClassifier:
+    """Tests for OnnxClassifier with a fake session."""
+
+    def test_single_image_result_layout(self):
+        """Results match the aerovision_inference classifier layout."""
+        classifier = OnnxClassifier(_session(np.array([0.1, 0.7, 0.2])), {0: "A320", 1: "B738", 2: "A321"})
+
+        result = classifier.predict(Image.new("RGB", (64, 48)), top_k=2)
+
+        assert result["top1"] == {"class": "B738", "confidence": pytest.approx(0.7)}
+        assert [p["class"] for p in result["predictions"]] == ["B738", "A321"]
+        assert result["top_k"] == 2
+
+    def test_batch_runs_once_with_dynamic_axis(self):
+        """A dynamic batch axis runs the whole batch in one call."""
+        session = _session(np.array([0.5, 0.5]))
+        classifier = OnnxClassifier(session, {0: "a", 1: "b"})
+
+        results = classifier.predict([Image.new("RGB", (40, 40))] * 3)
+
+        assert len(results) == 3
+        assert session.run.call_count == 1
+        assert session.run.call_args[0][1]["images"].shape == (3, 3, 32, 32)
+
+    def test_static_batch_runs_per_image(self):
+        """A static batch axis of 1 runs one image per call."""
+        session = _session(np.array([0.5, 0.5]), batch_dim=1)
+        classifier = OnnxClassifier(session, {0: "a", 1: "b"})
+
+        classifier.predict([Image.new("RGB", (40, 40))] * 3)
+
+        assert session.run.call_count == 3
+
+    def test_logits_are_softmaxed(self):
+        """Raw logits are converted to probabilities."""
+        classifier = OnnxClassifier(_session(np.array([2.0, 0.0])), {0: "a", 1: "b"})
+
+        result = classifier.predict(Image.new("RGB", (32, 32)))
+
+        confidences = [p["confidence"] for p in result["predictions"]]
+        assert sum(confidences) == pytest.approx(1.0)
+        assert confidences[0] == pytest.approx(1 / (1 + np.exp(-2.0)))
+
+    def test_preprocess_scales_and_center_crops(self):
+        """The shorter side is scaled to the input size and center-cropped."""
+        classifier = OnnxClassifier(_session(np.array([1.0])), {0: "a"})
+        image = Image.new("RGB", (128, 64), color=(255, 0, 0))
+
+        array = classifier.preprocess(image)
+
+        assert array.shape == (3, 32, 32)
+        assert array.dtype == np.float32
+        assert array[0].max() == pytest.approx(1.0)
+        assert array[1].max() == 0.0
+
+    def test_parse_names(self):
+        """Class names are read from ultralytics export metadata."""
+        assert _parse_names({"names": "{0: 'A320', 1: 'B738'}"}) == {0: "A320", 1: "B738"}
+        assert _parse_names({}) == {}
+
+
+class TestExport:
+    """Tests for the ONNX export cache."""
+
+    def test_export_is_cached_by_content(self, tmp_path):
+        """Weights are exported once and reused while unchanged."""
+        weights = tmp_path / "best.pt"
+        weights.write_bytes(b"weights")
+        exported = tmp_path / "best.onnx"
+
+        def export(**kwargs):
+            exported.write_bytes(b"onnx")
+            return str(exported)
+
+        yolo = MagicMock()
+        yolo.return_value.export.side_effect = export
+        with patch.dict("sys.modules", {"ultralytics": MagicMock(YOLO=yolo)}):
+            first = export_onnx(weights, tmp_path / "cache")
+            second = export_onnx(weights, tmp_path / "cache")
+
+        assert first == second
+        assert first.read_bytes() == b"onnx"
+        assert yolo.return_value.export.call_count == 1
+
+
+@pytest.mark.skipif(not PARITY_DEPS, reason="onnxruntime, onnx, ultralytics and torch are required")
+def test_top_k_parity_with_torch(tmp_path, monkeypatch):
+    """The ONNX backend's top-k matches the PyTorch path."""
+    from ultralytics import YOLO
+
+    from app.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "onnx_cache_dir", str(tmp_path / "onnx"))
+
+    weights = tmp_path / "cls.pt"
+    YOLO("yolov8n-cls.yaml").save(str(weights))
+
+    torch_model = YOLO(str(weights))
+    onnx_model = OnnxClassifier.from_weights(weights, device="cpu")
+
+    rng = np.random.default_rng(0)
+    images = [Image.fromarray(rng.integers(0, 255, (96, 128, 3), dtype=np.uint8)) for _ in range(4)]
+
+    class_index = {name: index for index, name in onnx_model.names.items()}
+    onnx_results = onnx_model.predict(images, top_k=5)
+    for image, onnx_result in zip(images, onnx_results):
+        probs = torch_model.predict(image, imgsz=onnx_model.image_size, verbose=False)[0].probs
+        onnx_top5 = [class_index[p["class"]] for p in onnx_result["predictions"]]
+
+        # Compare scores rather than indices so near-ties cannot flip the order
+        assert onnx_result["top1"]["confidence"] == pytest.approx(float(probs.top1conf), abs=1e-3)
+        for index, prediction in zip(onnx_top5, onnx_result["predictions"]):
+            assert prediction["confidence"] == pytest.approx(float(probs.data[index]), abs=1e-3)
@@ -0,0 +1,176 @@
+"""
+Unit tests for INT8 classifier quantization and its guardrails.
+"""
+
+import json
+
+import pytest
+
+from app.core.config import get_settings
+from app.inference.factory import InferenceFactory
+from app.inference.quantization import (
+    QuantizationError,
+    agreement_metrics,
+    check_quantized_artifact,
+    list_images,
+    main,
+    quantized_paths,
+)
+from app.inference.registry import get_model_registry
+
+
+def _result(*classes):
+    """Classifier result with classes in descending confidence."""
+    predictions = [{"class": c, "confidence": 1.0 / (i + 1)} for i, c in enumerate(classes)]
+    return {"top1": predictions[0], "top_k": len(predictions), "predictions": predictions}
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    """Settings with an isolated ONNX cache and quantization enabled."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "onnx_cache_dir", str(tmp_path / "onnx"))
+    monkeypatch.setattr(settings, "inference_backend", "onnx")
+    monkeypatch.setattr(settings, "classifier_quantization", "static")
+    monkeypatch.setattr(settings, "quantization_min_top1_agreement", 0.95)
+    monkeypatch.setattr(settings, "quantization_min_top5_agreement", 0.99)
+    return settings
+
+
+@pytest.fixture
+def weights(tmp_path):
+    """Classifier weights file."""
+    path = tmp_path / "best.pt"
+    path.write_bytes(b"weights")
+    return path
+
+
+def _write_artifact(weights, top1, top5, mode="static"):
+    """Write a quantized model and its report."""
+    model_path, report_path = quantized_paths(weights, mode)
+    model_path.parent.mkdir(parents=True, exist_ok=True)
+    model_path.write_bytes(b"int8-model")
+    report_path.write_text(json.dumps({
+        "model_sha256": get_model_registry().file_digest(model_path),
+        "top1_agreement": top1,
+        "top5_agreement": top5,
+    }))
+    return model_path
+
+
+class TestAgreementMetrics:
+    """Tests for agreement_metrics."""
+
+    def test_top1_and_top5_agreement(self):
+        """The reference top-1 class is the label for both metrics."""
+        reference = [_result("A320", "A321"), _result("B738", "B737"), _result("A359", "A388")]
+        candidate = [_result("A320", "A321"), _result("B737", "B738"), _result("B77W", "B789")]
+
+        metrics = agreement_metrics(reference, candidate)
+
+        assert metrics["total_samples"] == 3
+        assert metrics["top1_agreement"] == pytest.approx(1 / 3)
+        assert metrics["top5_agreement"] == pytest.approx(2 / 3)
+        assert metrics["disagreements_sample"] == {"B738 -> B737": 1, "A359 -> B77W": 1}
+
+    def test_empty(self):
+        """No samples means no agreement, so the artifact cannot pass a floor."""
+        assert agreement_metrics([], [])["top1_agreement"] == 0
+
+
+class TestGuardrails:
+    """Tests for check_quantized_artifact."""
+
+    def test_accepted_artifact(self, settings, weights):
+        """An artifact meeting both floors is returned."""
+        model_path = _write_artifact(weights, 0.97, 1.0)
+
+        assert check_quantized_artifact(weights, "static") == model_path
+
+    def test_missing_artifact(self, settings, weights):
+        """A missing artifact is refused."""
+        with pytest.raises(QuantizationError, match="No static INT8 artifact"):
+            check_quantized_artifact(weights, "static")
+
+    def test_below_floor(self, settings, weights):
+        """An artifact below an agreement floor is refused."""
+        _write_artifact(weights, 0.90, 1.0)
+
+        with pytest.raises(QuantizationError, match="top-1 agreement 0.9000 < 0.95"):
+            check_quantized_artifact(weights, "static")
+
+    def test_artifact_replaced_after_report(self, settings, weights):
+        """A model that no longer matches its report is refused."""
+        model_path = _write_artifact(weights, 1.0, 1.0)
+        model_path.write_bytes(b"another-int8-model")
+
+        with pytest.raises(QuantizationError, match="does not match its report"):
+            check_quantized_artifact(weights, "static")
+
+    def test_artifacts_follow_weights_content(self, settings, weights):
+        """Changed weights do not pick up the old artifact."""
+        _write_artifact(weights, 1.0, 1.0)
+        weights.write_bytes(b"retrained-weights")
+
+        with pytest.raises(QuantizationError):
+            check_quantized_artifact(weights, "static")
+
+
+class TestFactory:
+    """Tests for quantized artifact selection in InferenceFactory."""
+
+    @pytest.fixture(autouse=True)
+    def reset_factory(self):
+        InferenceFactory.reset()
+        yield
+        InferenceFactory.reset()
+
+    def test_accepted_artifact_is_used(self, settings, weights):
+        """An accepted artifact is selected and tagged in the model version."""
+        model_path = _write_artifact(weights, 1.0, 1.0)
+
+        assert InferenceFactory._quantized_artifact("aircraft", weights) == model_path
+
+    def test_refused_artifact_falls_back_to_float(self, settings, weights):
+        """A refused artifact falls back to the float ONNX model."""
+        _write_artifact(weights, 0.5, 0.5)
+
+        assert InferenceFactory._quantized_artifact("aircraft", weights) is None
+
+    def test_torch_backend_ignores_quantization(self, settings, weights, monkeypatch):
+        """Quantization only applies to the ONNX backend."""
+        _write_artifact(weights, 1.0, 1.0)
+        monkeypatch.setattr(settings, "inference_backend", "torch")
+
+        assert InferenceFactory._quantized_artifact("aircraft", weights) is None
+
+    def test_model_version_tags_quantization(self, settings, tmp_path, monkeypatch):
+        """The classifier version changes when a quantized artifact is served."""
+        monkeypatch.setattr(settings, "model_dir", str(tmp_path))
+        weights = tmp_path / "aircraft" / "best.pt"
+        weights.parent.mkdir()
+        weights.write_bytes(b"weights")
+        _write_artifact(weights, 1.0, 1.0)
+
+        assert InferenceFactory.get_model_version("aircraft").endswith(":onnx:int8-static")
+
+
+def test_list_images(tmp_path):
+    """Only image files are listed, in name order, up to the limit."""
+    for name in ("b.jpg", "a.PNG", "c.jpeg", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+
+    assert [p.name for p in list_images(tmp_path)] == ["a.PNG", "b.jpg", "c.jpeg"]
+    assert len(list_images(tmp_path, limit=2)) == 2
+
+
+def test_cli_requires_separate_eval_images(tmp_path, capsys):
+    """Agreement is never measured on the calibration images."""
+    (tmp_path / "a.jpg").write_bytes(b"")
+
+    with pytest.raises(SystemExit):
+        main(["--images", str(tmp_path)])
+    with pytest.raises(SystemExit):
+        main(["--images", str(tmp_path), "--eval-images", str(tmp_path)])
+
+    assert "must not contain calibration images" in capsys.readouterr().err
@@ -0,0 +1,191 @@
+"""
+Unit tests for the model registry.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.inference.registry import ModelRegistry, freeze_model, parameter_bytes, process_memory
+
+
+@pytest.fixture
+def weights(tmp_path):
+    """Two weights files with identical content and one with different content."""
+    a = tmp_path / "aircraft" / "best.pt"
+    b = tmp_path / "aircraft.pt"
+    c = tmp_path / "airline.pt"
+    a.parent.mkdir()
+    a.write_bytes(b"weights-v1")
+    b.write_bytes(b"weights-v1")
+    c.write_bytes(b"weights-v2")
+    return a, b, c
+
+
+class TestModelRegistry:
+    """Tests for ModelRegistry."""
+
+    def test_same_content_shares_instance(self, weights):
+        """Different paths with identical content share one instance."""
+        a, b, _ = weights
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=lambda: object())
+
+        first = registry.get("classifier", [a], loader, device="cpu", user="factory")
+        second = registry.get("classifier", [b], loader, device="cpu", user="history")
+
+        assert first is second
+        assert loader.call_count == 1
+        assert registry.entries()[0].users == {"factory", "history"}
+
+    def test_different_content_or_device_loads_separately(self, weights):
+        """Content and device both distinguish instances."""
+        a, _, c = weights
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=lambda: object())
+
+        registry.get("classifier", [a], loader, device="cpu")
+        registry.get("classifier", [c], loader, device="cpu")
+        registry.get("classifier", [a], loader, device="cuda")
+
+        assert loader.call_count == 3
+
+    def test_kinds_share_same_weights(self, weights):
+        """Aircraft and airline classifiers on the same best.pt and wrapper share one instance."""
+        a, _, _ = weights
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=lambda: object())
+
+        aircraft = registry.get("aircraft_classifier_onnx", [a], loader, device="onnx:cpu", user="aircraft", wrapper="OnnxClassifier")
+        airline = registry.get("airline_classifier_onnx", [a], loader, device="onnx:cpu", user="airline", wrapper="OnnxClassifier")
+
+        assert aircraft is airline
+        assert loader.call_count == 1
+        assert registry.release(aircraft, user="aircraft") is False
+        assert registry.entries()[0].users == {"airline"}
+
+    def test_different_wrappers_load_separately(self, weights):
+        """An airline request is never served the aircraft wrapper around the same weights."""
+        a, _, _ = weights
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=lambda: object())
+
+        aircraft = registry.get("aircraft_classifier", [a], loader, device="cpu", wrapper="AircraftClassifier")
+        airline = registry.get("airline_classifier", [a], loader, device="cpu", wrapper="AirlineClassifier")
+
+        assert aircraft is not airline
+        assert loader.call_count == 2
+        assert {entry.wrapper for entry in registry.entries()} == {"AircraftClassifier", "AirlineClassifier"}
+
+    def test_changed_file_is_rehashed(self, weights):
+        """Rewriting a weights file changes its digest."""
+        a, _, _ = weights
+        registry = ModelRegistry()
+        before = registry.file_digest(a)
+        a.write_bytes(b"weights-v2-longer")
+        assert registry.file_digest(a) != before
+
+    def test_missing_file(self, tmp_path):
+        """Missing files get a placeholder digest instead of raising."""
+        registry = ModelRegistry()
+        assert registry.file_digest(tmp_path / "nope.pt").startswith("missing:")
+
+    def test_concurrent_get_loads_once(self, weights):
+        """Concurrent first requests load the model once."""
+        a, _, _ = weights
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=lambda: object())
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("classifier", [a], loader)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert loader.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_release_drops_unused_entry(self, weights):
+        """An entry is dropped once its last user releases it."""
+        a, b, _ = weights
+        registry = ModelRegistry()
+        instance = registry.get("classifier", [a], object, user="aircraft")
+        registry.get("classifier", [b], object, user="history")
+
+        assert registry.release(instance, user="aircraft") is False
+        assert registry.entries()[0].users == {"history"}
+        assert registry.release(instance, user="history") is True
+        assert registry.entries() == []
+        assert registry.release(instance) is False
+
+    def test_memory_report(self, weights):
+        """The report lists each model with its memory attribution."""
+        a, _, _ = weights
+        registry = ModelRegistry()
+        registry.get("classifier", [a], lambda: bytearray(4 * 1024 * 1024), device="cpu", user="aircraft")
+
+        report = registry.memory_report()
+
+        assert len(report) == 1
+        assert report[0]["kind"] == "classifier"
+        assert report[0]["users"] == ["aircraft"]
+        assert report[0]["rss_bytes"] >= 0
+        assert len(report[0]["digest"]) == 16
+
+
+class TestParameterBytes:
+    """Tests for parameter_bytes."""
+
+    def _tensor(self, numel, size):
+        tensor = MagicMock()
+        tensor.numel.return_value = numel
+        tensor.element_size.return_value = size
+        return tensor
+
+    def test_wrapped_module(self):
+        """Parameters are found on a wrapped model."""
+        module = MagicMock(spec=["parameters", "buffers"])
+        module.parameters.return_value = [self._tensor(10, 4)]
+        module.buffers.return_value = [self._tensor(5, 2)]
+        wrapper = MagicMock(spec=["model"])
+        wrapper.model = module
+
+        assert parameter_bytes(wrapper) == 50
+
+    def test_no_module(self):
+        """Objects without parameters report None."""
+        assert parameter_bytes(object()) is None
+
+
+class TestFreezeModel:
+    """Tests for freeze_model."""
+
+    def test_wrapped_module_is_frozen(self):
+        """The module is put in eval mode and its parameters stop requiring grad."""
+        parameter = MagicMock()
+        module = MagicMock(spec=["parameters", "eval"])
+        module.parameters.return_value = [parameter]
+        wrapper = MagicMock(spec=["model"])
+        wrapper.model = module
+
+        assert freeze_model(wrapper) is True
+        module.eval.assert_called_once()
+        parameter.requires_grad_.assert_called_once_with(False)
+
+    def test_no_module(self):
+        """Objects without parameters are left alone."""
+        assert freeze_model(object()) is False
+
+
+def test_process_memory():
+    """The current process reports its resident memory."""
+    memory = process_memory()
+
+    assert memory["rss_bytes"] > 0
+    if memory["pss_bytes"] is not None:
+        assert memory["pss_bytes"] <= memory["rss_bytes"]
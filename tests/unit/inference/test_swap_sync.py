@@ -0,0 +1,142 @@
+"""
+Unit tests for broadcasting model swaps to all workers.
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.config import get_settings
+from app.inference import swap_sync
+from app.inference.factory import InferenceFactory, InferenceFactoryError
+from app.inference.swap_sync import HEARTBEAT_KEY, REQUEST_KEY, STATUS_KEY, ModelSwapSync
+
+SWAP = {
+    "model": "aircraft",
+    "previous_version": "aircraft:1111111111111111",
+    "version": "aircraft:2222222222222222",
+    "swapped": True,
+    "load_seconds": 1.5,
+    "warmup_seconds": 0.5,
+}
+
+
+class FakeRedis:
+    """The string and hash commands the swap sync uses, in memory."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+
+    async def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hdel(self, key, field):
+        self.data.get(key, {}).pop(field, None)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "redis_enabled", True)
+    monkeypatch.setattr(settings, "model_swap_poll_seconds", 1.0)
+    monkeypatch.setattr(settings, "model_swap_timeout_seconds", 0.05)
+    fake = FakeRedis()
+    with patch.object(swap_sync.get_stats_manager(), "get_async_redis", AsyncMock(return_value=fake)):
+        yield fake
+
+
+class TestBroadcast:
+    """Tests for publishing a swap and collecting worker reports."""
+
+    async def test_publishes_request_and_reports_local_worker(self, redis, tmp_path):
+        sync = ModelSwapSync()
+
+        workers, complete = await sync.broadcast("aircraft", tmp_path / "v2.pt", SWAP)
+
+        request = json.loads(redis.data[REQUEST_KEY.format(name="aircraft")])
+        assert request["weights_path"] == str(tmp_path / "v2.pt")
+        assert complete is True
+        assert [(w["worker"], w["status"]) for w in workers] == [(swap_sync.worker_id(), "swapped")]
+
+    async def test_live_worker_without_report_is_pending(self, redis):
+        redis.data[HEARTBEAT_KEY] = {"other:1": str(time.time()), "gone:2": str(time.time() - 3600)}
+
+        workers, complete = await ModelSwapSync().broadcast("aircraft", None, SWAP)
+
+        assert complete is False
+        assert {w["worker"]: w["status"] for w in workers} == {swap_sync.worker_id(): "swapped", "other:1": "pending"}
+
+    async def test_without_redis_only_this_worker_is_reported(self, redis, monkeypatch):
+        monkeypatch.setattr(get_settings(), "redis_enabled", False)
+
+        workers, complete = await ModelSwapSync().broadcast("aircraft", None, SWAP)
+
+        assert complete is True
+        assert len(workers) == 1
+        assert redis.data == {}
+
+    async def test_redis_failure_reports_incomplete(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "redis_enabled", True)
+        down = AsyncMock(side_effect=ConnectionError("down"))
+        with patch.object(swap_sync.get_stats_manager(), "get_async_redis", down):
+            workers, complete = await ModelSwapSync().broadcast("aircraft", None, SWAP)
+
+        assert complete is False
+        assert [w["status"] for w in workers] == ["swapped"]
+
+
+class TestPoll:
+    """Tests for applying swaps published by other workers."""
+
+    async def test_applies_published_swap_once(self, redis, tmp_path):
+        redis.data[REQUEST_KEY.format(name="aircraft")] = json.dumps(
+            {"request_id": "r1", "weights_path": str(tmp_path / "v2.pt")}
+        )
+        sync = ModelSwapSync()
+
+        with patch.object(InferenceFactory, "swap_classifier", return_value=SWAP) as swap:
+            await sync.poll()
+            await sync.poll()
+
+        swap.assert_called_once_with("aircraft", tmp_path / "v2.pt")
+        status = json.loads(redis.data[STATUS_KEY.format(name="aircraft")][swap_sync.worker_id()])
+        assert (status["request_id"], status["status"], status["version"]) == ("r1", "swapped", SWAP["version"])
+        assert swap_sync.worker_id() in redis.data[HEARTBEAT_KEY]
+
+    async def test_failed_swap_is_reported(self, redis):
+        redis.data[REQUEST_KEY.format(name="airline")] = json.dumps({"request_id": "r1", "weights_path": None})
+
+        with patch.object(InferenceFactory, "swap_classifier", side_effect=InferenceFactoryError("bad weights")):
+            await ModelSwapSync().poll()
+
+        status = json.loads(redis.data[STATUS_KEY.format(name="airline")][swap_sync.worker_id()])
+        assert (status["status"], status["error"]) == ("failed", "bad weights")
+
+    async def test_own_broadcast_is_not_reapplied(self, redis):
+        sync = ModelSwapSync()
+        await sync.broadcast("aircraft", None, SWAP)
+
+        with patch.object(InferenceFactory, "swap_classifier") as swap:
+            await sync.poll()
+
+        swap.assert_not_called()
+
+    async def test_stop_drops_heartbeat(self, redis):
+        sync = ModelSwapSync()
+        sync.start(interval=0.01)
+        await sync.poll()
+
+        await sync.stop()
+
+        assert swap_sync.worker_id() not in redis.data[HEARTBEAT_KEY]
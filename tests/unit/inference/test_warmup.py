@@ -0,0 +1,118 @@
+"""
+Unit tests for model warm-up and lifecycle states.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import get_settings
+from app.inference.factory import InferenceFactory
+from app.inference import warmup
+from app.inference.warmup import get_warmup_batch_sizes, synthetic_image, warm_up_model, warm_up_models
+
+
+@pytest.fixture(autouse=True)
+def reset_factory():
+    InferenceFactory.reset()
+    yield
+    InferenceFactory.reset()
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "warmup_enabled", True)
+    monkeypatch.setattr(settings, "warmup_batch_sizes", None)
+    monkeypatch.setattr(settings, "micro_batch_max_size", 8)
+    monkeypatch.setattr(settings, "classifier_image_size", 48)
+    return settings
+
+
+class TestModelStates:
+    """Tests for factory lifecycle states."""
+
+    def test_initial_states(self):
+        """Models start out not loaded."""
+        assert set(InferenceFactory.get_model_states().values()) == {"not_loaded"}
+
+    def test_load_success_and_failure(self):
+        """Loads move through loading to loaded, or to failed."""
+        assert InferenceFactory._load_tracked("quality", lambda: "assessor") == "assessor"
+        assert InferenceFactory.get_model_states()["quality"] == "loaded"
+
+        def fail():
+            raise RuntimeError("no weights")
+
+        with pytest.raises(RuntimeError):
+            InferenceFactory._load_tracked("aircraft", fail)
+        assert InferenceFactory.get_model_states()["aircraft"] == "failed"
+
+    def test_unknown_state(self):
+        with pytest.raises(ValueError):
+            InferenceFactory.set_model_state("quality", "sleeping")
+
+
+class TestWarmup:
+    """Tests for warm_up_model and warm_up_models."""
+
+    def test_batch_sizes_default_to_micro_batch_size(self, settings, monkeypatch):
+        assert get_warmup_batch_sizes() == [1, 8]
+        monkeypatch.setattr(settings, "warmup_batch_sizes", [4, 0, 2, 4])
+        assert get_warmup_batch_sizes() == [2, 4]
+
+    def test_synthetic_image(self, settings):
+        image = synthetic_image()
+        assert image.size == (64, 48)
+        assert image.tobytes() == synthetic_image().tobytes()
+
+    def test_classifier_runs_each_batch_size(self, settings):
+        """The classifier runs on one image and on every configured batch size."""
+        classifier = MagicMock()
+        InferenceFactory.set_model_state("aircraft", "loaded")
+
+        with patch.object(InferenceFactory, "get_aircraft_classifier", return_value=classifier):
+            seconds = warm_up_model("aircraft")
+
+        assert seconds is not None
+        assert InferenceFactory.get_model_states()["aircraft"] == "ready"
+        batches = [c.args[0] for c in classifier.predict.call_args_list]
+        assert [1 if not isinstance(b, list) else len(b) for b in batches] == [1, 1, 8]
+
+    def test_failed_warmup_still_ready(self, settings):
+        """A model whose warm-up raises is loaded, so it is still marked ready."""
+        InferenceFactory.set_model_state("quality", "loaded")
+        assessor = MagicMock()
+        assessor.assess.side_effect = RuntimeError("boom")
+
+        with patch.object(InferenceFactory, "get_quality_assessor", return_value=assessor):
+            warm_up_model("quality")
+
+        assert InferenceFactory.get_model_states()["quality"] == "ready"
+
+    def test_only_loaded_models_are_warmed(self, settings):
+        """Models that are not loaded or failed are left alone."""
+        InferenceFactory.set_model_state("airline", "failed")
+        InferenceFactory.set_model_state("quality", "loaded")
+        warmer = MagicMock()
+
+        with patch.dict(warmup._WARMERS, {"quality": warmer, "airline": warmer}):
+            timings = warm_up_models()
+
+        assert list(timings) == ["quality"]
+        assert warmer.call_count == 1
+        states = InferenceFactory.get_model_states()
+        assert states["airline"] == "failed"
+        assert states["aircraft"] == "not_loaded"
+
+    def test_disabled(self, settings, monkeypatch):
+        """With warm-up disabled, loaded models become ready directly."""
+        monkeypatch.setattr(settings, "warmup_enabled", False)
+        InferenceFactory.set_model_state("quality", "loaded")
+        warmer = MagicMock()
+
+        with patch.dict(warmup._WARMERS, {"quality": warmer}):
+            assert warm_up_model("quality") is None
+
+        warmer.assert_not_called()
+        assert InferenceFactory.get_model_states()["quality"] == "ready"
@@ -7,7 +7,7 @@ from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageFile
 
 from app.core.exceptions import ImageLoadError
 from app.services.base import BaseService
@@ -107,3 +107,114 @@ class TestBaseService:
 
         with pytest.raises(ImageLoadError, match="Failed to load image from URL"):
             BaseService.load_image("https://example.com/test.jpg")
+
+    @pytest.mark.asyncio
+    async def test_load_image_async_from_url_uses_fetcher(self):
+        """Test async URL loading goes through the shared image fetcher."""
+        from unittest.mock import AsyncMock
+
+        img = Image.new("RGB", (40, 30), color="green")
+        buffer = BytesIO()
+        img.save(buffer, format="PNG")
+        fetcher = MagicMock()
+        fetcher.fetch = AsyncMock(return_value=buffer.getvalue())
+
+        with patch("app.services.base.get_image_fetcher", return_value=fetcher):
+            result = await BaseService.load_image_async("https://example.com/test.png")
+
+        assert result.size == (40, 30)
+        fetcher.fetch.assert_awaited_once_with("https://example.com/test.png")
+
+    @pytest.mark.asyncio
+    async def test_load_images_async_reports_errors_in_order(self):
+        """Test batch loading keeps input order and reports per-item errors."""
+        img = Image.new("RGB", (10, 10), color="red")
+        buffer = BytesIO()
+        img.save(buffer, format="PNG")
+        img_b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+        results = await BaseService.load_images_async(
+            [img_b64, "not-a-valid-base64!!!", img_b64],
+            concurrency=2
+        )
+
+        assert [image is not None for image, _ in results] == [True, False, True]
+        assert results[1][1] is not None
+
+    def test_load_image_from_raw_bytes(self):
+        """Test loading image from raw uploaded bytes."""
+        img = Image.new("RGB", (20, 10), color="blue")
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG")
+
+        result = BaseService.load_image(buffer.getvalue())
+
+        assert isinstance(result, Image.Image)
+        assert result.size == (20, 10)
+
+    def test_large_jpeg_decoded_at_reduced_scale(self):
+        """Large JPEGs are decoded at the smallest DCT scale covering the model input."""
+        img = Image.new("RGB", (4000, 3000), color="red")
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG")
+
+        settings = MagicMock(
+            max_image_size_mb=20,
+            max_image_pixels=100_000_000,
+            decode_reduced_enabled=True,
+            decode_min_size=640
+        )
+        with patch("app.services.base.get_settings", return_value=settings):
+            result = BaseService.load_image(buffer.getvalue())
+
+        assert result.size == (1000, 750)
+        assert min(result.size) >= 640
+
+    def test_oversized_payload_rejected(self):
+        """Payloads above max_image_size_mb are rejected before decoding."""
+        settings = MagicMock(max_image_size_mb=1)
+        with patch("app.services.base.get_settings", return_value=settings):
+            with pytest.raises(ImageLoadError, match="too large"):
+                BaseService.load_image(b"\xff" * (2 * 1024 * 1024))
+
+    def test_pixel_budget_enforced_before_decode(self):
+        """Images above max_image_pixels are rejected from the header."""
+        img = Image.new("RGB", (300, 300))
+        buffer = BytesIO()
+        img.save(buffer, format="PNG")
+
+        settings = MagicMock(max_image_size_mb=20, max_image_pixels=50_000)
+        with patch("app.services.base.get_settings", return_value=settings):
+            with patch.object(ImageFile.ImageFile, "load") as mock_load:
+                with pytest.raises(ImageLoadError, match="pixels"):
+                    BaseService.load_image(buffer.getvalue())
+                mock_load.assert_not_called()
+
+    async def test_iter_batch_yields_in_completion_order(self):
+        """Items are yielded as they finish, with per-item errors."""
+        import asyncio
+
+        result = MagicMock()
+        result.model_dump.return_value = {"ok": True}
+        delays = {"slow": 0.05, "fast": 0.0}
+
+        async def process(image_input):
+            if image_input == "broken":
+                raise ImageLoadError("cannot decode")
+            if image_input == "crash":
+                raise RuntimeError("boom")
+            await asyncio.sleep(delays[image_input])
+            return result
+
+        items = [
+            item async for item in BaseService.iter_batch(
+                ["slow", "fast", "broken", "crash"], process, "Inference failed"
+            )
+        ]
+
+        assert items[-1]["index"] == 0
+        assert {item["index"] for item in items} == {0, 1, 2, 3}
+        by_index = {item["index"]: item for item in items}
+        assert by_index[1] == {"index": 1, "success": True, "data": {"ok": True}, "error": None}
+        assert by_index[2]["error"] == "cannot decode"
+        assert by_index[3]["error"] == "Inference failed"
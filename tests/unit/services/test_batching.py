@@ -0,0 +1,150 @@
+"""
+Unit tests for the micro-batching scheduler.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.core.exceptions import InferenceError
+from app.services.aircraft_service import AircraftService
+from app.services.batching import MicroBatcher
+
+
+def _make_images(count: int) -> list[Image.Image]:
+    """Create distinguishable test images."""
+    return [Image.new("RGB", (32, 32), color=(i, i, i)) for i in range(count)]
+
+
+class TestMicroBatcher:
+    """Tests for MicroBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_are_merged(self):
+        """Concurrent requests are dispatched as one batch."""
+        calls = []
+
+        async def batch_fn(images, params):
+            calls.append(list(images))
+            return [img.getpixel((0, 0))[0] for img in images]
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=20)
+        images = _make_images(5)
+
+        results = await asyncio.gather(*[batcher.submit(img) for img in images])
+
+        assert len(calls) == 1
+        assert len(calls[0]) == 5
+        assert results == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_splits_batches(self):
+        """Groups are flushed as soon as they reach max_batch_size."""
+        batch_sizes = []
+
+        async def batch_fn(images, params):
+            batch_sizes.append(len(images))
+            return [None] * len(images)
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait_ms=50)
+        await asyncio.gather(*[batcher.submit(img) for img in _make_images(5)])
+
+        assert sorted(batch_sizes) == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_requests_grouped_by_params(self):
+        """Requests with different parameters never share a batch."""
+        seen = []
+
+        async def batch_fn(images, params):
+            seen.append((params, len(images)))
+            return [params] * len(images)
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=10)
+        images = _make_images(4)
+
+        results = await asyncio.gather(
+            batcher.submit(images[0], 1),
+            batcher.submit(images[1], 5),
+            batcher.submit(images[2], 1),
+            batcher.submit(images[3], 5),
+        )
+
+        assert results == [1, 5, 1, 5]
+        assert sorted(seen) == [(1, 2), (5, 2)]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_all_callers(self):
+        """An exception in the batch function reaches every waiting caller."""
+        async def batch_fn(images, params):
+            raise RuntimeError("model crashed")
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait_ms=5)
+        results = await asyncio.gather(
+            *[batcher.submit(img) for img in _make_images(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_invalid_batch_size(self):
+        """max_batch_size must be positive."""
+        async def batch_fn(images, params):
+            return []
+
+        with pytest.raises(ValueError):
+            MicroBatcher(batch_fn, max_batch_size=0)
+
+
+class TestClassificationServiceMicroBatching:
+    """Tests for micro-batched single-image classification."""
+
+    @pytest.mark.asyncio
+    async def test_single_requests_share_one_predict_call(self, sample_aircraft_result):
+        """Concurrent single-image classifications become one predict(list) call."""
+        classifier = MagicMock()
+        classifier.predict.side_effect = lambda images, top_k=None: [sample_aircraft_result] * len(images)
+
+        service = AircraftService()
+        service._classifier = classifier
+
+        results = await asyncio.gather(
+            *[service._classify_image_async(img, top_k=5) for img in _make_images(4)]
+        )
+
+        assert classifier.predict.call_count == 1
+        batch_arg = classifier.predict.call_args[0][0]
+        assert isinstance(batch_arg, list) and len(batch_arg) == 4
+        for result, timing in results:
+            assert result.top1.class_ == "A320"
+            assert timing >= 0
+
+    @pytest.mark.asyncio
+    async def test_missing_result_raises_inference_error(self):
+        """A None result for an image surfaces as InferenceError."""
+        classifier = MagicMock()
+        classifier.predict.side_effect = lambda images, top_k=None: [None] * len(images)
+
+        service = AircraftService()
+        service._classifier = classifier
+
+        with pytest.raises(InferenceError):
+            await service._classify_image_async(_make_images(1)[0])
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled_uses_single_predict(self, sample_aircraft_result):
+        """With micro-batching disabled each image is classified on its own."""
+        classifier = MagicMock()
+        classifier.predict.return_value = sample_aircraft_result
+
+        service = AircraftService()
+        service._classifier = classifier
+
+        with patch("app.services._classifier_base.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(micro_batch_enabled=False)
+            result, _ = await service._classify_image_async(_make_images(1)[0], top_k=3)
+
+        assert result.top1.class_ == "A320"
+        assert isinstance(classifier.predict.call_args[0][0], Image.Image)
@@ -0,0 +1,160 @@
+"""
+Unit tests for adaptive chunking of batch classification.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.inference.executors import InferenceExecutor
+from app.services.aircraft_service import AircraftService
+from app.services.chunking import AdaptiveChunker
+
+KB = 1024
+
+
+def _chunker(budget_kb: int = 64, max_chunk_size: int = 16, target_chunk_ms: float = 100.0) -> AdaptiveChunker:
+    return AdaptiveChunker(
+        "aircraft",
+        memory_budget_bytes=budget_kb * KB,
+        image_overhead_bytes=KB,
+        target_chunk_ms=target_chunk_ms,
+        max_chunk_size=max_chunk_size
+    )
+
+
+def _image(side: int, shade: int = 0) -> Image.Image:
+    return Image.new("RGB", (side, side), color=(shade, shade, shade))
+
+
+class TestAdaptiveChunker:
+    """Tests for AdaptiveChunker."""
+
+    def test_memory_budget_limits_large_images(self):
+        """Large images get small chunks, small images large ones."""
+        chunker = _chunker(budget_kb=64)
+        large = [_image(96)] * 4  # 27 KB of pixels + 1 KB overhead each
+        small = [_image(8)] * 20
+
+        assert chunker.next_chunk_size(large) == 2
+        assert chunker.next_chunk_size(small) == 16
+
+    def test_oversized_image_still_chunked(self):
+        assert _chunker(budget_kb=1).next_chunk_size([_image(256)] * 3) == 1
+
+    def test_workers_share_the_budget(self):
+        chunker = _chunker(budget_kb=64)
+        images = [_image(64)] * 8  # 12 KB + 1 KB each
+
+        assert chunker.next_chunk_size(images) == 4
+        assert chunker.next_chunk_size(images, workers=2) == 2
+
+    def test_chunk_starts_at_position(self):
+        images = [_image(8)] * 5
+        assert _chunker().next_chunk_size(images, start=3) == 2
+
+    def test_latency_limits_chunk_size(self):
+        """Chunks shrink when images are slow and grow back when they are fast."""
+        chunker = _chunker(budget_kb=1024, target_chunk_ms=100.0)
+        images = [_image(8)] * 20
+
+        chunker.observe(4, 0.1)  # 25 ms per image
+        assert chunker.per_image_ms == pytest.approx(25.0)
+        assert chunker.next_chunk_size(images) == 4
+
+        for _ in range(20):
+            chunker.observe(10, 0.01)
+        assert chunker.next_chunk_size(images) == 16
+
+    def test_invalid_max_chunk_size(self):
+        with pytest.raises(ValueError):
+            _chunker(max_chunk_size=0)
+
+
+class TestChunkedBatchClassification:
+    """Tests for chunked ClassificationServiceBase._classify_batch."""
+
+    @pytest.fixture
+    def service(self):
+        classifier = MagicMock()
+        classifier.predict.side_effect = lambda images, top_k=None: [
+            {"top1": {"class": str(image.getpixel((0, 0))[0]), "confidence": 0.9}, "top_k": 1,
+             "predictions": [{"class": str(image.getpixel((0, 0))[0]), "confidence": 0.9}]}
+            for image in images
+        ]
+        service = AircraftService()
+        service._classifier = classifier
+        return service
+
+    async def test_chunks_keep_input_order(self, service):
+        images = [_image(64, shade=i) for i in range(7)]
+        images[2] = None
+
+        with patch("app.services._classifier_base.get_adaptive_chunker", return_value=_chunker(budget_kb=30)):
+            results = await service._classify_batch(images)
+
+        chunk_sizes = [len(c.args[0]) for c in service._classifier.predict.call_args_list]
+        assert chunk_sizes == [2, 2, 2]
+        assert results[2] is None
+        assert [r.top1.class_ for r in results if r is not None] == ["0", "1", "3", "4", "5", "6"]
+
+    @staticmethod
+    def _block_predict(service):
+        """Make predict block until released; returns (started, release) events."""
+        started = threading.Event()
+        release = threading.Event()
+        predict = service._classifier.predict.side_effect
+
+        def blocking_predict(images, top_k=None):
+            started.set()
+            release.wait(5)
+            return predict(images, top_k)
+
+        service._classifier.predict.side_effect = blocking_predict
+        return started, release
+
+    @pytest.mark.parametrize("workers, queue, in_flight", [(1, 8, 2), (2, 8, 3), (1, 0, 1)])
+    async def test_one_chunk_queued_ahead_of_workers(self, service, workers, queue, in_flight):
+        """One chunk waits in the executor queue, so a single worker never idles between chunks."""
+        started, release = self._block_predict(service)
+        executor = InferenceExecutor("aircraft", max_workers=workers, max_queue=queue)
+
+        with patch("app.services._classifier_base.get_adaptive_chunker", return_value=_chunker(budget_kb=30)), \
+                patch("app.services._classifier_base.get_inference_executor", return_value=executor):
+            task = asyncio.create_task(service._classify_batch([_image(64)] * 6))
+            await asyncio.to_thread(started.wait, 5)
+            await asyncio.sleep(0.05)
+            assert executor.pending == in_flight
+            release.set()
+            results = await task
+
+        assert len(results) == 6 and all(r is not None for r in results)
+        executor.shutdown()
+
+    async def test_busy_executor_is_not_overrun(self, service):
+        """A batch only uses the executor's free capacity instead of failing partway."""
+        started, release = self._block_predict(service)
+        executor = InferenceExecutor("aircraft", max_workers=2, max_queue=0)
+        other = executor.submit(release.wait, 5)
+
+        with patch("app.services._classifier_base.get_adaptive_chunker", return_value=_chunker(budget_kb=30)), \
+                patch("app.services._classifier_base.get_inference_executor", return_value=executor):
+            task = asyncio.create_task(service._classify_batch([_image(64)] * 6))
+            await asyncio.to_thread(started.wait, 5)
+            assert executor.pending == 2
+            release.set()
+            results = await task
+
+        other.result(5)
+        assert all(r is not None for r in results)
+        executor.shutdown()
+
+    async def test_failed_chunk_raises(self, service):
+        service._classifier.predict.side_effect = RuntimeError("out of memory")
+
+        with patch("app.services._classifier_base.get_adaptive_chunker", return_value=_chunker(budget_kb=30)):
+            with pytest.raises(RuntimeError, match="out of memory"):
+                await service._classify_batch([_image(64)] * 6)
@@ -133,16 +133,58 @@ class TestHistoryService:
 
         from app.services.history_service import HistoryService
 
-        # Setup mock factory
-        mock_factory.get_model_predictor.return_value = mock_enhanced_predictor
+        embedding_models = {"aircraft": MagicMock(), "airline": MagicMock()}
+        mock_factory.get_embedding_model.side_effect = embedding_models.get
 
         service = HistoryService()
         result = service._get_model_predictor()
 
-        assert result is not None
-        # Note: The service doesn't use InferenceFactory, it uses aerovision_inference directly
-        # So we check the predictor was created correctly instead
-        mock_aerovision_inference.ModelPredictor.assert_called()
+        assert result is mock_enhanced_predictor
+        # The predictor is created without classifiers of its own
+        mock_aerovision_inference.ModelPredictor.assert_called_once_with({})
+        # Embeddings come from the factory's models, not from copies loaded for history
+        assert result.predictor.aircraft_model is embedding_models["aircraft"]
+        assert result.predictor.airline_model is embedding_models["airline"]
+
+    def test_push_with_onnx_backed_factory(self, tmp_path, monkeypatch, mock_vector_db, sample_historical_records):
+        """On ONNX Runtime, history embeds with torch classifiers for the serving weights."""
+        from app.core.config import get_settings
+        from app.inference import factory
+        from app.inference.factory import InferenceFactory
+        from app.services.history_service import HistoryService
+
+        settings = get_settings()
+        monkeypatch.setattr(settings, "model_dir", str(tmp_path))
+        monkeypatch.setattr(settings, "inference_backend", "onnx")
+        (tmp_path / "best.pt").write_bytes(b"weights")
+
+        def torch_classifier(model_path, device):
+            classifier = MagicMock(spec=["predict", "model"])
+            classifier.model.embed.side_effect = lambda source, **kwargs: [np.ones(4) for _ in source]
+            return classifier
+
+        enhanced = MagicMock(spec=["vector_db", "predictor"])
+        enhanced.vector_db = mock_vector_db
+        enhanced.predictor = None
+        mock_aerovision_inference.ModelPredictor = MagicMock(return_value=enhanced)
+        image = Image.new("RGB", (64, 64))
+
+        InferenceFactory.reset()
+        try:
+            with patch.object(factory, "INFERENCE_AVAILABLE", True), \
+                    patch("app.inference.onnx_backend.OnnxClassifier.from_weights",
+                          side_effect=lambda *args, **kwargs: MagicMock(spec=["predict"])), \
+                    patch.object(factory, "AircraftClassifier", MagicMock(side_effect=torch_classifier)), \
+                    patch.object(factory, "AirlineClassifier", MagicMock(side_effect=torch_classifier)), \
+                    patch("app.services.base.BaseService.load_image", return_value=image):
+                result = HistoryService().push_records(sample_historical_records)
+        finally:
+            InferenceFactory.reset()
+
+        assert result["success"] is True
+        assert result["added"] == 2
+        assert all(r["error"] is None for r in result["results"])
+        assert enhanced.predictor.device == settings.device
 
     @patch('app.services.history_service.HistoryService._get_model_predictor')
     @patch('app.services.base.BaseService.load_image')
@@ -242,3 +284,113 @@ class TestHistoryService:
 
         assert stats["available"] is False
         assert stats["message"] == "向量数据库功能未启用"
+
+
+class TestBatchedPush:
+    """Tests for batched embedding and bulk writes on push."""
+
+    @pytest.fixture
+    def loaded_service(self, mock_enhanced_predictor, test_image_bytes):
+        from app.services.history_service import HistoryService
+
+        test_image = Image.open(BytesIO(test_image_bytes)).convert("RGB")
+        service = HistoryService()
+        with patch.object(HistoryService, '_get_model_predictor', return_value=mock_enhanced_predictor), \
+                patch('app.services.base.BaseService.load_image', return_value=test_image):
+            yield service
+
+    def test_embeds_once_per_batch(self, loaded_service, mock_enhanced_predictor, sample_historical_records):
+        """Both models embed a whole batch in one call and write it in bulk."""
+        predictor = mock_enhanced_predictor.predictor
+        predictor.aircraft_model.embed.return_value = [np.random.rand(512) for _ in range(2)]
+        predictor.airline_model.embed.return_value = [np.random.rand(512) for _ in range(2)]
+        mock_enhanced_predictor.vector_db.add_records.return_value = [True, True]
+
+        result = loaded_service.push_records(sample_historical_records)
+
+        assert result["added"] == 2
+        assert predictor.aircraft_model.embed.call_count == 1
+        assert predictor.airline_model.embed.call_count == 1
+        mock_enhanced_predictor.vector_db.add_records.assert_called_once()
+        mock_enhanced_predictor.vector_db.add_record.assert_not_called()
+
+    def test_falls_back_to_per_image_embed(self, loaded_service, mock_enhanced_predictor, sample_historical_records):
+        """A model that returns one embedding for a batch is called per image."""
+        predictor = mock_enhanced_predictor.predictor
+
+        result = loaded_service.push_records(sample_historical_records)
+
+        assert result["added"] == 2
+        # One batched attempt, then one call per image
+        assert predictor.aircraft_model.embed.call_count == 3
+
+    def test_per_record_results(self, loaded_service, mock_enhanced_predictor, sample_historical_records):
+        """Write failures and missing images are reported per record."""
+        del mock_enhanced_predictor.vector_db.add_records
+        mock_enhanced_predictor.vector_db.add_record.side_effect = [True, False]
+        records = sample_historical_records + [{"id": "record_003", "aircraft_type": "A321"}]
+
+        result = loaded_service.push_records(records)
+
+        assert result["added"] == 1
+        assert result["failed"] == 2
+        assert [r["success"] for r in result["results"]] == [True, False, False]
+        assert result["results"][2]["id"] == "record_003"
+        assert result["results"][2]["error"] == "缺少图片数据"
+
+    async def test_push_records_async(self, loaded_service, sample_historical_records):
+        """The async path loads and embeds without blocking the loop."""
+        result = await loaded_service.push_records_async(sample_historical_records)
+
+        assert result["total"] == 2
+        assert result["added"] == 2
+        assert [r["id"] for r in result["results"]] == ["record_001", "record_002"]
+
+    def test_bulk_write_returning_none_is_success(self, loaded_service, mock_enhanced_predictor, sample_historical_records):
+        """A store whose add_records returns None wrote every record."""
+        mock_enhanced_predictor.vector_db.add_records.return_value = None
+
+        result = loaded_service.push_records(sample_historical_records)
+
+        assert result["added"] == 2
+        mock_enhanced_predictor.vector_db.add_record.assert_not_called()
+
+    def test_partial_bulk_write_is_reported_per_record(self, loaded_service, mock_enhanced_predictor, sample_historical_records):
+        """A bulk write reporting only a short count is redone record by record."""
+        mock_enhanced_predictor.vector_db.add_records.return_value = 1
+        mock_enhanced_predictor.vector_db.add_record.side_effect = [None, False]
+
+        result = loaded_service.push_records(sample_historical_records)
+
+        assert [r["success"] for r in result["results"]] == [True, False]
+        assert result["results"][1]["error"] == "写入向量数据库失败"
+
+    def test_images_are_loaded_per_batch(self, loaded_service, mock_enhanced_predictor, sample_historical_records, monkeypatch):
+        """Each batch's images are loaded only after the previous batch is written."""
+        from app.core import get_settings
+
+        monkeypatch.setattr(get_settings(), "history_batch_size", 1)
+        events = []
+        mock_enhanced_predictor.vector_db.add_records.side_effect = lambda batch: events.append(("write", len(batch)))
+        with patch('app.services.base.BaseService.load_image', side_effect=lambda _: events.append(("load", 1)) or Image.new("RGB", (8, 8))):
+            result = loaded_service.push_records(sample_historical_records)
+
+        assert result["added"] == 2
+        assert events == [("load", 1), ("write", 1), ("load", 1), ("write", 1)]
+
+    async def test_push_records_async_loads_predictor_off_loop(self, loaded_service, mock_enhanced_predictor, sample_historical_records):
+        """The predictor, which may load weights, is fetched on a worker thread."""
+        import threading
+        from app.services.history_service import HistoryService
+
+        threads = []
+
+        def get_predictor(self):
+            threads.append(threading.get_ident())
+            return mock_enhanced_predictor
+
+        with patch.object(HistoryService, '_get_model_predictor', get_predictor):
+            result = await loaded_service.push_records_async(sample_historical_records)
+
+        assert result["added"] == 2
+        assert threads and threading.get_ident() not in threads
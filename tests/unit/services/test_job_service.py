@@ -0,0 +1,175 @@
+"""
+Unit tests for batch review jobs.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.job_queue import MemoryJobQueue, set_job_queue
+from app.services.job_service import JobWorker
+
+
+def _review_results(images, **params):
+    """Fake review_batch: fails images named "bad"."""
+    return [
+        {
+            "index": i,
+            "success": image != "bad",
+            "data": None,
+            "error": "Review failed: bad image" if image == "bad" else None,
+        }
+        for i, image in enumerate(images)
+    ]
+
+
+@pytest.fixture
+def queue():
+    """In-memory job queue with small chunks."""
+    queue = MemoryJobQueue(chunk_size=3)
+    set_job_queue(queue)
+    yield queue
+    set_job_queue(None)
+
+
+@pytest.fixture
+def review_service():
+    """Review service stub."""
+    service = MagicMock()
+    service.review_batch = AsyncMock(side_effect=_review_results)
+    return service
+
+
+async def _drain(queue, worker):
+    """Process queued chunks until none are left."""
+    while (chunk := await queue.next_chunk(timeout=0.01)) is not None:
+        await worker.process_chunk(chunk)
+
+
+class TestJobQueueAndWorker:
+    """Tests for the in-memory queue and the chunk worker."""
+
+    async def test_job_is_split_into_chunks(self, queue):
+        """Images are queued in chunks of chunk_size."""
+        job = await queue.create_job("review", [f"img{i}" for i in range(7)], {})
+
+        assert job["status"] == "queued"
+        assert job["chunks"] == 3
+
+        chunk = await queue.next_chunk(timeout=0.01)
+        assert chunk.images == ["img0", "img1", "img2"]
+        assert (await queue.get_job(job["job_id"]))["status"] == "running"
+
+    async def test_worker_completes_job_with_global_indices(self, queue, review_service):
+        """Chunk results are re-indexed job-wide and progress is counted."""
+        images = [f"img{i}" for i in range(6)] + ["bad"]
+        job = await queue.create_job("review", images, {"include_registration": False})
+        worker = JobWorker(queue=queue, review_service=review_service)
+
+        await _drain(queue, worker)
+
+        status = await queue.get_job(job["job_id"])
+        assert status["status"] == "completed"
+        assert status["processed"] == 7
+        assert status["successful"] == 6
+        assert status["failed"] == 1
+        review_service.review_batch.assert_any_await(["img0", "img1", "img2"], include_registration=False)
+
+        results = await queue.get_results(job["job_id"], offset=2, limit=4)
+        assert [r["index"] for r in results] == [2, 3, 4, 5]
+        assert (await queue.get_results(job["job_id"], offset=6, limit=10))[0]["success"] is False
+
+    async def test_failed_chunk_marks_images_failed(self, queue, review_service):
+        """A chunk that raises is recorded as failed instead of stalling the job."""
+        review_service.review_batch.side_effect = RuntimeError("executor down")
+        job = await queue.create_job("review", ["a", "b"], {})
+        worker = JobWorker(queue=queue, review_service=review_service)
+
+        await _drain(queue, worker)
+
+        status = await queue.get_job(job["job_id"])
+        assert status["status"] == "completed"
+        assert status["failed"] == 2
+
+    async def test_lease_is_extended_while_reviewing(self, review_service):
+        """A chunk reviewed for longer than the visibility timeout is not requeued."""
+        queue = MemoryJobQueue(chunk_size=3, visibility_timeout=0.06)
+        job = await queue.create_job("review", ["img0"], {})
+
+        async def slow_review(images, **params):
+            await asyncio.sleep(0.2)
+            assert await queue.requeue_stale() == 0
+            return _review_results(images)
+
+        review_service.review_batch.side_effect = slow_review
+        worker = JobWorker(queue=queue, review_service=review_service)
+        await worker.process_chunk(await queue.next_chunk(timeout=0.01))
+
+        assert (await queue.get_job(job["job_id"]))["status"] == "completed"
+
+    async def test_background_worker(self, queue, review_service):
+        """Started workers pick up chunks until stopped."""
+        worker = JobWorker(queue=queue, review_service=review_service, concurrency=2)
+        worker.start()
+        try:
+            job = await queue.create_job("review", [f"img{i}" for i in range(9)], {})
+            for _ in range(100):
+                if (await queue.get_job(job["job_id"]))["status"] == "completed":
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.stop()
+
+        assert (await queue.get_job(job["job_id"]))["processed"] == 9
+
+
+class TestJobsAPI:
+    """Tests for the /jobs endpoints."""
+
+    @pytest.fixture
+    async def client(self, queue):
+        from app.api.routes import jobs
+
+        app = FastAPI()
+        app.include_router(jobs.router)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+
+    async def test_submit_poll_and_page(self, client, queue, review_service):
+        """A submitted job can be polled and its results paged."""
+        response = await client.post(
+            "/jobs/review?include_airline=false",
+            json={"images": [f"img{i}" for i in range(5)]}
+        )
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+        assert job["total"] == 5
+        assert job["progress"] == 0.0
+
+        await _drain(queue, JobWorker(queue=queue, review_service=review_service))
+        assert review_service.review_batch.await_args.kwargs["include_airline"] is False
+
+        status = (await client.get(f"/jobs/{job['job_id']}")).json()
+        assert status["status"] == "completed"
+        assert status["progress"] == 1.0
+
+        page = (await client.get(f"/jobs/{job['job_id']}/results?offset=0&limit=4")).json()
+        assert [r["index"] for r in page["results"]] == [0, 1, 2, 3]
+        assert page["next_offset"] == 4
+
+    async def test_unknown_job(self, client):
+        """Unknown job IDs return 404."""
+        assert (await client.get("/jobs/missing")).status_code == 404
+        assert (await client.get("/jobs/missing/results")).status_code == 404
+
+    async def test_too_many_images(self, client, monkeypatch):
+        """Jobs are limited to job_max_images."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "job_max_images", 2)
+        response = await client.post("/jobs/review", json={"images": ["a", "b", "c"]})
+        assert response.status_code == 422
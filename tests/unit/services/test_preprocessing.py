@@ -0,0 +1,77 @@
+"""
+Unit tests for the shared preprocessing stage.
+"""
+
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
+
+from app.services.preprocessing import InputGeometry, PreparedImage, prepare_images
+
+
+class TestPreparedImage:
+    """Tests for PreparedImage."""
+
+    def test_rgb_converted_once(self):
+        """Colour conversion runs once and is shared."""
+        prepared = PreparedImage(Image.new("L", (100, 50)))
+        assert prepared.rgb.mode == "RGB"
+        assert prepared.rgb is prepared.rgb
+
+    def test_exif_orientation_applied(self):
+        """EXIF orientation is applied before any model sees the image."""
+        image = Image.new("RGB", (100, 50))
+        exif = image.getexif()
+        exif[0x0112] = 6  # Rotate 90 CW
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", exif=exif)
+        image = Image.open(buffer)
+
+        assert PreparedImage(image).rgb.size == (50, 100)
+
+    def test_shorter_side_resize(self):
+        """Without letterbox the shorter side is scaled to the target size."""
+        prepared = PreparedImage(Image.new("RGB", (2000, 1000)))
+        assert prepared.resized(InputGeometry(640)).size == (1280, 640)
+
+    def test_letterbox_resize(self):
+        """Letterboxing fits the image in a padded square."""
+        prepared = PreparedImage(Image.new("RGB", (2000, 1000), (255, 0, 0)))
+        resized = prepared.resized(InputGeometry(640, letterbox=True))
+        assert resized.size == (640, 640)
+        assert resized.getpixel((320, 0)) == (114, 114, 114)
+        assert resized.getpixel((320, 320)) == (255, 0, 0)
+
+    def test_small_images_not_upscaled(self):
+        """Images smaller than the target are not upscaled."""
+        prepared = PreparedImage(Image.new("RGB", (200, 100)))
+        assert prepared.resized(InputGeometry(640)).size == (200, 100)
+        assert prepared.resized(InputGeometry(640, letterbox=True)).size == (640, 640)
+
+    def test_models_with_same_geometry_share_input(self):
+        """Models consuming the same geometry share one resized image."""
+        settings = MagicMock(classifier_image_size=64, classifier_letterbox=False)
+        prepared = PreparedImage(Image.new("RGB", (400, 200)))
+
+        with patch("app.services.preprocessing.get_settings", return_value=settings):
+            inputs = prepared.prepare(["quality", "aircraft", "airline", "registration"])
+
+        assert inputs["aircraft"] is inputs["airline"]
+        assert inputs["aircraft"].size == (128, 64)
+        assert inputs["quality"] is inputs["registration"] is prepared.rgb
+        assert inputs["quality"].size == (400, 200)
+
+
+class TestPrepareImages:
+    """Tests for prepare_images."""
+
+    def test_index_aligned_with_failed_loads(self):
+        """Failed loads stay None in every model's input list."""
+        images = [Image.new("RGB", (10, 10)), None, Image.new("RGB", (20, 20))]
+
+        inputs = prepare_images(images, ["quality", "aircraft"])
+
+        assert [img is None for img in inputs["quality"]] == [False, True, False]
+        assert [img is None for img in inputs["aircraft"]] == [False, True, False]
+
@@ -0,0 +1,75 @@
+"""
+Unit tests for QualityService batch assessment.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.inference.executors import shutdown_executors
+from app.services.quality_service import QualityService
+
+
+def _raw_result(score: float) -> dict:
+    """Raw assessor output."""
+    return {
+        "pass": score >= 0.6,
+        "score": score,
+        "details": {"sharpness": score, "exposure": score, "composition": score, "noise": score, "color": score},
+    }
+
+
+@pytest.fixture
+def service():
+    """Quality service with a slow stub assessor scoring by image width."""
+    assessor = MagicMock()
+
+    def assess(image):
+        time.sleep(0.05)
+        if image.width == 13:
+            raise ValueError("bad image")
+        return _raw_result(image.width / 100)
+
+    assessor.assess.side_effect = assess
+    service = QualityService()
+    service._assessor = assessor
+    yield service
+    shutdown_executors()
+
+
+def _settings(mode: str) -> MagicMock:
+    return MagicMock(quality_batch_mode=mode, batch_pool_workers={"quality": 4})
+
+
+class TestAssessBatch:
+    """Tests for QualityService._assess_batch."""
+
+    @pytest.mark.parametrize("mode", ["serial", "threads"])
+    def test_results_index_aligned(self, service, mode):
+        """Results stay aligned with inputs; failures and missing images are None."""
+        images = [Image.new("RGB", (70, 10)), None, Image.new("RGB", (13, 10)), Image.new("RGB", (40, 10))]
+
+        with patch("app.services.quality_service.get_settings", return_value=_settings(mode)), \
+                patch("app.inference.executors.get_settings", return_value=_settings(mode)):
+            results = service._assess_batch(images)
+
+        assert results[0].score == 0.7
+        assert results[1] is None
+        assert results[2] is None
+        assert results[3].score == 0.4
+
+    def test_threads_mode_runs_in_parallel(self, service):
+        """Fanning out over the batch pool beats serial assessment."""
+        images = [Image.new("RGB", (50, 10)) for _ in range(8)]
+
+        with patch("app.services.quality_service.get_settings", return_value=_settings("threads")), \
+                patch("app.inference.executors.get_settings", return_value=_settings("threads")):
+            start = time.perf_counter()
+            results = service._assess_batch(images)
+            elapsed = time.perf_counter() - start
+
+        assert all(r is not None for r in results)
+        # Serial assessment would take 8 * 50ms
+        assert elapsed < 0.3
@@ -0,0 +1,124 @@
+"""
+Unit tests for RegistrationService batch OCR.
+"""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.inference.executors import shutdown_executors
+from app.services.registration_service import RegistrationService
+
+
+class StubOCR:
+    """Local stand-in for an OCR backend with per-call latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def recognize(self, image):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if image.width == 13:
+                raise RuntimeError("OCR failed")
+            return {
+                "registration": f"B-{image.width:04d}",
+                "confidence": 0.9,
+                "raw_text": f"B-{image.width:04d}",
+                "all_matches": [],
+                "yolo_boxes": [],
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _settings(ocr_mode: str, parallel: bool = True) -> MagicMock:
+    return MagicMock(
+        ocr_mode=ocr_mode,
+        ocr_batch_parallel=parallel,
+        batch_pool_workers={"registration": 2, "registration_remote": 8},
+    )
+
+
+@pytest.fixture
+def stub_ocr():
+    return StubOCR(latency=0.05)
+
+
+@pytest.fixture
+def service(stub_ocr):
+    service = RegistrationService()
+    service._ocr = stub_ocr
+    yield service
+    shutdown_executors()
+
+
+def _run_batch(service, images, settings):
+    with patch("app.services.registration_service.get_settings", return_value=settings), \
+            patch("app.inference.executors.get_settings", return_value=settings):
+        start = time.perf_counter()
+        results = service._recognize_batch(images)
+        return results, time.perf_counter() - start
+
+
+class TestRecognizeBatch:
+    """Tests for RegistrationService._recognize_batch."""
+
+    def test_results_index_aligned_with_failures(self, service):
+        """Failed loads and failed OCR calls are None at their index."""
+        images = [Image.new("RGB", (100, 10)), None, Image.new("RGB", (13, 10)), Image.new("RGB", (200, 10))]
+
+        results, _ = _run_batch(service, images, _settings("local"))
+
+        assert results[0].registration == "B-0100"
+        assert results[1] is None
+        assert results[2] is None
+        assert results[3].registration == "B-0200"
+
+    def test_remote_mode_issues_calls_concurrently(self, service, stub_ocr):
+        """Remote VLM calls overlap up to the remote in-flight limit."""
+        images = [Image.new("RGB", (100 + i, 10)) for i in range(16)]
+
+        results, elapsed = _run_batch(service, images, _settings("qwen"))
+
+        assert all(r is not None for r in results)
+        assert stub_ocr.max_in_flight == 8
+        # Sequential calls would take 16 * 50ms
+        assert elapsed < 0.4
+
+    def test_local_mode_bounded_by_local_pool(self, service, stub_ocr):
+        """Local OCR runs on the smaller local pool."""
+        images = [Image.new("RGB", (100 + i, 10)) for i in range(6)]
+
+        _run_batch(service, images, _settings("local"))
+
+        assert stub_ocr.max_in_flight == 2
+
+    @patch.dict(os.environ, {"DASHSCOPE_API_KEY": "test_key"})
+    def test_auto_mode_with_api_key_is_remote(self, service, stub_ocr):
+        """Auto mode uses the remote limit when the VLM is configured."""
+        images = [Image.new("RGB", (100 + i, 10)) for i in range(8)]
+
+        _run_batch(service, images, _settings("auto"))
+
+        assert stub_ocr.max_in_flight > 2
+
+    def test_sequential_when_disabled(self, service, stub_ocr):
+        """Disabling ocr_batch_parallel restores sequential recognition."""
+        images = [Image.new("RGB", (100 + i, 10)) for i in range(3)]
+
+        results, _ = _run_batch(service, images, _settings("qwen", parallel=False))
+
+        assert all(r is not None for r in results)
+        assert stub_ocr.max_in_flight == 1
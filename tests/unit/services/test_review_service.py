@@ -482,3 +482,117 @@ class TestReviewServiceConcurrentBatchInference:
                         assert len(results) == 3
                         # Results might have errors but should not crash
 
+    @pytest.mark.asyncio
+    async def test_review_batch_propagates_rate_limit(self, test_images_batch, sample_batch_results):
+        """A saturated executor rejects the batch instead of filling in placeholders."""
+        from unittest.mock import AsyncMock
+        from app.core.exceptions import RateLimitError
+
+        service = ReviewService()
+        busy = AsyncMock(side_effect=RateLimitError("aircraft executor is busy"))
+
+        with patch.object(service.quality_service, '_assess_batch', return_value=sample_batch_results['quality']):
+            with patch.object(service.aircraft_service, '_classify_batch', busy):
+                with pytest.raises(RateLimitError):
+                    await service.review_batch(
+                        test_images_batch,
+                        include_quality=True,
+                        include_aircraft=True,
+                        include_airline=False,
+                        include_registration=False
+                    )
+
+
+
+class TestReviewServiceAsync:
+    """Tests for the non-blocking single-image review."""
+
+    @pytest.fixture
+    def test_image_base64(self):
+        """Generate test image as base64 string."""
+        img = Image.new("RGB", (64, 64), color=(100, 150, 200))
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG")
+        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_review_async_runs_components_on_executors(self, test_image_base64):
+        """Each component is dispatched to its model's inference executor."""
+        service = ReviewService()
+        quality = QualityResult.model_validate({
+            "pass": True,
+            "score": 0.7,
+            "details": {"sharpness": 0.7, "exposure": 0.7, "composition": 0.7, "noise": 0.7, "color": 0.7}
+        })
+        used_executors = []
+
+        from app.inference.executors import get_inference_executor as real_get_executor
+
+        def tracking_get_executor(name):
+            used_executors.append(name)
+            return real_get_executor(name)
+
+        with patch("app.services.review_service.get_inference_executor", side_effect=tracking_get_executor):
+            with patch.object(service.quality_service, "_assess_image", return_value=(quality, 1.0)):
+                with patch.object(service.aircraft_service, "_classify_image", side_effect=RuntimeError("down")):
+                    result, timing, component_timings = await service.review_async(
+                        test_image_base64,
+                        include_airline=False,
+                        include_registration=False,
+                        concurrent=False
+                    )
+
+        assert used_executors == ["quality", "aircraft"]
+        assert result.quality.score == 0.7
+        assert result.aircraft.type_code == "UNKNOWN"
+        assert result.airline is None
+        assert timing >= 0
+        assert set(component_timings) == {"quality", "aircraft"}
+
+    @pytest.mark.asyncio
+    async def test_review_async_concurrent_fan_out(self, test_image_base64):
+        """In concurrent mode latency is close to the slowest component, not the sum."""
+        import time as time_module
+
+        service = ReviewService()
+        quality = QualityResult.model_validate({
+            "pass": True,
+            "score": 0.7,
+            "details": {"sharpness": 0.7, "exposure": 0.7, "composition": 0.7, "noise": 0.7, "color": 0.7}
+        })
+        aircraft = AircraftResult.model_validate({
+            "top1": {"class": "A320", "confidence": 0.9},
+            "top_k": 1,
+            "predictions": [{"class": "A320", "confidence": 0.9}]
+        })
+        airline = AirlineResult.model_validate({
+            "top1": {"class": "CA", "confidence": 0.8},
+            "top_k": 1,
+            "predictions": [{"class": "CA", "confidence": 0.8}]
+        })
+        registration = RegistrationResult.model_validate({
+            "registration": "B-1234",
+            "confidence": 0.9,
+            "raw_text": "B-1234",
+            "all_matches": [],
+            "yolo_boxes": []
+        })
+
+        def slow(value, delay):
+            def run(image):
+                time_module.sleep(delay)
+                return value, delay * 1000
+            return run
+
+        with patch.object(service.quality_service, "_assess_image", side_effect=slow(quality, 0.1)), \
+                patch.object(service.aircraft_service, "_classify_image", side_effect=slow(aircraft, 0.1)), \
+                patch.object(service.airline_service, "_classify_image", side_effect=slow(airline, 0.1)), \
+                patch.object(service.registration_service, "_recognize_image", side_effect=slow(registration, 0.2)):
+            result, timing, component_timings = await service.review_async(test_image_base64, concurrent=True)
+
+        assert result.registration.registration == "B-1234"
+        assert result.airline.airline_code == "CA"
+        assert set(component_timings) == {"quality", "aircraft", "airline", "registration"}
+        assert component_timings["registration"] >= 200
+        # Sequential execution would take at least 500 ms
+        assert timing < 450
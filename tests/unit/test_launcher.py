@@ -0,0 +1,72 @@
+"""
+Unit tests for the server launcher.
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import launcher
+from app.core.config import Settings
+from app.launcher import PreforkSupervisor, fork_safe_models
+
+
+def test_fork_safe_models():
+    """ONNX-backed classifiers are loaded in the workers, not before fork."""
+    assert fork_safe_models(Settings(inference_backend="torch")) == ["aircraft", "airline", "registration", "quality"]
+    assert fork_safe_models(Settings(inference_backend="onnx")) == ["registration", "quality"]
+
+
+@pytest.mark.parametrize(("prefork", "reload", "expected"), [
+    (True, False, "run_prefork"),
+    (False, False, "run_uvicorn"),
+    (True, True, "run_uvicorn"),
+])
+def test_main_selects_mode(prefork, reload, expected):
+    """Prefork is used when enabled, except with auto-reload."""
+    settings = Settings(prefork=prefork, reload=reload)
+    with patch.object(launcher, "get_settings", return_value=settings), \
+            patch.object(launcher, "run_prefork") as run_prefork, \
+            patch.object(launcher, "run_uvicorn") as run_uvicorn:
+        launcher.main()
+
+    called = {"run_prefork": run_prefork, "run_uvicorn": run_uvicorn}
+    called[expected].assert_called_once_with(settings)
+    assert sum(mock.called for mock in called.values()) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+def test_supervisor_forks_workers_sharing_master_state(tmp_path):
+    """Workers run in forked children that see the master's loaded state."""
+    loaded = {"model": "weights-loaded-in-master"}
+
+    def target():
+        (tmp_path / str(os.getpid())).write_text(loaded["model"])
+
+    supervisor = PreforkSupervisor(target, workers=3)
+    supervisor.run()
+
+    outputs = list(tmp_path.iterdir())
+    assert len(outputs) == 3
+    assert {p.read_text() for p in outputs} == {"weights-loaded-in-master"}
+    assert str(os.getpid()) not in {p.name for p in outputs}
+    assert supervisor.children == {}
+
+
+def test_preload_for_fork_freezes_registered_models():
+    """Models are preloaded, frozen and moved out of the collector's reach."""
+    entry = MagicMock()
+    registry = MagicMock()
+    registry.entries.return_value = [entry]
+
+    with patch("app.inference.InferenceFactory.preload_models") as preload, \
+            patch.object(launcher, "get_model_registry", return_value=registry), \
+            patch.object(launcher, "freeze_model") as freeze, \
+            patch.object(launcher, "_import_torch", return_value=None), \
+            patch.object(launcher.gc, "freeze") as gc_freeze:
+        assert launcher.preload_for_fork(Settings(inference_backend="torch")) is None
+
+    preload.assert_called_once_with(["aircraft", "airline", "registration", "quality"])
+    freeze.assert_called_once_with(entry.instance)
+    gc_freeze.assert_called_once()